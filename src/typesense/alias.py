@@ -36,6 +36,8 @@ class Alias(object):
         name (str): The name of the alias.
     """
 
+    __slots__ = ("api_call", "name")
+
     def __init__(self, api_call: ApiCall, name: str):
         """
         Initialize the Alias object.
@@ -29,6 +29,7 @@ import sys
 
 from typesense.alias import Alias
 from typesense.api_call import ApiCall
+from typesense.handle_cache import HandleCache
 from typesense.types.alias import AliasCreateSchema, AliasesResponseSchema, AliasSchema
 
 if sys.version_info >= (3, 11):
@@ -47,7 +48,7 @@ class Aliases:
     Attributes:
         RESOURCE_PATH (str): The API resource path for alias operations.
         api_call (ApiCall): The API call object for making requests.
-        aliases (Dict[str, Alias]): A dictionary of Alias objects.
+        aliases (HandleCache[str, Alias]): A bounded cache of Alias objects.
     """
 
     resource_path: typing.Final[str] = "/aliases"
@@ -60,7 +61,9 @@ class Aliases:
             api_call (ApiCall): The API call object for making requests.
         """
         self.api_call = api_call
-        self.aliases: typing.Dict[str, Alias] = {}
+        self.aliases: HandleCache[str, Alias] = HandleCache(
+            api_call.config.handle_cache_size,
+        )
 
     def __getitem__(self, name: str) -> Alias:
         """
@@ -72,9 +75,10 @@ class Aliases:
         Returns:
             Alias: The Alias object for the given name.
         """
-        if not self.aliases.get(name):
-            self.aliases[name] = Alias(self.api_call, name)
-        return self.aliases.get(name)
+        return self.aliases.get_or_create(
+            name,
+            lambda: Alias(self.api_call, name),
+        )
 
     def upsert(self, name: str, mapping: AliasCreateSchema) -> AliasSchema:
         """
@@ -5,6 +5,8 @@ from typesense.types.analytics import AnalyticsRuleSchema
 
 
 class AnalyticsRule:
+    __slots__ = ("api_call", "rule_name")
+
     def __init__(self, api_call: ApiCall, rule_name: str) -> None:
         self.api_call = api_call
         self.rule_name = rule_name
@@ -53,6 +53,8 @@ class AnalyticsRuleV1:
         rule_id (str): The ID of the analytics rule.
     """
 
+    __slots__ = ("api_call", "rule_id")
+
     @warn_deprecation(  # type: ignore[misc]
         "AnalyticsRuleV1 is deprecated on v30+. Use client.analytics.rules[rule_id] instead.",
         flag_name="analytics_rules_v1_deprecation",
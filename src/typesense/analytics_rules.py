@@ -9,6 +9,7 @@ else:
 
 from typesense.analytics_rule import AnalyticsRule
 from typesense.api_call import ApiCall
+from typesense.handle_cache import HandleCache
 from typesense.types.analytics import (
     AnalyticsRuleCreate,
     AnalyticsRuleSchema,
@@ -21,12 +22,15 @@ class AnalyticsRules(object):
 
     def __init__(self, api_call: ApiCall) -> None:
         self.api_call = api_call
-        self.rules: typing.Dict[str, AnalyticsRuleSchema] = {}
+        self.rules: HandleCache[str, AnalyticsRuleSchema] = HandleCache(
+            api_call.config.handle_cache_size,
+        )
 
     def __getitem__(self, rule_name: str) -> AnalyticsRuleSchema:
-        if rule_name not in self.rules:
-            self.rules[rule_name] = AnalyticsRule(self.api_call, rule_name)
-        return self.rules[rule_name]
+        return self.rules.get_or_create(
+            rule_name,
+            lambda: AnalyticsRule(self.api_call, rule_name),
+        )
 
     def create(self, rule: AnalyticsRuleCreate) -> AnalyticsRuleSchema:
         response: AnalyticsRuleSchema = self.api_call.post(
@@ -36,6 +36,7 @@ else:
 
 from typesense.analytics_rule_v1 import AnalyticsRuleV1
 from typesense.api_call import ApiCall
+from typesense.handle_cache import HandleCache
 from typesense.types.analytics_rule_v1 import (
     RuleCreateSchemaForCounters,
     RuleCreateSchemaForQueries,
@@ -60,7 +61,8 @@ class AnalyticsRulesV1(object):
     Attributes:
         resource_path (str): The API resource path for analytics rules.
         api_call (ApiCall): The API call object for making requests.
-        rules (Dict[str, AnalyticsRuleV1]): A dictionary of AnalyticsRuleV1 objects.
+        rules (HandleCache[str, AnalyticsRuleV1]):
+            A bounded cache of AnalyticsRuleV1 objects.
     """
 
     resource_path: typing.Final[str] = "/analytics/rules"
@@ -77,7 +79,9 @@ class AnalyticsRulesV1(object):
             api_call (ApiCall): The API call object for making requests.
         """
         self.api_call = api_call
-        self.rules: typing.Dict[str, AnalyticsRuleV1] = {}
+        self.rules: HandleCache[str, AnalyticsRuleV1] = HandleCache(
+            api_call.config.handle_cache_size,
+        )
 
     def __getitem__(self, rule_id: str) -> AnalyticsRuleV1:
         """
@@ -89,9 +93,10 @@ class AnalyticsRulesV1(object):
         Returns:
             AnalyticsRuleV1: The AnalyticsRuleV1 object for the given ID.
         """
-        if not self.rules.get(rule_id):
-            self.rules[rule_id] = AnalyticsRuleV1(self.api_call, rule_id)
-        return self.rules[rule_id]
+        return self.rules.get_or_create(
+            rule_id,
+            lambda: AnalyticsRuleV1(self.api_call, rule_id),
+        )
 
     def create(
         self,
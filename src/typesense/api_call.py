@@ -7,7 +7,15 @@ to the Typesense API, handling retries, and managing node health.
 Key features:
 - Support for GET, POST, PUT, PATCH, and DELETE HTTP methods
 - Automatic retries on server errors
+- End-to-end request deadlines shared across retry attempts
+- Optional adaptive concurrency limiting driven by 503 responses and latency
+- Optional per-class request lanes isolating interactive, bulk and admin traffic
 - Node health management
+- Optional leader-aware routing of writes
+- Optional nearest node selection by probing node latencies in the background
+- Optional cache-affinity routing of identical searches to the same node
+- Fresh connection pools and node state in processes created with os.fork
+- Connection warm-up to avoid handshake latency on the first requests
 - Type-safe request execution with overloaded methods
 
 Classes:
@@ -15,10 +23,13 @@ Classes:
 
 Dependencies:
     - requests: For making HTTP requests
+    - typesense.concurrency_limiter: Provides the AdaptiveConcurrencyLimiter class
     - typesense.configuration: Provides Configuration and Node classes
     - typesense.exceptions: Custom exception classes
     - typesense.node_manager: Provides NodeManager class
+    - typesense.preprocess: Provides the SearchCanonicalizer class
     - typesense.request_handler: Provides RequestHandler class
+    - typesense.request_lanes: Provides the RequestLane class and request classification
 
 Usage:
     from typesense.configuration import Configuration
@@ -32,19 +43,38 @@ Note: This module is part of the Typesense Python client library and is used int
 by other components of the library.
 """
 
+import contextlib
+import json
+import math
+import os
 import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
-from typesense.configuration import Configuration, Node
+from typesense.concurrency_limiter import AdaptiveConcurrencyLimiter
+from typesense.configuration import Configuration, Node, RequestClass
 from typesense.exceptions import (
     HTTPStatus0Error,
+    InvalidParameter,
     ServerError,
     ServiceUnavailable,
+    Timeout,
     TypesenseClientError,
 )
+from typesense.logger import logger
 from typesense.node_manager import NodeManager
-from typesense.request_handler import RequestHandler, SessionFunctionKwargs
+from typesense.preprocess import SearchCanonicalizer
+from typesense.request_handler import (
+    RawResponse,
+    RequestHandler,
+    SessionFunctionKwargs,
+)
+from typesense.request_lanes import RequestLane, classify_request
+from typesense.types.debug import DebugResponseSchema
 
 if sys.version_info >= (3, 11):
     import typing
@@ -52,6 +82,7 @@ else:
     import typing_extensions as typing
 
 session = requests.sessions.Session()
+_api_calls: "weakref.WeakSet[ApiCall]" = weakref.WeakSet()
 TParams = typing.TypeVar("TParams")
 TBody = typing.TypeVar("TBody")
 TEntityDict = typing.TypeVar("TEntityDict")
@@ -80,6 +111,13 @@ _SERVER_ERRORS: typing.Final[
 )
 
 
+_LEADER_STATE: typing.Final[int] = 1
+_SEARCH_ENDPOINT_SUFFIX: typing.Final[str] = "/documents/search"
+_MULTI_SEARCH_ENDPOINT: typing.Final[str] = "/multi_search"
+_OPERATIONS_ENDPOINT_PREFIX: typing.Final[str] = "/operations/"
+_MAX_PROBE_WORKERS: typing.Final[int] = 32
+
+
 class ApiCall:
     """
     Manages API calls to the Typesense server.
@@ -91,6 +129,15 @@ class ApiCall:
         config (Configuration): The configuration object for the Typesense client.
         node_manager (NodeManager): Manages the nodes in the Typesense cluster.
         request_handler (RequestHandler): Handles the execution of individual requests.
+        request_lanes (Dict[RequestClass, RequestLane]): The dedicated lanes of the
+            configured request classes.
+        concurrency_limiter (AdaptiveConcurrencyLimiter | None): Bounds the number of
+            in-flight requests without a lane, if adaptive concurrency is configured.
+        lane_concurrency_limiters (Dict[RequestClass, AdaptiveConcurrencyLimiter]):
+            The limiters of the lanes, so that bulk requests overloading the cluster
+            never use up the limit of interactive ones.
+        search_canonicalizer (SearchCanonicalizer | None): Canonicalizes search
+            parameters and tracks their cache keys, if enabled.
     """
 
     def __init__(self, config: Configuration):
@@ -103,6 +150,57 @@ class ApiCall:
         self.config = config
         self.node_manager = NodeManager(config)
         self.request_handler = RequestHandler(config)
+        self.request_lanes: typing.Dict[RequestClass, RequestLane] = {
+            request_class: RequestLane.from_config(
+                lane_config,
+                config.connection_timeout_seconds,
+            )
+            for request_class, lane_config in config.request_classes.items()
+        }
+        self.concurrency_limiter: typing.Union[AdaptiveConcurrencyLimiter, None] = None
+        self.lane_concurrency_limiters: typing.Dict[
+            RequestClass,
+            AdaptiveConcurrencyLimiter,
+        ] = {}
+        self._reset_concurrency_limiters()
+        self.search_canonicalizer: typing.Union[SearchCanonicalizer, None] = (
+            SearchCanonicalizer() if config.canonicalize_searches else None
+        )
+        self._latency_probe_lock = threading.Lock()
+        self._latency_probe_thread: typing.Union[threading.Thread, None] = None
+        _api_calls.add(self)
+        if config.auto_nearest_node:
+            self.probe_node_latencies()
+
+    def reset_after_fork(self) -> None:
+        """
+        Rebuild the connection pools and node state inherited from a parent process.
+
+        This runs automatically in children created with `os.fork`, e.g. by
+        pre-forking servers that load the application before forking workers, so
+        that workers never share sockets or locks with their parent.
+        """
+        for lane in self.request_lanes.values():
+            lane.reset()
+        self.node_manager = NodeManager(self.config)
+        self._reset_concurrency_limiters()
+        self._latency_probe_lock = threading.Lock()
+        self._latency_probe_thread = None
+        if self.search_canonicalizer is not None:
+            self.search_canonicalizer.reset_after_fork()
+
+    def _reset_concurrency_limiters(self) -> None:
+        """Create the shared and per-lane limiters, if adaptive concurrency is on."""
+        limiter_config = self.config.adaptive_concurrency
+        if limiter_config is None:
+            return
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter.from_config(
+            limiter_config,
+        )
+        self.lane_concurrency_limiters = {
+            request_class: AdaptiveConcurrencyLimiter.from_config(limiter_config)
+            for request_class in self.request_lanes
+        }
 
     @typing.overload
     def get(
@@ -111,6 +209,8 @@ class ApiCall:
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Literal[False],
         params: typing.Union[TParams, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: typing.Literal[False] = False,
     ) -> str:
         """
         Execute a GET request to the Typesense API.
@@ -120,6 +220,8 @@ class ApiCall:
             entity_type (Type[TEntityDict]): The expected type of the response entity.
             as_json (False): Whether to return the response as JSON. Defaults to True.
             params (Union[TParams, None], optional): Query parameters for the request.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for the request, overriding the configured deadline_seconds.
 
         Returns:
             str: The response, as a string.
@@ -132,6 +234,8 @@ class ApiCall:
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Literal[True],
         params: typing.Union[TParams, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: typing.Literal[False] = False,
     ) -> TEntityDict:
         """
         Execute a GET request to the Typesense API.
@@ -141,18 +245,49 @@ class ApiCall:
             entity_type (Type[TEntityDict]): The expected type of the response entity.
             as_json (True): Whether to return the response as JSON. Defaults to True.
             params (Union[TParams, None], optional): Query parameters for the request.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for the request, overriding the configured deadline_seconds.
 
         Returns:
             EntityDict: The response, as a JSON object.
         """
 
+    @typing.overload
+    def get(
+        self,
+        endpoint: str,
+        entity_type: typing.Type[TEntityDict],
+        as_json: bool = True,
+        params: typing.Union[TParams, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+        *,
+        raw: typing.Literal[True],
+    ) -> RawResponse:
+        """
+        Execute a GET request to the Typesense API.
+
+        Args:
+            endpoint (str): The API endpoint to call.
+            entity_type (Type[TEntityDict]): The expected type of the response entity.
+            as_json (bool): Ignored for raw responses.
+            params (Union[TParams, None], optional): Query parameters for the request.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for the request, overriding the configured deadline_seconds.
+            raw (True): Whether to return the undecoded response body.
+
+        Returns:
+            RawResponse: The undecoded response body and content type.
+        """
+
     def get(
         self,
         endpoint: str,
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Union[typing.Literal[True], typing.Literal[False]] = True,
         params: typing.Union[TParams, None] = None,
-    ) -> typing.Union[TEntityDict, str]:
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: bool = False,
+    ) -> typing.Union[TEntityDict, str, RawResponse]:
         """
         Execute a GET request to the Typesense API.
 
@@ -161,16 +296,25 @@ class ApiCall:
             entity_type (Type[TEntityDict]): The expected type of the response entity.
             as_json (bool): Whether to return the response as JSON. Defaults to True.
             params (Union[TParams, None], optional): Query parameters for the request.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for the request, overriding the configured deadline_seconds.
+            raw (bool): Whether to return the undecoded response body and content
+                type instead. Defaults to False.
 
         Returns:
-            Union[TEntityDict, str]: The response, either as a JSON object or a string.
+            Union[TEntityDict, str, RawResponse]: The response, either as a JSON
+                object, a string or the undecoded body.
         """
+        request_class = classify_request("GET", endpoint)
         return self._execute_request(
-            session.get,
+            self._session(request_class).get,
             endpoint,
             entity_type,
             as_json,
             params=params,
+            deadline=self._compute_deadline(deadline_seconds),
+            request_class=request_class,
+            raw=raw,
         )
 
     @typing.overload
@@ -181,6 +325,8 @@ class ApiCall:
         as_json: typing.Literal[False],
         params: typing.Union[TParams, None] = None,
         body: typing.Union[TBody, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: typing.Literal[False] = False,
     ) -> str:
         """
         Execute a GET request to the Typesense API.
@@ -190,6 +336,8 @@ class ApiCall:
             entity_type (Type[TEntityDict]): The expected type of the response entity.
             as_json (False): Whether to return the response as JSON. Defaults to True.
             params (Union[TParams, None], optional): Query parameters for the request.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for the request, overriding the configured deadline_seconds.
 
         Returns:
             str: The response, as a string.
@@ -203,6 +351,8 @@ class ApiCall:
         as_json: typing.Literal[True],
         params: typing.Union[TParams, None] = None,
         body: typing.Union[TBody, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: typing.Literal[False] = False,
     ) -> TEntityDict:
         """
         Execute a POST request to the Typesense API.
@@ -212,11 +362,41 @@ class ApiCall:
             entity_type (Type[TEntityDict]): The expected type of the response entity.
             as_json (True): Whether to return the response as JSON. Defaults to True.
             params (Union[TParams, None], optional): Query parameters for the request.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for the request, overriding the configured deadline_seconds.
 
         Returns:
             EntityDict: The response, as a JSON object.
         """
 
+    @typing.overload
+    def post(
+        self,
+        endpoint: str,
+        entity_type: typing.Type[TEntityDict],
+        as_json: bool = True,
+        params: typing.Union[TParams, None] = None,
+        body: typing.Union[TBody, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+        *,
+        raw: typing.Literal[True],
+    ) -> RawResponse:
+        """
+        Execute a POST request to the Typesense API.
+
+        Args:
+            endpoint (str): The API endpoint to call.
+            entity_type (Type[TEntityDict]): The expected type of the response entity.
+            as_json (bool): Ignored for raw responses.
+            params (Union[TParams, None], optional): Query parameters for the request.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for the request, overriding the configured deadline_seconds.
+            raw (True): Whether to return the undecoded response body.
+
+        Returns:
+            RawResponse: The undecoded response body and content type.
+        """
+
     def post(
         self,
         endpoint: str,
@@ -224,7 +404,9 @@ class ApiCall:
         as_json: typing.Union[typing.Literal[True], typing.Literal[False]] = True,
         params: typing.Union[TParams, None] = None,
         body: typing.Union[TBody, None] = None,
-    ) -> typing.Union[str, TEntityDict]:
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: bool = False,
+    ) -> typing.Union[str, TEntityDict, RawResponse]:
         """
         Execute a POST request to the Typesense API.
 
@@ -233,17 +415,27 @@ class ApiCall:
             entity_type (Type[TEntityDict]): The expected type of the response entity.
             as_json (bool): Whether to return the response as JSON. Defaults to True.
             params (Union[TParams, None], optional): Query parameters for the request.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for the request, overriding the configured deadline_seconds.
+            raw (bool): Whether to return the undecoded response body and content
+                type instead. Defaults to False.
 
         Returns:
-            Union[TEntityDict, str]: The response, either as a JSON object or a string.
+            Union[TEntityDict, str, RawResponse]: The response, either as a JSON
+                object, a string or the undecoded body.
         """
+        request_class = classify_request("POST", endpoint)
         return self._execute_request(
-            session.post,
+            self._session(request_class).post,
             endpoint,
             entity_type,
             as_json,
             params=params,
             data=body,
+            deadline=self._compute_deadline(deadline_seconds),
+            request_class=request_class,
+            is_write=not _is_read_post(endpoint),
+            raw=raw,
         )
 
     def put(
@@ -252,6 +444,7 @@ class ApiCall:
         entity_type: typing.Type[TEntityDict],
         body: TBody,
         params: typing.Union[TParams, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
     ) -> TEntityDict:
         """
         Execute a PUT request to the Typesense API.
@@ -260,17 +453,23 @@ class ApiCall:
             endpoint (str): The API endpoint to call.
             entity_type (Type[TEntityDict]): The expected type of the response entity.
             params (Union[TParams, None], optional): Query parameters for the request.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for the request, overriding the configured deadline_seconds.
 
         Returns:
             EntityDict: The response, as a JSON object.
         """
+        request_class = classify_request("PUT", endpoint)
         return self._execute_request(
-            session.put,
+            self._session(request_class).put,
             endpoint,
             entity_type,
             as_json=True,
             params=params,
             data=body,
+            deadline=self._compute_deadline(deadline_seconds),
+            request_class=request_class,
+            is_write=True,
         )
 
     def patch(
@@ -279,6 +478,7 @@ class ApiCall:
         entity_type: typing.Type[TEntityDict],
         body: TBody,
         params: typing.Union[TParams, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
     ) -> TEntityDict:
         """
         Execute a PATCH request to the Typesense API.
@@ -287,17 +487,23 @@ class ApiCall:
             endpoint (str): The API endpoint to call.
             entity_type (Type[TEntityDict]): The expected type of the response entity.
             params (Union[TParams, None], optional): Query parameters for the request.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for the request, overriding the configured deadline_seconds.
 
         Returns:
             EntityDict: The response, as a JSON object.
         """
+        request_class = classify_request("PATCH", endpoint)
         return self._execute_request(
-            session.patch,
+            self._session(request_class).patch,
             endpoint,
             entity_type,
             as_json=True,
             params=params,
             data=body,
+            deadline=self._compute_deadline(deadline_seconds),
+            request_class=request_class,
+            is_write=True,
         )
 
     def delete(
@@ -305,6 +511,7 @@ class ApiCall:
         endpoint: str,
         entity_type: typing.Type[TEntityDict],
         params: typing.Union[TParams, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
     ) -> TEntityDict:
         """
         Execute a DELETE request to the Typesense API.
@@ -313,16 +520,22 @@ class ApiCall:
             endpoint (str): The API endpoint to call.
             entity_type (Type[TEntityDict]): The expected type of the response entity.
             params (Union[TParams, None], optional): Query parameters for the request.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for the request, overriding the configured deadline_seconds.
 
         Returns:
             EntityDict: The response, as a JSON object.
         """
+        request_class = classify_request("DELETE", endpoint)
         return self._execute_request(
-            session.delete,
+            self._session(request_class).delete,
             endpoint,
             entity_type,
             as_json=True,
             params=params,
+            deadline=self._compute_deadline(deadline_seconds),
+            request_class=request_class,
+            is_write=True,
         )
 
     @typing.overload
@@ -334,6 +547,10 @@ class ApiCall:
         as_json: typing.Literal[True],
         last_exception: typing.Union[None, Exception] = None,
         num_retries: int = 0,
+        deadline: typing.Union[float, None] = None,
+        request_class: typing.Union[RequestClass, None] = None,
+        is_write: bool = False,
+        raw: typing.Literal[False] = False,
         **kwargs: SessionFunctionKwargs[TParams, TBody],
     ) -> TEntityDict:
         """
@@ -355,6 +572,15 @@ class ApiCall:
 
             num_retries (int): The current number of retries attempted.
 
+            deadline (Union[float, None], optional): The monotonic timestamp by which
+                the request, including retries, must complete.
+
+            request_class (Union[RequestClass, None], optional): The request class,
+                selecting the lane the request is sent through.
+
+            is_write (bool): Whether the request writes data, routing it to the
+                leader when leader-aware writes are enabled.
+
             kwargs: Additional keyword arguments for the request.
 
         Returns:
@@ -362,6 +588,7 @@ class ApiCall:
 
         Raises:
             TypesenseClientError: If all nodes are unhealthy or max retries are exceeded.
+            Timeout: If the deadline expires before the request completes.
         """
 
     @typing.overload
@@ -373,6 +600,10 @@ class ApiCall:
         as_json: typing.Literal[False],
         last_exception: typing.Union[None, Exception] = None,
         num_retries: int = 0,
+        deadline: typing.Union[float, None] = None,
+        request_class: typing.Union[RequestClass, None] = None,
+        is_write: bool = False,
+        raw: typing.Literal[False] = False,
         **kwargs: SessionFunctionKwargs[TParams, TBody],
     ) -> str:
         """
@@ -394,6 +625,15 @@ class ApiCall:
 
             num_retries (int): The current number of retries attempted.
 
+            deadline (Union[float, None], optional): The monotonic timestamp by which
+                the request, including retries, must complete.
+
+            request_class (Union[RequestClass, None], optional): The request class,
+                selecting the lane the request is sent through.
+
+            is_write (bool): Whether the request writes data, routing it to the
+                leader when leader-aware writes are enabled.
+
             kwargs: Additional keyword arguments for the request.
 
         Returns:
@@ -401,6 +641,122 @@ class ApiCall:
 
         Raises:
             TypesenseClientError: If all nodes are unhealthy or max retries are exceeded.
+            Timeout: If the deadline expires before the request completes.
+        """
+
+    @typing.overload
+    def _execute_request(
+        self,
+        fn: typing.Callable[..., requests.models.Response],
+        endpoint: str,
+        entity_type: typing.Type[TEntityDict],
+        as_json: bool,
+        last_exception: typing.Union[None, Exception] = None,
+        num_retries: int = 0,
+        deadline: typing.Union[float, None] = None,
+        request_class: typing.Union[RequestClass, None] = None,
+        is_write: bool = False,
+        *,
+        raw: typing.Literal[True],
+        **kwargs: SessionFunctionKwargs[TParams, TBody],
+    ) -> RawResponse:
+        """
+        Execute a request to the Typesense API with retry logic.
+
+        This method handles the actual execution of the request, including
+        node selection, error handling, and retries.
+
+        Args:
+            fn (Callable): The HTTP method function to use (e.g., session.get).
+
+            endpoint (str): The API endpoint to call.
+
+            entity_type (Type[TEntityDict]): The expected type of the response entity.
+
+            as_json (bool): Ignored, as the undecoded response is returned.
+
+            last_exception (Union[None, Exception], optional): The last exception encountered.
+
+            num_retries (int): The current number of retries attempted.
+
+            deadline (Union[float, None], optional): The monotonic timestamp by which
+                the request, including retries, must complete.
+
+            request_class (Union[RequestClass, None], optional): The request class,
+                selecting the lane the request is sent through.
+
+            is_write (bool): Whether the request writes data, routing it to the
+                leader when leader-aware writes are enabled.
+
+            raw (True): Whether to return the undecoded response body and content
+                type.
+
+            kwargs: Additional keyword arguments for the request.
+
+        Returns:
+            RawResponse: The undecoded response body and its content type.
+
+        Raises:
+            TypesenseClientError: If all nodes are unhealthy or max retries are exceeded.
+            Timeout: If the deadline expires before the request completes.
+        """
+
+    @typing.overload
+    def _execute_request(
+        self,
+        fn: typing.Callable[..., requests.models.Response],
+        endpoint: str,
+        entity_type: typing.Type[TEntityDict],
+        as_json: bool,
+        last_exception: typing.Union[None, Exception] = None,
+        num_retries: int = 0,
+        deadline: typing.Union[float, None] = None,
+        request_class: typing.Union[RequestClass, None] = None,
+        is_write: bool = False,
+        *,
+        raw: bool,
+        **kwargs: SessionFunctionKwargs[TParams, TBody],
+    ) -> typing.Union[TEntityDict, str, RawResponse]:
+        """
+        Execute a request to the Typesense API with retry logic.
+
+        This method handles the actual execution of the request, including
+        node selection, error handling, and retries.
+
+        Args:
+            fn (Callable): The HTTP method function to use (e.g., session.get).
+
+            endpoint (str): The API endpoint to call.
+
+            entity_type (Type[TEntityDict]): The expected type of the response entity.
+
+            as_json (bool): Whether to return the response as JSON. Defaults to True.
+
+            last_exception (Union[None, Exception], optional): The last exception encountered.
+
+            num_retries (int): The current number of retries attempted.
+
+            deadline (Union[float, None], optional): The monotonic timestamp by which
+                the request, including retries, must complete.
+
+            request_class (Union[RequestClass, None], optional): The request class,
+                selecting the lane the request is sent through.
+
+            is_write (bool): Whether the request writes data, routing it to the
+                leader when leader-aware writes are enabled.
+
+            raw (bool): Whether to return the undecoded response body and content
+                type, ignoring as_json.
+
+            kwargs: Additional keyword arguments for the request.
+
+        Returns:
+            Union[TEntityDict, str, RawResponse]: The response, either as a JSON
+                object, a string or the undecoded body.
+
+        Raises:
+            TypesenseClientError: If all nodes are unhealthy or max retries are exceeded.
+            Timeout: If the deadline expires before the request completes.
         """
 
     def _execute_request(
@@ -411,8 +767,12 @@ class ApiCall:
         as_json: typing.Union[typing.Literal[True], typing.Literal[False]] = True,
         last_exception: typing.Union[None, Exception] = None,
         num_retries: int = 0,
+        deadline: typing.Union[float, None] = None,
+        request_class: typing.Union[RequestClass, None] = None,
+        is_write: bool = False,
+        raw: bool = False,
         **kwargs: SessionFunctionKwargs[TParams, TBody],
-    ) -> typing.Union[TEntityDict, str]:
+    ) -> typing.Union[TEntityDict, str, RawResponse]:
         """
         Execute a request to the Typesense API with retry logic.
 
@@ -432,31 +792,56 @@ class ApiCall:
 
             num_retries (int): The current number of retries attempted.
 
+            deadline (Union[float, None], optional): The monotonic timestamp by which
+                the request, including retries, must complete.
+
+            request_class (Union[RequestClass, None], optional): The request class,
+                selecting the lane the request is sent through.
+
+            is_write (bool): Whether the request writes data, routing it to the
+                leader when leader-aware writes are enabled.
+
+            raw (bool): Whether to return the undecoded response body and content
+                type instead. Defaults to False.
+
             kwargs: Additional keyword arguments for the request.
 
         Returns:
-            Union[TEntityDict, str]: The response, either as a JSON object or a string.
+            Union[TEntityDict, str, RawResponse]: The response, either as a JSON
+                object, a string or the undecoded body.
 
         Raises:
             TypesenseClientError: If all nodes are unhealthy or max retries are exceeded.
+            Timeout: If the deadline expires before the request completes.
         """
         if num_retries > self.config.num_retries:
             if last_exception:
                 raise last_exception
             raise TypesenseClientError("All nodes are unhealthy")
 
-        node, url, kwargs = self._prepare_request_params(endpoint, **kwargs)
+        timeout = self._attempt_timeout(request_class)
+        if deadline is not None:
+            timeout = self._remaining_budget(deadline, timeout, last_exception)
+        kwargs["timeout"] = timeout
+
+        node, url, kwargs = self._prepare_request_params(endpoint, is_write, **kwargs)
 
         try:
             return self._make_request_and_process_response(
                 fn,
+                node,
                 url,
                 entity_type,
                 as_json,
+                request_class,
+                raw,
+                deadline,
                 **kwargs,
             )
         except _SERVER_ERRORS as server_error:
             self.node_manager.set_node_health(node, is_healthy=False)
+            if node is self.node_manager.leader_node:
+                self.node_manager.invalidate_leader()
             return self._execute_request(
                 fn,
                 endpoint,
@@ -464,41 +849,431 @@ class ApiCall:
                 as_json,
                 last_exception=server_error,
                 num_retries=num_retries + 1,
+                deadline=deadline,
+                request_class=request_class,
+                is_write=is_write,
+                raw=raw,
                 **kwargs,
             )
 
+    def _compute_deadline(
+        self,
+        deadline_seconds: typing.Union[float, None],
+    ) -> typing.Union[float, None]:
+        """
+        Turn a relative deadline into an absolute monotonic timestamp.
+
+        Args:
+            deadline_seconds (Union[float, None]): The per-call deadline, falling back
+                to the configured deadline_seconds when None.
+
+        Returns:
+            Union[float, None]: The monotonic timestamp of the deadline, or None.
+        """
+        if deadline_seconds is None:
+            deadline_seconds = self.config.deadline_seconds
+        if deadline_seconds is None:
+            return None
+        return time.monotonic() + deadline_seconds
+
+    def _remaining_budget(
+        self,
+        deadline: float,
+        timeout: float,
+        last_exception: typing.Union[None, Exception],
+    ) -> float:
+        """
+        Compute the timeout of the next attempt from the remaining deadline budget.
+
+        Args:
+            deadline (float): The monotonic timestamp of the deadline.
+            timeout (float): The timeout of an attempt without a deadline.
+            last_exception (Union[None, Exception]): The last exception encountered.
+
+        Returns:
+            float: The timeout of the next attempt, capped by the remaining budget.
+
+        Raises:
+            Timeout: If the deadline has already expired.
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise Timeout("Request deadline exceeded") from last_exception
+        return min(timeout, remaining)
+
+    def _attempt_timeout(self, request_class: typing.Union[RequestClass, None]) -> float:
+        """
+        Get the timeout of a request attempt, honouring the request class lane.
+
+        Args:
+            request_class (Union[RequestClass, None]): The request class.
+
+        Returns:
+            float: The timeout of a request attempt in seconds.
+        """
+        lane = self._lane(request_class)
+        if lane is None:
+            timeout: float = self.config.connection_timeout_seconds
+        else:
+            timeout = lane.connection_timeout_seconds
+        return timeout
+
+    def _lane(
+        self,
+        request_class: typing.Union[RequestClass, None],
+    ) -> typing.Union[RequestLane, None]:
+        """
+        Get the lane configured for a request class.
+
+        Args:
+            request_class (Union[RequestClass, None]): The request class.
+
+        Returns:
+            Union[RequestLane, None]: The lane, or None if the class has no lane.
+        """
+        if request_class is None:
+            return None
+        return self.request_lanes.get(request_class)
+
+    def _session(self, request_class: RequestClass) -> requests.Session:
+        """
+        Get the session whose connection pool serves a request class.
+
+        Args:
+            request_class (RequestClass): The request class.
+
+        Returns:
+            requests.Session: The lane session, or the shared session if the class
+                has no lane.
+        """
+        lane = self._lane(request_class)
+        if lane is None:
+            return session
+        lane_session: requests.Session = lane.session
+        return lane_session
+
     def _make_request_and_process_response(
         self,
         fn: typing.Callable[..., requests.models.Response],
+        node: Node,
         url: str,
         entity_type: typing.Type[TEntityDict],
         as_json: bool,
+        request_class: typing.Union[RequestClass, None] = None,
+        raw: bool = False,
+        deadline: typing.Union[float, None] = None,
         **kwargs: SessionFunctionKwargs[TParams, TBody],
-    ) -> typing.Union[TEntityDict, str]:
-        """Make the API request and process the response."""
-        request_response = self.request_handler.make_request(
-            fn=fn,
-            url=url,
-            as_json=as_json,
-            entity_type=entity_type,
-            **kwargs,
-        )
-        self.node_manager.set_node_health(self.node_manager.get_node(), is_healthy=True)
+    ) -> typing.Union[TEntityDict, str, RawResponse]:
+        """Make the API request to a node, then mark the node healthy."""
+        with self._request_slot(request_class, deadline) as remaining:
+            if remaining is not None:
+                kwargs["timeout"] = min(kwargs["timeout"], remaining)
+            request_response = self.request_handler.make_request(
+                fn=fn,
+                url=url,
+                as_json=as_json,
+                entity_type=entity_type,
+                raw=raw,
+                **kwargs,
+            )
+        self.node_manager.set_node_health(node, is_healthy=True)
+        if raw:
+            return typing.cast(RawResponse, request_response)
         return (
             typing.cast(TEntityDict, request_response)
             if as_json
             else typing.cast(str, request_response)
         )
 
+    @contextlib.contextmanager
+    def _request_slot(
+        self,
+        request_class: typing.Union[RequestClass, None],
+        deadline: typing.Union[float, None] = None,
+    ) -> typing.Iterator[typing.Union[float, None]]:
+        """
+        Hold the lane and concurrency limiter slots of a request, if enabled.
+
+        Waiting for the slots counts against the deadline: the block receives the
+        budget left once they are held, or None if there is no slot or deadline.
+        """
+        lane = self._lane(request_class)
+        concurrency_limiter = self.concurrency_limiter
+        if lane is not None:
+            concurrency_limiter = self.lane_concurrency_limiters.get(
+                typing.cast(RequestClass, request_class),
+                concurrency_limiter,
+            )
+        with contextlib.ExitStack() as slots:
+            if lane is not None:
+                slots.enter_context(lane.slot(deadline))
+            if concurrency_limiter is not None:
+                slots.enter_context(concurrency_limiter.slot(deadline))
+            if deadline is None or (lane is None and concurrency_limiter is None):
+                yield None
+            else:
+                yield self._remaining_budget(deadline, math.inf, None)
+
+    def probe_node_latencies(self) -> typing.List[typing.Tuple[Node, float]]:
+        """
+        Probe the `/health` latency of every node in parallel and rank the nodes.
+
+        When `auto_nearest_node` is enabled, the fastest node becomes the
+        effective nearest node.
+
+        Returns:
+            List[Tuple[Node, float]]: The reachable nodes and their latencies in
+                seconds, fastest first.
+        """
+        candidates = self._candidate_nodes()
+        if not candidates:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(len(candidates), _MAX_PROBE_WORKERS),
+        ) as executor:
+            latencies = list(executor.map(self._probe_node_latency, candidates))
+
+        ranking = sorted(
+            (
+                (node, latency)
+                for node, latency in zip(candidates, latencies)
+                if latency is not None
+            ),
+            key=lambda ranked_node: ranked_node[1],
+        )
+        self.node_manager.set_latency_ranking(ranking)
+        return ranking
+
+    def _start_latency_probe(self) -> None:
+        """
+        Probe the node latencies in a background thread, unless a probe is running.
+
+        Requests keep using the last ranking until the probe records a new one, so
+        they never wait for the slowest node to answer its health check.
+        """
+        with self._latency_probe_lock:
+            probe_thread = self._latency_probe_thread
+            if probe_thread is not None and probe_thread.is_alive():
+                return
+            probe_thread = threading.Thread(
+                target=self.probe_node_latencies,
+                name="typesense-latency-probe",
+                daemon=True,
+            )
+            self._latency_probe_thread = probe_thread
+            probe_thread.start()
+
+    def warmup(
+        self,
+        connections_per_node: int = 1,
+        check_health: bool = True,
+    ) -> typing.Dict[str, int]:
+        """
+        Open keep-alive connections to every node before serving traffic.
+
+        This sends `connections_per_node` concurrent `/health` requests to each node
+        through every connection pool in use, so the TCP and TLS handshakes are paid
+        before the first real request. At most 32 requests are in flight at a time.
+
+        Args:
+            connections_per_node (int): The number of connections to open per node
+                and connection pool.
+            check_health (bool): Whether to mark nodes that fail to respond as
+                unhealthy.
+
+        Returns:
+            Dict[str, int]: The number of connections warmed up for each node URL.
+
+        Raises:
+            InvalidParameter: If connections_per_node is less than 1.
+        """
+        if connections_per_node < 1:
+            raise InvalidParameter(
+                f"connections_per_node must be at least 1, got {connections_per_node}.",
+            )
+        sessions = [session] + [lane.session for lane in self.request_lanes.values()]
+        targets = [
+            (node, target_session)
+            for node in self._candidate_nodes()
+            for target_session in sessions
+            for _ in range(connections_per_node)
+        ]
+        if not targets:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(len(targets), _MAX_PROBE_WORKERS),
+        ) as executor:
+            outcomes = list(
+                executor.map(lambda target: self._warmup_connection(*target), targets),
+            )
+
+        warmed_connections: typing.Dict[str, int] = {}
+        for (node, _), is_warm in zip(targets, outcomes):
+            warmed_connections.setdefault(node.url(), 0)
+            warmed_connections[node.url()] += int(is_warm)
+
+        if check_health:
+            for node in self._candidate_nodes():
+                self.node_manager.set_node_health(
+                    node,
+                    is_healthy=warmed_connections[node.url()] > 0,
+                )
+        return warmed_connections
+
+    def _warmup_connection(
+        self,
+        node: Node,
+        target_session: requests.Session,
+    ) -> bool:
+        """
+        Open a connection to a node with a `/health` request.
+
+        Args:
+            node (Node): The node to connect to.
+            target_session (requests.Session): The session whose pool keeps the
+                connection.
+
+        Returns:
+            bool: True if the node responded, False otherwise.
+        """
+        try:
+            self.request_handler.make_request(
+                target_session.get,
+                node.url() + "/health",
+                entity_type=typing.Dict[str, bool],
+                as_json=True,
+            )
+        except (requests.exceptions.RequestException, TypesenseClientError):
+            logger.debug(f"Could not warm up a connection to node {node.url()}.")
+            return False
+        return True
+
+    def _candidate_nodes(self) -> typing.List[Node]:
+        """
+        Get every node requests can be sent to, including the nearest node.
+
+        Returns:
+            List[Node]: The nodes of the cluster.
+        """
+        candidates = list(self.node_manager.nodes)
+        if self.config.nearest_node:
+            candidates.append(self.config.nearest_node)
+        return candidates
+
+    def _probe_node_latency(self, node: Node) -> typing.Union[float, None]:
+        """
+        Measure the latency of a `/health` request to a node.
+
+        Args:
+            node (Node): The node to probe.
+
+        Returns:
+            Union[float, None]: The latency in seconds, or None if the node is unreachable.
+        """
+        start = time.monotonic()
+        try:
+            self.request_handler.make_request(
+                session.get,
+                node.url() + "/health",
+                entity_type=typing.Dict[str, bool],
+                as_json=True,
+            )
+        except (requests.exceptions.RequestException, TypesenseClientError):
+            logger.debug(f"Could not probe the latency of node {node.url()}.")
+            return None
+        return time.monotonic() - start
+
+    def _refresh_leader(self) -> None:
+        """
+        Look up the Raft leader by asking each node for its state on `/debug`.
+
+        Nodes that cannot be reached are skipped; if none reports itself as
+        leader, writes fall back to the regular node rotation until the next lookup.
+        """
+        for node in self.node_manager.nodes:
+            try:
+                debug_info = self.request_handler.make_request(
+                    session.get,
+                    node.url() + "/debug",
+                    entity_type=DebugResponseSchema,
+                    as_json=True,
+                )
+            except (requests.exceptions.RequestException, TypesenseClientError):
+                logger.debug(f"Could not retrieve the state of node {node.url()}.")
+                continue
+            if debug_info.get("state") == _LEADER_STATE:
+                self.node_manager.set_leader(node)
+                return
+
+        logger.debug("No leader was found. Writes will use the next node.")
+        self.node_manager.set_leader(None)
+
     def _prepare_request_params(
         self,
         endpoint: str,
+        is_write: bool = False,
         **kwargs: SessionFunctionKwargs[TParams, TBody],
     ) -> typing.Tuple[Node, str, SessionFunctionKwargs[TParams, TBody]]:
-        node = self.node_manager.get_node()
-        url = node.url() + endpoint
-
         if kwargs.get("params"):
-            self.request_handler.normalize_params(kwargs["params"])
+            kwargs["params"] = self.request_handler.normalized_params(kwargs["params"])
+
+        if self.node_manager.is_due_for_latency_probe():
+            self._start_latency_probe()
+        if is_write:
+            if self.node_manager.is_due_for_leader_check():
+                self._refresh_leader()
+            node = self.node_manager.get_write_node()
+        elif self.config.cache_affinity_routing and _is_search(endpoint):
+            node = self.node_manager.get_affinity_node(_affinity_key(endpoint, kwargs))
+        else:
+            node = self.node_manager.get_node()
+        url = node.url() + endpoint
 
         return node, url, kwargs
+
+
+def _is_search(endpoint: str) -> bool:
+    """Check whether an endpoint serves searches, which the nodes cache."""
+    return endpoint == _MULTI_SEARCH_ENDPOINT or endpoint.endswith(
+        _SEARCH_ENDPOINT_SUFFIX,
+    )
+
+
+def _is_read_post(endpoint: str) -> bool:
+    """
+    Check whether a POST endpoint reads data rather than writing it.
+
+    Searches only read data, and operations act on the node they are sent to, so
+    neither is routed to the leader.
+    """
+    return _is_search(endpoint) or endpoint.startswith(_OPERATIONS_ENDPOINT_PREFIX)
+
+
+def _affinity_key(
+    endpoint: str,
+    kwargs: SessionFunctionKwargs[TParams, TBody],
+) -> str:
+    """
+    Build the key routing a search to its preferred node.
+
+    Parameters are serialized with sorted keys, so searches differing only in
+    parameter order share a node; with `canonicalize_searches` enabled, searches
+    sharing a server-side cache key also share a node.
+    """
+    return json.dumps(
+        [endpoint, kwargs.get("params"), kwargs.get("data")],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _reset_after_fork() -> None:
+    """Replace the shared session and reset every ApiCall in a forked child."""
+    global session  # noqa: WPS420
+    session = requests.sessions.Session()
+    for api_call in list(_api_calls):
+        api_call.reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
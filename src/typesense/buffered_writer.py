@@ -0,0 +1,335 @@
+"""
+This module provides a write-behind buffer for the documents of a Typesense collection.
+
+It contains the BufferedWriter class, which accepts single-document upserts, partial
+updates and deletes, coalesces repeated writes to the same document and sends them as
+a few bulk requests instead of one request per write.
+
+Key features:
+- Coalescing of writes to the same id: upserts and deletes replace earlier writes,
+  partial updates are merged into them
+- Flushing as `import_` batches and chunked deletes on size, age or explicit flush
+- A callback for the documents the server fails to write
+- Retrying the writes of a failed flush with the next flush, coalesced with the
+  writes buffered since
+- A clean drain of the pending writes on close and at interpreter exit
+
+Classes:
+    BufferedWriter: Buffers, coalesces and flushes the writes of a collection.
+
+Dependencies:
+    - typesense.collection: Provides the Collection class
+    - typesense.exceptions: Custom exception classes
+    - typesense.logger: Provides logging functionality
+
+Usage:
+    with BufferedWriter(client.collections["companies"]) as writer:
+        writer.upsert({"id": "0", "company_name": "Typesense"})
+        writer.update({"id": "0", "num_employees": 10})
+        writer.delete("1")
+
+Note: This module is part of the Typesense Python client library.
+"""
+
+import atexit
+import sys
+import threading
+import time
+import weakref
+
+from typesense.collection import Collection
+from typesense.exceptions import TypesenseClientError
+from typesense.logger import logger
+from typesense.types.document import DocumentSchema, ImportResponseFail
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+TDoc = typing.TypeVar("TDoc", bound=DocumentSchema)
+
+_WriteAction = typing.Literal["upsert", "update", "delete"]
+_PendingWrite = typing.Tuple[_WriteAction, typing.Union[TDoc, None]]
+
+
+class BufferedWriter(typing.Generic[TDoc]):
+    """
+    Buffers, coalesces and flushes the writes of a collection.
+
+    Only the last write to each document id is kept: an upsert or delete replaces
+    the pending write of its id, and a partial update is merged into the pending
+    upsert or update. Pending writes are flushed when `max_batch_size` ids are
+    pending, when the oldest pending write is `max_age_seconds` old, on `flush()`
+    and on `close()`. Flushes are serialized, so writes reach the server in order.
+
+    Age-based flushes run in a daemon thread, which the interpreter stops without
+    waiting for it, so writers that are still open at exit are closed by an
+    `atexit` hook that drains their pending writes.
+
+    Attributes:
+        collection (Collection[TDoc]): The collection the writes go to.
+        max_batch_size (int): The number of pending ids that triggers a flush.
+        max_age_seconds (float | None): The age of the oldest pending write that
+            triggers a flush, or None to only flush on size and explicitly.
+        on_failure (Callable[[ImportResponseFail[TDoc]], None] | None): Called with
+            each document the server fails to write. Failures are logged if unset.
+    """
+
+    def __init__(
+        self,
+        collection: Collection[TDoc],
+        max_batch_size: int = 1000,
+        max_age_seconds: typing.Union[float, None] = 1.0,
+        on_failure: typing.Union[
+            typing.Callable[[ImportResponseFail[TDoc]], None],
+            None,
+        ] = None,
+    ) -> None:
+        """
+        Initialize the BufferedWriter and start its age-based flushing.
+
+        Args:
+            collection (Collection[TDoc]): The collection the writes go to.
+            max_batch_size (int): The number of pending ids that triggers a flush.
+            max_age_seconds (Union[float, None]): The age of the oldest pending
+                write that triggers a flush, or None to disable age-based flushes.
+            on_failure (Union[Callable[[ImportResponseFail[TDoc]], None], None]):
+                Called with each document the server fails to write.
+        """
+        self.collection = collection
+        self.max_batch_size = max_batch_size
+        self.max_age_seconds = max_age_seconds
+        self.on_failure = on_failure
+        self._pending: typing.Dict[str, _PendingWrite[TDoc]] = {}
+        self._oldest_write_ts: typing.Union[float, None] = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._flusher: typing.Union[threading.Thread, None] = None
+        if max_age_seconds is not None:
+            self._flusher = threading.Thread(
+                target=self._flush_when_due,
+                name="typesense-buffered-writer",
+                daemon=True,
+            )
+            self._flusher.start()
+        _open_writers.add(self)
+
+    def __enter__(self) -> "BufferedWriter[TDoc]":
+        """
+        Use the writer as a context manager that drains it on exit.
+
+        Returns:
+            BufferedWriter[TDoc]: The writer.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Drain the pending writes and stop the writer."""
+        self.close()
+
+    def upsert(self, document: TDoc) -> None:
+        """
+        Buffer the upsert of a document, replacing the pending write of its id.
+
+        Args:
+            document (TDoc): The document, including its id.
+        """
+        self._write(str(document["id"]), "upsert", document)
+
+    def update(self, document: TDoc) -> None:
+        """
+        Buffer a partial update of a document, merged into the pending write of its id.
+
+        Args:
+            document (TDoc): The fields to update, including the document id.
+        """
+        self._write(str(document["id"]), "update", document)
+
+    def delete(self, document_id: typing.Union[str, int]) -> None:
+        """
+        Buffer the delete of a document, replacing the pending write of its id.
+
+        Args:
+            document_id (Union[str, int]): The id of the document, keyed as a string
+                like the ids of upserted and updated documents.
+        """
+        self._write(str(document_id), "delete", None)
+
+    @property
+    def pending_count(self) -> int:
+        """
+        Get the number of document ids with a pending write.
+
+        Returns:
+            int: The number of pending writes.
+        """
+        with self._condition:
+            return len(self._pending)
+
+    def flush(self) -> None:
+        """
+        Send the pending writes to the server.
+
+        Upserts and updates are sent as one import each, deletes as chunked
+        deletes by id. If a request fails, its writes stay pending unless they
+        were overwritten in the meantime, and are retried with the next flush.
+
+        Raises:
+            TypesenseClientError: If a request fails after its retries.
+            requests.exceptions.RequestException: If a node cannot be reached
+                after the retries.
+        """
+        with self._flush_lock:
+            with self._condition:
+                pending_writes = self._pending
+                self._pending = {}
+                self._oldest_write_ts = None
+            if not pending_writes:
+                return
+
+            try:
+                self._send(pending_writes)
+            except Exception:
+                self._requeue(pending_writes)
+                raise
+
+    def close(self) -> None:
+        """
+        Stop age-based flushing and drain the pending writes.
+
+        Raises:
+            TypesenseClientError: If the final flush fails after its retries.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        _open_writers.discard(self)
+        if self._flusher is not None:
+            self._flusher.join()
+        self.flush()
+
+    def _write(
+        self,
+        document_id: str,
+        action: _WriteAction,
+        document: typing.Union[TDoc, None],
+    ) -> None:
+        """Coalesce a write into the pending writes and flush them if full."""
+        with self._condition:
+            if self._closed:
+                raise TypesenseClientError("Cannot write to a closed BufferedWriter.")
+            write: _PendingWrite[TDoc] = (action, document)
+            pending_write = self._pending.pop(document_id, None)
+            if pending_write is not None:
+                write = _coalesce(pending_write, write)
+            self._pending[document_id] = write
+            if self._oldest_write_ts is None:
+                self._oldest_write_ts = time.monotonic()
+                self._condition.notify_all()
+            is_full = len(self._pending) >= self.max_batch_size
+        if is_full:
+            self.flush()
+
+    def _send(self, pending_writes: typing.Dict[str, _PendingWrite[TDoc]]) -> None:
+        """Send coalesced writes as imports and deletes, reporting failed documents."""
+        documents_by_action: typing.Dict[_WriteAction, typing.List[TDoc]] = {
+            "upsert": [],
+            "update": [],
+        }
+        deleted_ids = []
+        for document_id, (action, document) in pending_writes.items():
+            if action == "delete":
+                deleted_ids.append(document_id)
+            else:
+                documents_by_action[action].append(typing.cast(TDoc, document))
+
+        documents = self.collection.documents
+        for action, action_documents in documents_by_action.items():
+            if not action_documents:
+                continue
+            import_response = documents.import_(action_documents, {"action": action})
+            for document_response in import_response:
+                if not document_response["success"]:
+                    self._report_failure(
+                        typing.cast(ImportResponseFail[TDoc], document_response),
+                    )
+        if deleted_ids:
+            documents.delete_many(deleted_ids)
+
+    def _requeue(self, pending_writes: typing.Dict[str, _PendingWrite[TDoc]]) -> None:
+        """
+        Put back the writes of a failed flush, under the writes buffered since.
+
+        A write buffered during the flush is coalesced into the failed write of
+        its id as if it came after it, e.g. a partial update is merged into the
+        failed upsert instead of replacing it.
+        """
+        with self._condition:
+            for document_id, pending_write in pending_writes.items():
+                newer_write = self._pending.get(document_id)
+                if newer_write is not None:
+                    pending_write = _coalesce(pending_write, newer_write)
+                self._pending[document_id] = pending_write
+            if self._pending and self._oldest_write_ts is None:
+                self._oldest_write_ts = time.monotonic()
+
+    def _report_failure(self, failure: ImportResponseFail[TDoc]) -> None:
+        """Pass a document the server failed to write to the failure callback."""
+        if self.on_failure is None:
+            logger.warning(f"Could not write a buffered document: {failure['error']}")
+            return
+        self.on_failure(failure)
+
+    def _flush_when_due(self) -> None:
+        """Flush the pending writes whenever the oldest one reaches the maximum age."""
+        max_age_seconds = typing.cast(float, self.max_age_seconds)
+        while True:  # noqa: WPS457
+            with self._condition:
+                while not self._closed and (
+                    self._oldest_write_ts is None
+                    or time.monotonic() - self._oldest_write_ts < max_age_seconds
+                ):
+                    self._condition.wait(
+                        None
+                        if self._oldest_write_ts is None
+                        else self._oldest_write_ts + max_age_seconds - time.monotonic(),
+                    )
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception as flush_error:
+                logger.warning(f"Could not flush buffered writes: {flush_error}")
+
+
+def _coalesce(
+    older_write: _PendingWrite[TDoc],
+    newer_write: _PendingWrite[TDoc],
+) -> _PendingWrite[TDoc]:
+    """Coalesce two writes to the same document into the write they amount to."""
+    newer_action, newer_document = newer_write
+    if newer_action != "update" or newer_document is None:
+        return newer_write
+    older_action, older_document = older_write
+    if older_action == "delete" or older_document is None:
+        # The update would fail on the deleted document, as it would have without
+        # buffering, so the delete is kept.
+        return older_write
+    return (older_action, typing.cast(TDoc, {**older_document, **newer_document}))
+
+
+_open_writers: "weakref.WeakSet[BufferedWriter[typing.Any]]" = weakref.WeakSet()
+
+
+def _close_open_writers() -> None:
+    """Drain the writers still open at interpreter exit."""
+    for writer in list(_open_writers):
+        try:
+            writer.close()
+        except Exception as close_error:
+            logger.warning(f"Could not drain buffered writes at exit: {close_error}")
+
+
+atexit.register(_close_open_writers)
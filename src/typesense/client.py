@@ -15,6 +15,7 @@ Dependencies:
     - typesense.collections: Provides the Collections class.
     - typesense.configuration: Provides Configuration and ConfigDict types.
     - typesense.conversations_models: Provides the ConversationsModels class.
+    - typesense.handle_cache: Provides the HandleCache class.
     - typesense.debug: Provides the Debug class.
     - typesense.keys: Provides the Keys class.
     - typesense.metrics: Provides the Metrics class.
@@ -24,12 +25,23 @@ Dependencies:
     - typesense.types.document: Provides the DocumentSchema type.
 
 Note: This module uses conditional imports to support both Python 3.11+ and earlier versions.
+The resource modules, and the `requests` library they depend on, are only imported when
+the corresponding Client attribute is first accessed, which keeps `import typesense` and
+client construction cheap. Each attribute is created under the client's lock, so threads
+sharing a client also share its ApiCall and resources. The lock is replaced in processes
+created with `os.fork`, as another thread may have held it during the fork.
 """
 
+import os
 import sys
+import threading
+import weakref
+from functools import cached_property
 
 from typing_extensions import deprecated
 
+from typesense.configuration import ConfigDict, Configuration
+from typesense.handle_cache import HandleCache
 from typesense.types.document import DocumentSchema
 
 if sys.version_info >= (3, 11):
@@ -37,36 +49,75 @@ if sys.version_info >= (3, 11):
 else:
     import typing_extensions as typing
 
-from typesense.aliases import Aliases
-from typesense.analytics import Analytics
-from typesense.analytics_v1 import AnalyticsV1
-from typesense.api_call import ApiCall
-from typesense.collection import Collection
-from typesense.collections import Collections
-from typesense.configuration import ConfigDict, Configuration
-from typesense.conversations_models import ConversationsModels
-from typesense.curation_sets import CurationSets
-from typesense.debug import Debug
-from typesense.keys import Keys
-from typesense.metrics import Metrics
-from typesense.multi_search import MultiSearch
-from typesense.nl_search_models import NLSearchModels
-from typesense.operations import Operations
-from typesense.stemming import Stemming
-from typesense.stopwords import Stopwords
-from typesense.synonym_sets import SynonymSets
+if typing.TYPE_CHECKING:
+    from typesense.aliases import Aliases
+    from typesense.analytics import Analytics
+    from typesense.analytics_v1 import AnalyticsV1
+    from typesense.api_call import ApiCall
+    from typesense.collection import Collection
+    from typesense.collections import Collections
+    from typesense.conversations_models import ConversationsModels
+    from typesense.curation_sets import CurationSets
+    from typesense.debug import Debug
+    from typesense.keys import Keys
+    from typesense.metrics import Metrics
+    from typesense.multi_search import MultiSearch
+    from typesense.nl_search_models import NLSearchModels
+    from typesense.operations import Operations
+    from typesense.stemming import Stemming
+    from typesense.stopwords import Stopwords
+    from typesense.synonym_sets import SynonymSets
 
 TDoc = typing.TypeVar("TDoc", bound=DocumentSchema)
+TModel = typing.TypeVar("TModel")
+_T = typing.TypeVar("_T")
+
+_clients: "weakref.WeakSet[Client]" = weakref.WeakSet()
+
+
+class _LockedCachedProperty(cached_property[_T]):
+    """
+    A cached property created at most once, even by concurrent threads.
+
+    Since Python 3.12, `cached_property` no longer takes a lock, so two threads
+    accessing a client attribute for the first time could each build it, e.g. two
+    ApiCall instances probing the node latencies. Once created, the attribute is
+    read from the instance dictionary without taking the lock.
+    """
+
+    @typing.overload
+    def __get__(
+        self,
+        instance: None,
+        owner: typing.Union[type, None] = None,
+    ) -> "_LockedCachedProperty[_T]": ...
+
+    @typing.overload
+    def __get__(
+        self,
+        instance: object,
+        owner: typing.Union[type, None] = None,
+    ) -> _T: ...
+
+    def __get__(
+        self,
+        instance: typing.Union[object, None],
+        owner: typing.Union[type, None] = None,
+    ) -> typing.Union["_LockedCachedProperty[_T]", _T]:
+        if instance is None:
+            return self
+        with typing.cast("Client", instance)._attribute_lock:
+            return super().__get__(instance, owner)
 
 
 class Client:
     """
     The main client class for interacting with Typesense.
 
-    This class serves as the entry point for all Typesense operations. It initializes
-    and provides access to various components of the Typesense SDK, such as collections,
+    This class serves as the entry point for all Typesense operations. It provides
+    access to various components of the Typesense SDK, such as collections,
     multi-search, keys, aliases, analytics, stemming, operations, debug, stopwords,
-    and conversation models.
+    and conversation models. Each component is constructed on first access.
 
     Attributes:
         config (Configuration): The configuration object for the Typesense client.
@@ -105,51 +156,233 @@ class Client:
             >>> client = Client(config)
         """
         self.config = Configuration(config_dict)
-        self.api_call = ApiCall(self.config)
-        self.collections: Collections[DocumentSchema] = Collections(self.api_call)
-        self.multi_search = MultiSearch(self.api_call)
-        self.keys = Keys(self.api_call)
-        self.aliases = Aliases(self.api_call)
-        self._analyticsV1 = AnalyticsV1(self.api_call)
-        self.analytics = Analytics(self.api_call)
-        self.stemming = Stemming(self.api_call)
-        self.curation_sets = CurationSets(self.api_call)
-        self.operations = Operations(self.api_call)
-        self.debug = Debug(self.api_call)
-        self.stopwords = Stopwords(self.api_call)
-        self.synonym_sets = SynonymSets(self.api_call)
-        self.metrics = Metrics(self.api_call)
-        self.conversations_models = ConversationsModels(self.api_call)
-        self.nl_search_models = NLSearchModels(self.api_call)
+        self._attribute_lock = threading.RLock()
+        self._typed_collections: HandleCache[
+            typing.Tuple[str, type],
+            "Collection[typing.Any]",
+        ] = HandleCache(self.config.handle_cache_size)
+        _clients.add(self)
+
+    @_LockedCachedProperty
+    def api_call(self) -> "ApiCall":
+        """ApiCall instance for making API requests, created on first access."""
+        from typesense.api_call import ApiCall
+
+        return ApiCall(self.config)
+
+    @_LockedCachedProperty
+    def collections(self) -> "Collections[DocumentSchema]":
+        """Instance for managing collections."""
+        from typesense.collections import Collections
+
+        return Collections(self.api_call)
+
+    @_LockedCachedProperty
+    def multi_search(self) -> "MultiSearch":
+        """Instance for performing multi-search operations."""
+        from typesense.multi_search import MultiSearch
+
+        return MultiSearch(self.api_call)
+
+    @_LockedCachedProperty
+    def keys(self) -> "Keys":
+        """Instance for managing API keys."""
+        from typesense.keys import Keys
+
+        return Keys(self.api_call)
+
+    @_LockedCachedProperty
+    def aliases(self) -> "Aliases":
+        """Instance for managing collection aliases."""
+        from typesense.aliases import Aliases
+
+        return Aliases(self.api_call)
+
+    @_LockedCachedProperty
+    def _analyticsV1(self) -> "AnalyticsV1":
+        """Instance for analytics operations (V1)."""
+        from typesense.analytics_v1 import AnalyticsV1
+
+        return AnalyticsV1(self.api_call)
+
+    @_LockedCachedProperty
+    def analytics(self) -> "Analytics":
+        """Instance for analytics operations (v30)."""
+        from typesense.analytics import Analytics
+
+        return Analytics(self.api_call)
+
+    @_LockedCachedProperty
+    def stemming(self) -> "Stemming":
+        """Instance for stemming dictionary operations."""
+        from typesense.stemming import Stemming
+
+        return Stemming(self.api_call)
+
+    @_LockedCachedProperty
+    def curation_sets(self) -> "CurationSets":
+        """Instance for Curation Sets (v30+)."""
+        from typesense.curation_sets import CurationSets
+
+        return CurationSets(self.api_call)
+
+    @_LockedCachedProperty
+    def operations(self) -> "Operations":
+        """Instance for various Typesense operations."""
+        from typesense.operations import Operations
+
+        return Operations(self.api_call)
+
+    @_LockedCachedProperty
+    def debug(self) -> "Debug":
+        """Instance for debug operations."""
+        from typesense.debug import Debug
+
+        return Debug(self.api_call)
+
+    @_LockedCachedProperty
+    def stopwords(self) -> "Stopwords":
+        """Instance for managing stopwords."""
+        from typesense.stopwords import Stopwords
+
+        return Stopwords(self.api_call)
+
+    @_LockedCachedProperty
+    def synonym_sets(self) -> "SynonymSets":
+        """Instance for managing synonym sets."""
+        from typesense.synonym_sets import SynonymSets
+
+        return SynonymSets(self.api_call)
+
+    @_LockedCachedProperty
+    def metrics(self) -> "Metrics":
+        """Instance for retrieving system and Typesense metrics."""
+        from typesense.metrics import Metrics
+
+        return Metrics(self.api_call)
+
+    @_LockedCachedProperty
+    def conversations_models(self) -> "ConversationsModels":
+        """Instance for managing conversation models."""
+        from typesense.conversations_models import ConversationsModels
+
+        return ConversationsModels(self.api_call)
+
+    @_LockedCachedProperty
+    def nl_search_models(self) -> "NLSearchModels":
+        """Instance for managing natural language search models."""
+        from typesense.nl_search_models import NLSearchModels
+
+        return NLSearchModels(self.api_call)
+
+    def warmup(
+        self,
+        connections_per_node: int = 1,
+        check_health: bool = True,
+    ) -> typing.Dict[str, int]:
+        """
+        Open keep-alive connections to every node before serving traffic.
+
+        Args:
+            connections_per_node (int): The number of connections to open per node.
+            check_health (bool): Whether to mark nodes that fail to respond as unhealthy.
+
+        Returns:
+            Dict[str, int]: The number of connections warmed up for each node URL.
+
+        Raises:
+            InvalidParameter: If connections_per_node is less than 1.
+
+        Example:
+            >>> client = Client(config)
+            >>> client.warmup(connections_per_node=4)
+            {'http://localhost:8108': 4}
+        """
+        warmed_up: typing.Dict[str, int] = self.api_call.warmup(
+            connections_per_node,
+            check_health,
+        )
+        return warmed_up
+
+    async def warmup_async(
+        self,
+        connections_per_node: int = 1,
+        check_health: bool = True,
+    ) -> typing.Dict[str, int]:
+        """
+        Open keep-alive connections to every node without blocking the event loop.
+
+        Args:
+            connections_per_node (int): The number of connections to open per node.
+            check_health (bool): Whether to mark nodes that fail to respond as unhealthy.
+
+        Returns:
+            Dict[str, int]: The number of connections warmed up for each node URL.
+
+        Raises:
+            InvalidParameter: If connections_per_node is less than 1.
+        """
+        import asyncio
+
+        warmed_up: typing.Dict[str, int] = await asyncio.to_thread(
+            self.api_call.warmup,
+            connections_per_node,
+            check_health,
+        )
+        return warmed_up
 
     @property
     @deprecated(
         "AnalyticsV1 is deprecated on v30+. Use client.analytics instead.",
         category=None,
     )
-    def analyticsV1(self) -> AnalyticsV1:
+    def analyticsV1(self) -> "AnalyticsV1":
         return self._analyticsV1
 
+    @typing.overload
     def typed_collection(
         self,
         *,
         model: typing.Type[TDoc],
         name: typing.Union[str, None] = None,
-    ) -> Collection[TDoc]:
+    ) -> "Collection[TDoc]": ...
+
+    @typing.overload
+    def typed_collection(
+        self,
+        *,
+        model: typing.Type[TModel],
+        name: typing.Union[str, None] = None,
+    ) -> "Collection[typing.Any]": ...
+
+    def typed_collection(
+        self,
+        *,
+        model: type,
+        name: typing.Union[str, None] = None,
+    ) -> "Collection[typing.Any]":
         """
         Get a Collection instance for a specific document model.
 
         This method allows retrieving a Collection instance typed to a specific document model.
         If no name is provided, it uses the lowercase name of the model class as
-        the collection name.
+        the collection name. The model is recorded on the documents of the returned
+        collection, so the hits of typed search views expose their documents as views
+        of it. Typed collections are cached per name and model, apart from
+        `client.collections[name]`, so typed collections of different models never
+        change each other's model; they all use the validator of
+        `client.collections[name]`, whenever it is enabled.
+
+        The model is either a TypedDict subclass of DocumentSchema, or any class the
+        documents are decoded into, such as a dataclass.
 
         Args:
-            model (Type[TDoc]): The document model class.
+            model (type): The document model class.
             name (Union[str, None], optional):
                 The name of the collection. If None, uses the lowercase model class name.
 
         Returns:
-            Collection[TDoc]: A Collection instance typed to the specified document model.
+            Collection[Any]: A Collection instance typed to the specified document model.
 
         Example:
             >>> class Company(DocumentSchema):
@@ -160,7 +393,32 @@ class Client:
             # This is equivalent to:
             # companies_collection = client.typed_collection(model=Company, name="company")
         """
-        if name is None:
-            name = model.__name__.lower()
-        collection: Collection[TDoc] = self.collections[name]
-        return collection
+        from typesense.collection import Collection
+
+        collection_name = model.__name__.lower() if name is None else name
+
+        def create_typed_collection() -> "Collection[typing.Any]":
+            collection: "Collection[typing.Any]" = Collection(
+                self.api_call,
+                collection_name,
+            )
+            collection.documents.model = model
+            collection.documents.validator_owner = lambda: (
+                self.collections[collection_name].documents
+            )
+            return collection
+
+        return self._typed_collections.get_or_create(
+            (collection_name, model),
+            create_typed_collection,
+        )
+
+
+def _reset_after_fork() -> None:
+    """Replace the attribute lock of every Client in a forked child."""
+    for client in list(_clients):
+        client._attribute_lock = threading.RLock()  # noqa: WPS437
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
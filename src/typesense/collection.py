@@ -11,6 +11,7 @@ Dependencies:
     - typesense.api_call: Provides the ApiCall class for making API requests.
     - typesense.documents: Provides the Documents class for managing documents.
     - typesense.overrides: Provides the Overrides class for managing overrides.
+    - typesense.schema_validator: Provides the SchemaValidator class.
     - typesense.synonyms: Provides the Synonyms class for managing synonyms.
     - typesense.types.collection: Provides CollectionSchema and CollectionUpdateSchema types.
     - typesense.types.document: Provides DocumentSchema type.
@@ -32,6 +33,7 @@ else:
 from typesense.api_call import ApiCall
 from typesense.documents import Documents
 from typesense.overrides import Overrides
+from typesense.schema_validator import DirtyValues, SchemaValidator
 from typesense.synonyms import Synonyms
 from typesense.types.document import DocumentSchema
 
@@ -54,6 +56,8 @@ class Collection(typing.Generic[TDoc]):
         synonyms (Synonyms): Instance for managing synonyms in this collection.
     """
 
+    __slots__ = ("name", "api_call", "documents", "_overrides", "_synonyms")
+
     def __init__(self, api_call: ApiCall, name: str):
         """
         Initialize the Collection instance.
@@ -98,6 +102,29 @@ class Collection(typing.Generic[TDoc]):
         )
         return response
 
+    def enable_validation(
+        self,
+        dirty_values: DirtyValues = "coerce_or_reject",
+    ) -> SchemaValidator:
+        """
+        Check imported documents against the schema of this collection locally.
+
+        The schema is retrieved once and compiled into a validator; imports then
+        report invalid documents as failed without sending them. Call this again
+        after changing the schema. Documents imported with the `update` or
+        `emplace` action are only checked for the fields they hold.
+
+        Args:
+            dirty_values (DirtyValues): How invalid values are handled, like the
+                `dirty_values` import parameter, which overrides it per import.
+
+        Returns:
+            SchemaValidator: The validator used by the imports of this collection.
+        """
+        validator = SchemaValidator(self.retrieve(), dirty_values)
+        self.documents.validator = validator
+        return validator
+
     def update(self, schema_change: CollectionUpdateSchema) -> CollectionUpdateSchema:
         """
         Update the schema of this collection in Typesense.
@@ -25,6 +25,7 @@ else:
 
 from typesense.api_call import ApiCall
 from typesense.collection import Collection
+from typesense.handle_cache import HandleCache
 from typesense.types.collection import CollectionCreateSchema, CollectionSchema
 from typesense.types.document import DocumentSchema
 
@@ -41,8 +42,9 @@ class Collections(typing.Generic[TDoc]):
     Attributes:
         resource_path (str): The API endpoint path for collections operations.
         api_call (ApiCall): The ApiCall instance for making API requests.
-        collections (Dict[str, Collection[TDoc]]):
-           A dictionary of Collection instances, keyed by collection name.
+        collections (HandleCache[str, Collection[TDoc]]):
+           A bounded cache of Collection instances, keyed by collection name.
+           Collections with a validator are never evicted.
     """
 
     resource_path: typing.Final[str] = "/collections"
@@ -55,7 +57,10 @@ class Collections(typing.Generic[TDoc]):
             api_call (ApiCall): The ApiCall instance for making API requests.
         """
         self.api_call = api_call
-        self.collections: typing.Dict[str, Collection[TDoc]] = {}
+        self.collections: HandleCache[str, Collection[TDoc]] = HandleCache(
+            api_call.config.handle_cache_size,
+            is_pinned=_holds_state,
+        )
 
     def __contains__(self, collection_name: str) -> bool:
         """
@@ -70,10 +75,11 @@ class Collections(typing.Generic[TDoc]):
         Returns:
             bool: True if the collection exists, False otherwise.
         """
-        if collection_name in self.collections:
+        cached_collection = self.collections.get(collection_name)
+        if cached_collection is not None:
             try:  # noqa: WPS229, WPS529
 
-                self.collections[collection_name].retrieve()  # noqa: WPS529
+                cached_collection.retrieve()
                 return True
             except Exception:
                 self.collections.pop(collection_name, None)
@@ -102,12 +108,10 @@ class Collections(typing.Generic[TDoc]):
             >>> collections = Collections(api_call)
             >>> fruits_collection = collections['fruits']
         """
-        if not self.collections.get(collection_name):
-            self.collections[collection_name] = Collection(
-                self.api_call,
-                collection_name,
-            )
-        return self.collections[collection_name]
+        return self.collections.get_or_create(
+            collection_name,
+            lambda: Collection(self.api_call, collection_name),
+        )
 
     def create(self, schema: CollectionCreateSchema) -> CollectionSchema:
         """
@@ -162,3 +166,8 @@ class Collections(typing.Generic[TDoc]):
             entity_type=typing.List[CollectionSchema],
         )
         return call
+
+
+def _holds_state(collection: Collection[TDoc]) -> bool:
+    """Check whether a collection holds a validator, which eviction would lose."""
+    return collection.documents.validator is not None
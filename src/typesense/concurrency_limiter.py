@@ -0,0 +1,274 @@
+"""
+This module provides an adaptive client-side concurrency limiter for Typesense requests.
+
+It contains the AdaptiveConcurrencyLimiter class, which bounds the number of requests
+in flight to the cluster and adapts that bound using an AIMD (additive increase,
+multiplicative decrease) strategy driven by `ServiceUnavailable` responses and latency.
+
+Key features:
+- Additive increase of the limit while the cluster responds normally
+- Multiplicative decrease on 503 responses or latency well above the baseline, at
+  most once per round trip: requests sent before the last decrease cannot shrink the
+  limit again, so one burst of 503s halves it only once
+- A latency baseline that is frozen while the cluster shows signs of overload
+- Queueing of excess requests, with optional shedding after a maximum wait
+
+Classes:
+    AdaptiveConcurrencyLimiter: Limits and adapts the number of in-flight requests.
+
+Dependencies:
+    - typesense.configuration: Provides the AdaptiveConcurrencyConfigDict type
+    - typesense.exceptions: Custom exception classes
+
+Usage:
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, max_limit=64)
+    with limiter.slot():
+        response = session.get(...)
+
+Note: This module is part of the Typesense Python client library and is used internally
+by other components of the library.
+"""
+
+import contextlib
+import sys
+import threading
+import time
+
+from typesense.configuration import AdaptiveConcurrencyConfigDict
+from typesense.exceptions import (
+    ConcurrencyLimitExceeded,
+    ServiceUnavailable,
+    Timeout,
+)
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of in-flight requests and adapts the limit with AIMD.
+
+    Attributes:
+        min_limit (int): The lowest value the limit can shrink to.
+        max_limit (int): The highest value the limit can grow to.
+        backoff_ratio (float): The factor applied to the limit on overload.
+        latency_tolerance (float): How many times the baseline latency a request
+            may take before it is considered a sign of overload.
+        max_queue_seconds (float | None): How long a request may wait for a slot
+            before being shed. None waits indefinitely.
+        in_flight (int): The number of requests currently holding a slot.
+    """
+
+    _baseline_smoothing: typing.Final[float] = 0.05
+
+    def __init__(
+        self,
+        initial_limit: int = 16,
+        min_limit: int = 1,
+        max_limit: int = 128,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        max_queue_seconds: typing.Union[float, None] = None,
+    ) -> None:
+        """
+        Initialize the AdaptiveConcurrencyLimiter.
+
+        Args:
+            initial_limit (int): The starting number of allowed in-flight requests.
+            min_limit (int): The lowest value the limit can shrink to.
+            max_limit (int): The highest value the limit can grow to.
+            backoff_ratio (float): The factor applied to the limit on overload.
+            latency_tolerance (float): The latency multiple of the baseline that
+                counts as overload.
+            max_queue_seconds (Union[float, None]): How long a request may wait
+                for a slot before being shed.
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.max_queue_seconds = max_queue_seconds
+        self.in_flight = 0
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._baseline_latency: typing.Union[float, None] = None
+        self._last_decrease: typing.Union[float, None] = None
+        self._condition = threading.Condition()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: AdaptiveConcurrencyConfigDict,
+    ) -> "AdaptiveConcurrencyLimiter":
+        """
+        Create a limiter from the `adaptive_concurrency` configuration entry.
+
+        Args:
+            config (AdaptiveConcurrencyConfigDict): The limiter configuration.
+
+        Returns:
+            AdaptiveConcurrencyLimiter: The configured limiter.
+        """
+        return cls(
+            initial_limit=config.get("initial_limit", 16),
+            min_limit=config.get("min_limit", 1),
+            max_limit=config.get("max_limit", 128),
+            backoff_ratio=config.get("backoff_ratio", 0.5),
+            latency_tolerance=config.get("latency_tolerance", 2.0),
+            max_queue_seconds=config.get("max_queue_seconds", None),
+        )
+
+    @property
+    def limit(self) -> int:
+        """
+        Get the current number of allowed in-flight requests.
+
+        Returns:
+            int: The current limit.
+        """
+        return int(self._limit)
+
+    @contextlib.contextmanager
+    def slot(
+        self,
+        deadline: typing.Union[float, None] = None,
+    ) -> typing.Iterator[None]:
+        """
+        Hold a request slot for the duration of the block and adapt the limit.
+
+        A `ServiceUnavailable` error raised inside the block shrinks the limit,
+        a successful request grows it unless its latency indicates overload, and
+        any other error releases the slot without adjusting the limit.
+
+        Args:
+            deadline (Union[float, None], optional): The monotonic timestamp by which
+                a slot must be free, on top of max_queue_seconds.
+
+        Yields:
+            None: Control while the slot is held.
+        """
+        acquired_at = self.acquire(deadline)
+        try:
+            yield
+        except ServiceUnavailable:
+            self.release(overloaded=True, acquired_at=acquired_at)
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.release(
+            latency=time.monotonic() - acquired_at,
+            acquired_at=acquired_at,
+        )
+
+    def acquire(self, deadline: typing.Union[float, None] = None) -> float:
+        """
+        Wait for a free slot and take it.
+
+        Args:
+            deadline (Union[float, None], optional): The monotonic timestamp by which
+                a slot must be free, on top of max_queue_seconds.
+
+        Returns:
+            float: The monotonic time the slot was taken at, to pass to `release`.
+
+        Raises:
+            ConcurrencyLimitExceeded: If no slot frees up within max_queue_seconds.
+            Timeout: If no slot frees up before the deadline.
+        """
+        timeout = self.max_queue_seconds
+        is_deadline_bound = False
+        if deadline is not None:
+            remaining = max(deadline - time.monotonic(), 0)
+            if timeout is None or remaining < timeout:
+                timeout = remaining
+                is_deadline_bound = True
+        with self._condition:
+            has_slot = self._condition.wait_for(
+                lambda: self.in_flight < self.limit,
+                timeout=timeout,
+            )
+            if not has_slot:
+                if is_deadline_bound:
+                    raise Timeout("Request deadline exceeded")
+                raise ConcurrencyLimitExceeded(
+                    f"Concurrency limit of {self.limit} in-flight requests reached",
+                )
+            self.in_flight += 1
+        return time.monotonic()
+
+    def release(
+        self,
+        latency: typing.Union[float, None] = None,
+        overloaded: bool = False,
+        acquired_at: typing.Union[float, None] = None,
+    ) -> None:
+        """
+        Give a slot back and adapt the limit from the outcome of the request.
+
+        The limit shrinks at most once per round trip: a request that took its
+        slot before the last decrease was sent under the previous limit, so its
+        overload does not shrink the limit again, nor does its latency update the
+        baseline.
+
+        Args:
+            latency (Union[float, None]): The latency of a successful request.
+            overloaded (bool): Whether the cluster reported it is overloaded.
+            acquired_at (Union[float, None]): The time returned by `acquire`. The
+                request counts as sent after the last decrease if omitted.
+        """
+        with self._condition:
+            self.in_flight -= 1
+            is_current = (
+                acquired_at is None
+                or self._last_decrease is None
+                or acquired_at >= self._last_decrease
+            )
+            if overloaded or self._is_latency_overloaded(latency, is_current):
+                if is_current:
+                    self._limit = max(
+                        float(self.min_limit),
+                        self._limit * self.backoff_ratio,
+                    )
+                    self._last_decrease = time.monotonic()
+            elif latency is not None:
+                self._limit = min(
+                    float(self.max_limit),
+                    self._limit + 1 / self._limit,
+                )
+            self._condition.notify_all()
+
+    def _is_latency_overloaded(
+        self,
+        latency: typing.Union[float, None],
+        is_current: bool,
+    ) -> bool:
+        """
+        Check a latency sample against the baseline and fold it into the baseline.
+
+        The baseline is frozen while the cluster is overloaded: samples above the
+        tolerated latency, and samples of requests sent before the last decrease,
+        are not folded into it.
+
+        Args:
+            latency (Union[float, None]): The latency of a successful request.
+            is_current (bool): Whether the request was sent after the last decrease.
+
+        Returns:
+            bool: True if the latency exceeds the tolerated multiple of the baseline.
+        """
+        if latency is None:
+            return False
+        if self._baseline_latency is None:
+            if is_current:
+                self._baseline_latency = latency
+            return False
+
+        is_overloaded = latency > self._baseline_latency * self.latency_tolerance
+        if is_current and not is_overloaded:
+            self._baseline_latency += self._baseline_smoothing * (
+                latency - self._baseline_latency
+            )
+        return is_overloaded
@@ -27,6 +27,7 @@ else:
 from urllib.parse import urlparse
 
 from typesense.exceptions import ConfigError
+from typesense.handle_cache import DEFAULT_HANDLE_CACHE_SIZE
 from typesense.logger import logger
 
 
@@ -47,6 +48,50 @@ class NodeConfigDict(typing.TypedDict):
     protocol: typing.Union[typing.Literal["http", "https"], str]
 
 
+RequestClass = typing.Literal["interactive", "bulk", "admin"]
+
+
+class RequestClassConfigDict(typing.TypedDict):
+    """
+    A dictionary that configures the lane of a request class.
+
+    Attributes:
+        connection_timeout_seconds (float, optional): The timeout of each request
+            attempt in this class.
+        max_concurrent_requests (int, optional): The cap on in-flight requests
+            in this class.
+        pool_maxsize (int, optional): The number of pooled connections per node
+            reserved for this class.
+    """
+
+    connection_timeout_seconds: typing.NotRequired[float]
+    max_concurrent_requests: typing.NotRequired[int]
+    pool_maxsize: typing.NotRequired[int]
+
+
+class AdaptiveConcurrencyConfigDict(typing.TypedDict):
+    """
+    A dictionary that configures the adaptive client-side concurrency limiter.
+
+    Attributes:
+        initial_limit (int, optional): The starting number of in-flight requests.
+        min_limit (int, optional): The lowest value the limit can shrink to.
+        max_limit (int, optional): The highest value the limit can grow to.
+        backoff_ratio (float, optional): The factor applied to the limit on overload.
+        latency_tolerance (float, optional): The multiple of the baseline latency
+            above which a response counts as overload.
+        max_queue_seconds (float, optional): How long a request may wait for a slot
+            before being shed. Waits indefinitely when not set.
+    """
+
+    initial_limit: typing.NotRequired[int]
+    min_limit: typing.NotRequired[int]
+    max_limit: typing.NotRequired[int]
+    backoff_ratio: typing.NotRequired[float]
+    latency_tolerance: typing.NotRequired[float]
+    max_queue_seconds: typing.NotRequired[float]
+
+
 class ConfigDict(typing.TypedDict):
     """
     A dictionary that represents the configuration for the Typesense client.
@@ -81,6 +126,41 @@ class ConfigDict(typing.TypedDict):
 
         connection_timeout_seconds (float): The connection timeout in seconds.
 
+        deadline_seconds (float, optional): The end-to-end budget in seconds for a
+            request, shared by all of its retry attempts.
+
+        adaptive_concurrency (AdaptiveConcurrencyConfigDict, optional): Enables
+            the adaptive concurrency limiter with the given settings. Each lane of
+            `request_classes` gets a limiter of its own.
+
+        request_classes (dict[RequestClass, RequestClassConfigDict], optional):
+            Dedicated lanes for the interactive, bulk and admin request classes.
+
+        leader_aware_writes (bool, optional): Whether to route writes directly
+            to the Raft leader, as reported by the debug endpoint.
+
+        leader_refresh_interval_seconds (int, optional): The interval in seconds
+            between leader lookups.
+
+        auto_nearest_node (bool, optional): Whether to pick the nearest node by
+            probing the `/health` latency of every node.
+
+        latency_probe_interval_seconds (int, optional): The interval in seconds
+            between latency probes. Requests that find a probe due start it in the
+            background and keep using the last ranking.
+
+        handle_cache_size (int, optional): The maximum number of resource handles
+            (e.g. Document objects) each resource keeps for reuse. Must be at least 1.
+
+        canonicalize_searches (bool, optional): Whether to canonicalize search
+            parameters before sending them, to maximize server-side cache hits.
+
+        cache_affinity_routing (bool, optional): Whether to send identical searches
+            to the same node, so they hit that node's search cache.
+
+        float_precision (int, optional): The number of decimals the floats of NumPy
+            arrays in documents are rounded to when serialized.
+
         suppress_deprecation_warnings (bool): Whether to suppress deprecation warnings.
     """
 
@@ -98,9 +178,27 @@ class ConfigDict(typing.TypedDict):
         typing.List[typing.Union[str, NodeConfigDict]]
     ]  # deprecated
     connection_timeout_seconds: typing.NotRequired[float]
+    deadline_seconds: typing.NotRequired[float]
+    adaptive_concurrency: typing.NotRequired[AdaptiveConcurrencyConfigDict]
+    request_classes: typing.NotRequired[
+        typing.Dict[RequestClass, RequestClassConfigDict]
+    ]
+    leader_aware_writes: typing.NotRequired[bool]
+    leader_refresh_interval_seconds: typing.NotRequired[int]
+    auto_nearest_node: typing.NotRequired[bool]
+    latency_probe_interval_seconds: typing.NotRequired[int]
+    handle_cache_size: typing.NotRequired[int]
+    canonicalize_searches: typing.NotRequired[bool]
+    cache_affinity_routing: typing.NotRequired[bool]
+    float_precision: typing.NotRequired[int]
     suppress_deprecation_warnings: typing.NotRequired[bool]
 
 
+_NODE_ADDRESS_FIELDS: typing.Final[typing.FrozenSet[str]] = frozenset(
+    ("host", "port", "path", "protocol"),
+)
+
+
 class Node:
     """
     Class for representing a node in the Typesense cluster.
@@ -113,6 +211,16 @@ class Node:
         healthy (bool): Whether the node is healthy or not.
     """
 
+    __slots__ = (
+        "host",
+        "port",
+        "path",
+        "protocol",
+        "healthy",
+        "last_access_ts",
+        "_url",
+    )
+
     def __init__(
         self,
         host: str,
@@ -133,6 +241,7 @@ class Node:
         self.port = port
         self.path = path
         self.protocol = protocol
+        self._url = self._build_url()
 
         # Used to skip bad hosts
         self.healthy = True
@@ -164,13 +273,32 @@ class Node:
 
         return cls(parsed.hostname, parsed.port, parsed.path, parsed.scheme)
 
+    def __setattr__(self, name: str, attribute_value: typing.Any) -> None:
+        """
+        Set an attribute, recomputing the URL when the address of the node changes.
+
+        Args:
+            name (str): The name of the attribute.
+            attribute_value (Any): The new value of the attribute.
+        """
+        super().__setattr__(name, attribute_value)
+        if name in _NODE_ADDRESS_FIELDS and hasattr(self, "_url"):
+            self._url = self._build_url()
+
     def url(self) -> str:
         """
         Generate the URL of the node.
 
+        The URL is computed when the node is created or its address changes, as it
+        is needed for every request sent to the node.
+
         Returns:
             str: The URL of the node
         """
+        return self._url
+
+    def _build_url(self) -> str:
+        """Build the URL of the node from its address."""
         return f"{self.protocol}://{self.host}:{self.port}{self.path}"
 
 
@@ -183,12 +311,55 @@ class Configuration:
         nearest_node (Node | None): The nearest node to the client.
         api_key (str): The API key to use for authentication.
         connection_timeout_seconds (float): The connection timeout in seconds.
+        deadline_seconds (float | None): The end-to-end budget in seconds for a request.
+        adaptive_concurrency (AdaptiveConcurrencyConfigDict | None): The settings of
+            the adaptive concurrency limiter, if enabled.
+        request_classes (dict[RequestClass, RequestClassConfigDict]): The lanes
+            configured for each request class.
+        leader_aware_writes (bool): Whether writes are routed to the Raft leader.
+        leader_refresh_interval_seconds (int): The interval in seconds between
+            leader lookups.
+        auto_nearest_node (bool): Whether the nearest node is picked by latency.
+        latency_probe_interval_seconds (int): The interval in seconds between
+            latency probes.
+        handle_cache_size (int): The maximum number of resource handles each
+            resource keeps for reuse.
+        canonicalize_searches (bool): Whether search parameters are canonicalized.
+        cache_affinity_routing (bool): Whether identical searches are sent to the
+            same node.
+        float_precision (int | None): The number of decimals the floats of NumPy
+            arrays are rounded to, or None to keep their shortest exact form.
         num_retries (int): The number of retries to attempt before failing.
         retry_interval_seconds (float): The interval in seconds between retries.
         healthcheck_interval_seconds (int): The interval in seconds between health checks.
         verify (bool): Whether to verify the SSL certificate.
     """
 
+    __slots__ = (
+        "validations",
+        "nodes",
+        "nearest_node",
+        "api_key",
+        "connection_timeout_seconds",
+        "deadline_seconds",
+        "adaptive_concurrency",
+        "request_classes",
+        "num_retries",
+        "retry_interval_seconds",
+        "healthcheck_interval_seconds",
+        "verify",
+        "leader_aware_writes",
+        "leader_refresh_interval_seconds",
+        "auto_nearest_node",
+        "latency_probe_interval_seconds",
+        "handle_cache_size",
+        "canonicalize_searches",
+        "cache_affinity_routing",
+        "float_precision",
+        "additional_headers",
+        "suppress_deprecation_warnings",
+    )
+
     def __init__(
         self,
         config_dict: ConfigDict,
@@ -215,6 +386,16 @@ class Configuration:
             "connection_timeout_seconds",
             3.0,
         )
+        self.deadline_seconds: typing.Union[float, None] = config_dict.get(
+            "deadline_seconds",
+            None,
+        )
+        self.adaptive_concurrency: typing.Union[AdaptiveConcurrencyConfigDict, None] = (
+            config_dict.get("adaptive_concurrency", None)
+        )
+        self.request_classes: typing.Dict[RequestClass, RequestClassConfigDict] = (
+            config_dict.get("request_classes", {})
+        )
         self.num_retries = config_dict.get("num_retries", 3)
         self.retry_interval_seconds = config_dict.get("retry_interval_seconds", 1.0)
         self.healthcheck_interval_seconds = config_dict.get(
@@ -222,6 +403,26 @@ class Configuration:
             60,
         )
         self.verify = config_dict.get("verify", True)
+        self.leader_aware_writes = config_dict.get("leader_aware_writes", False)
+        self.leader_refresh_interval_seconds = config_dict.get(
+            "leader_refresh_interval_seconds",
+            60,
+        )
+        self.auto_nearest_node = config_dict.get("auto_nearest_node", False)
+        self.latency_probe_interval_seconds = config_dict.get(
+            "latency_probe_interval_seconds",
+            300,
+        )
+        self.handle_cache_size = config_dict.get(
+            "handle_cache_size",
+            DEFAULT_HANDLE_CACHE_SIZE,
+        )
+        self.canonicalize_searches = config_dict.get("canonicalize_searches", False)
+        self.cache_affinity_routing = config_dict.get("cache_affinity_routing", False)
+        self.float_precision: typing.Union[int, None] = config_dict.get(
+            "float_precision",
+            None,
+        )
         self.additional_headers = config_dict.get("additional_headers", {})
         self.suppress_deprecation_warnings = config_dict.get("suppress_deprecation_warnings", False)
 
@@ -287,6 +488,21 @@ class ConfigurationValidations:
         if nearest_node:
             ConfigurationValidations.validate_nearest_node(nearest_node)
 
+        deadline_seconds = config_dict.get("deadline_seconds", None)
+        if deadline_seconds is not None and deadline_seconds <= 0:
+            raise ConfigError("`deadline_seconds` must be a positive number.")
+
+        handle_cache_size = config_dict.get("handle_cache_size", None)
+        if handle_cache_size is not None and handle_cache_size < 1:
+            raise ConfigError("`handle_cache_size` must be at least 1.")
+
+        request_classes = config_dict.get("request_classes", {})
+        unknown_classes = set(request_classes) - set(typing.get_args(RequestClass))
+        if unknown_classes:
+            raise ConfigError(
+                f"Unknown request classes: {', '.join(sorted(unknown_classes))}.",
+            )
+
     @staticmethod
     def validate_required_config_fields(config_dict: ConfigDict) -> None:
         """
@@ -42,6 +42,8 @@ class ConversationModel:
         api_call (ApiCall): The API call object for making requests.
     """
 
+    __slots__ = ("model_id", "api_call")
+
     def __init__(self, api_call: ApiCall, model_id: str) -> None:
         """
         Initialize the ConversationModel object.
@@ -30,6 +30,7 @@ versions through the use of the typing_extensions library.
 import sys
 
 from typesense.api_call import ApiCall
+from typesense.handle_cache import HandleCache
 from typesense.types.conversations_model import (
     ConversationModelCreateSchema,
     ConversationModelSchema,
@@ -53,8 +54,8 @@ class ConversationsModels(object):
     Attributes:
         resource_path (str): The API resource path for conversation models operations.
         api_call (ApiCall): The API call object for making requests.
-        conversations_models (Dict[str, ConversationModel]):
-            A dictionary of ConversationModel objects.
+        conversations_models (HandleCache[str, ConversationModel]):
+            A bounded cache of ConversationModel objects.
     """
 
     resource_path: typing.Final[str] = "/conversations/models"
@@ -67,7 +68,9 @@ class ConversationsModels(object):
             api_call (ApiCall): The API call object for making requests.
         """
         self.api_call = api_call
-        self.conversations_models: typing.Dict[str, ConversationModel] = {}
+        self.conversations_models: HandleCache[str, ConversationModel] = HandleCache(
+            api_call.config.handle_cache_size,
+        )
 
     def __getitem__(self, model_id: str) -> ConversationModel:
         """
@@ -79,12 +82,10 @@ class ConversationsModels(object):
         Returns:
             ConversationModel: The ConversationModel object for the given ID.
         """
-        if model_id not in self.conversations_models:
-            self.conversations_models[model_id] = ConversationModel(
-                self.api_call,
-                model_id,
-            )
-        return self.conversations_models[model_id]
+        return self.conversations_models.get_or_create(
+            model_id,
+            lambda: ConversationModel(self.api_call, model_id),
+        )
 
     def create(self, model: ConversationModelCreateSchema) -> ConversationModelSchema:
         """
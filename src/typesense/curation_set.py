@@ -19,6 +19,8 @@ from typesense.types.curation_set import (
 
 
 class CurationSet:
+    __slots__ = ("api_call", "name")
+
     def __init__(self, api_call: ApiCall, name: str) -> None:
         self.api_call = api_call
         self.name = name
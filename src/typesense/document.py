@@ -22,6 +22,8 @@ versions through the use of the typing_extensions library.
 import sys
 
 from typesense.api_call import ApiCall
+from typesense.model_decoder import model_decoder
+from typesense.request_handler import RawResponse
 from typesense.types.document import (
     DeleteSingleDocumentParameters,
     DirtyValuesParameters,
@@ -48,13 +50,17 @@ class Document(typing.Generic[TDoc]):
         api_call (ApiCall): The API call object for making requests.
         collection_name (str): The name of the collection.
         document_id (str): The ID of the document.
+        model (Union[type, None]): The model class the document is decoded into.
     """
 
+    __slots__ = ("api_call", "collection_name", "document_id", "model")
+
     def __init__(
         self,
         api_call: ApiCall,
         collection_name: str,
         document_id: str,
+        model: typing.Union[typing.Type[TDoc], None] = None,
     ) -> None:
         """
         Initialize the Document object.
@@ -63,21 +69,65 @@ class Document(typing.Generic[TDoc]):
             api_call (ApiCall): The API call object for making requests.
             collection_name (str): The name of the collection.
             document_id (str): The ID of the document.
+            model (Union[Type[TDoc], None], optional): The model class the document
+                is decoded into. TypedDict models leave it as a dictionary.
         """
         self.api_call = api_call
         self.collection_name = collection_name
         self.document_id = document_id
+        self.model = model
 
+    @typing.overload
     def retrieve(
         self,
         retrieve_parameters: typing.Union[RetrieveParameters, None] = None,
-    ) -> TDoc:
+        raw: typing.Literal[False] = False,
+    ) -> TDoc: ...
+
+    @typing.overload
+    def retrieve(
+        self,
+        retrieve_parameters: typing.Union[RetrieveParameters, None] = None,
+        *,
+        raw: typing.Literal[True],
+    ) -> RawResponse: ...
+
+    def retrieve(
+        self,
+        retrieve_parameters: typing.Union[RetrieveParameters, None] = None,
+        raw: bool = False,
+    ) -> typing.Union[TDoc, RawResponse]:
         """
         Retrieve this specific document.
 
+        Args:
+            retrieve_parameters (Union[RetrieveParameters, None], optional):
+                Parameters for the retrieval.
+            raw (bool): Whether to return the undecoded response body and content
+                type, e.g. to proxy it unchanged. Defaults to False.
+
         Returns:
-            TDoc: The retrieved document.
+            Union[TDoc, RawResponse]: The retrieved document, decoded into the model
+                if one is set, or its undecoded body if raw is set.
+
+        Raises:
+            DocumentDecodeError: If the document does not match the model.
         """
+        decode_into_model = (
+            self.model is not None and not model_decoder(self.model).passthrough
+        )
+        if raw or decode_into_model:
+            raw_response = self.api_call.get(
+                endpoint=self._endpoint_path,
+                entity_type=typing.Dict[str, str],
+                params=retrieve_parameters,
+                raw=True,
+            )
+            if raw:
+                return raw_response
+            return model_decoder(typing.cast(typing.Type[TDoc], self.model)).decode_json(
+                raw_response["content"],
+            )
         response: TDoc = self.api_call.get(
             endpoint=self._endpoint_path,
             entity_type=typing.Dict[str, str],
@@ -14,9 +14,14 @@ Methods:
     - update: Updates a document in the collection.
     - import_jsonl: (Deprecated) Imports documents from a JSONL string.
     - import_: Imports documents into the collection.
+    - import_table: Imports the rows of a pandas DataFrame or Arrow table.
     - export: Exports documents from the collection.
+    - export_documents: Exports documents decoded into the collection's model.
+    - get_many: Fetches documents by their ids in a few batched searches.
     - search: Searches for documents in the collection.
+    - vector_search_many: Searches the nearest neighbours of many query vectors.
     - delete: Deletes documents from the collection based on given parameters.
+    - delete_many: Deletes documents by their ids with concurrent, chunked deletes.
 
 Attributes:
     - resource_path: The API resource path for document operations.
@@ -29,14 +34,24 @@ This module uses type hinting and is compatible with Python 3.11+ as well as ear
 versions through the use of the typing_extensions library.
 """
 
+import functools
 import json
 import sys
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
 from typesense.api_call import ApiCall
 from typesense.document import Document
-from typesense.exceptions import TypesenseClientError
+from typesense.exceptions import InvalidParameter, TypesenseClientError
+from typesense.handle_cache import HandleCache
+from typesense.hit_columns import ColumnFormat, hit_columns
 from typesense.logger import logger
-from typesense.preprocess import stringify_search_params
+from typesense.model_decoder import ModelDecoder, model_decoder
+from typesense.preprocess import StringifiedSearchParams, stringify_search_params
+from typesense.request_handler import RawResponse, RequestHandler
+from typesense.response_view import ResponseView, as_view
+from typesense.schema_validator import SchemaValidator
+from typesense.serialization import dumps, dumps_table, vector_queries
 from typesense.types.document import (
     DeleteQueryParameters,
     DeleteResponse,
@@ -48,17 +63,21 @@ from typesense.types.document import (
     DocumentImportParametersReturnId,
     DocumentSchema,
     DocumentWriteParameters,
+    GetManyResponse,
     ImportResponse,
     ImportResponseFail,
     ImportResponseSuccess,
     ImportResponseWithDoc,
     ImportResponseWithDocAndId,
     ImportResponseWithId,
+    MultiSearchCommonParameters,
     SearchParameters,
     SearchResponse,
     UpdateByFilterParameters,
     UpdateByFilterResponse,
+    VectorSearchArrays,
 )
+from typesense.types.multi_search import MultiSearchResponse
 
 # mypy: disable-error-code="misc"
 
@@ -75,6 +94,21 @@ _ImportParameters = typing.Union[
     None,
 ]
 
+_MAX_PER_PAGE: typing.Final[int] = 250
+"""The largest page of hits Typesense returns."""
+
+_GET_MANY_CHUNK_SIZE: typing.Final[int] = _MAX_PER_PAGE
+"""The ids fetched by each search, the largest page Typesense returns."""
+
+_SEARCHES_PER_MULTI_SEARCH: typing.Final[int] = 50
+"""The searches sent per multi-search, Typesense's default `limit_multi_searches`."""
+
+_PARTIAL_ACTIONS: typing.Final[typing.FrozenSet[str]] = frozenset(("update", "emplace"))
+"""The import actions whose documents may only hold the fields to change."""
+
+_DELETE_MANY_FILTER_LENGTH: typing.Final[int] = 2000
+"""The longest URL-encoded id filter of a delete, keeping its URL within limits."""
+
 
 class Documents(typing.Generic[TDoc]):
     """
@@ -87,7 +121,18 @@ class Documents(typing.Generic[TDoc]):
         resource_path (str): The API resource path for document operations.
         api_call (ApiCall): The API call object for making requests.
         collection_name (str): The name of the collection.
-        documents (Dict[str, Document[TDoc]]): A dictionary of Document objects.
+        documents (HandleCache[str, Document[TDoc]]):
+            A bounded cache of Document objects.
+        model (Union[type, None]): The model of the documents, set by
+            `Client.typed_collection`. Search hits, retrieved documents and exports
+            are decoded into it, unless it is a TypedDict.
+        validator (Union[SchemaValidator, None]): Checks imported documents against
+            the collection schema, set by `Collection.enable_validation`. Invalid
+            documents are reported as failed without being sent.
+        validator_owner (Union[Callable[[], Documents[Any]], None]): Gets the
+            documents whose validator these documents use and set, as the typed
+            collections of `Client.typed_collection` share the validator of
+            `client.collections[name]`.
     """
 
     resource_path: typing.Final[str] = "documents"
@@ -102,7 +147,42 @@ class Documents(typing.Generic[TDoc]):
         """
         self.api_call = api_call
         self.collection_name = collection_name
-        self.documents: typing.Dict[str, Document[TDoc]] = {}
+        self.documents: HandleCache[str, Document[TDoc]] = HandleCache(
+            api_call.config.handle_cache_size,
+        )
+        self.model: typing.Union[typing.Type[TDoc], None] = None
+        self.validator_owner: typing.Union[
+            typing.Callable[[], "Documents[typing.Any]"],
+            None,
+        ] = None
+        self._validator: typing.Union[SchemaValidator, None] = None
+
+    @property
+    def validator(self) -> typing.Union[SchemaValidator, None]:
+        """
+        Get the validator checking imported documents, if validation is enabled.
+
+        Returns:
+            Union[SchemaValidator, None]: The validator of the validator owner, if
+                any, or of these documents.
+        """
+        if self.validator_owner is not None:
+            return self.validator_owner().validator
+        return self._validator
+
+    @validator.setter
+    def validator(self, validator: typing.Union[SchemaValidator, None]) -> None:
+        """
+        Set the validator checking imported documents.
+
+        Args:
+            validator (Union[SchemaValidator, None]): The validator, or None to
+                disable validation. It is set on the validator owner, if any.
+        """
+        if self.validator_owner is not None:
+            self.validator_owner().validator = validator
+        else:
+            self._validator = validator
 
     def __getitem__(self, document_id: str) -> Document[TDoc]:
         """
@@ -114,14 +194,15 @@ class Documents(typing.Generic[TDoc]):
         Returns:
             Document[TDoc]: The Document object for the given ID.
         """
-        if document_id not in self.documents:
-            self.documents[document_id] = Document(
+        return self.documents.get_or_create(
+            document_id,
+            lambda: Document(
                 self.api_call,
                 self.collection_name,
                 document_id,
-            )
-
-        return self.documents[document_id]
+                self.model,
+            ),
+        )
 
     def create(
         self,
@@ -319,6 +400,52 @@ class Documents(typing.Generic[TDoc]):
 
         return self._bulk_import(documents, import_parameters)
 
+    def import_table(
+        self,
+        table: typing.Any,
+        import_parameters: _ImportParameters = None,
+        batch_rows: int = 1000,
+    ) -> ImportResponse[TDoc]:
+        """
+        Import the rows of a pandas DataFrame or Arrow table as documents.
+
+        The rows are serialized to JSONL column by column, without building a
+        document per row, and imported batch by batch; each batch is serialized
+        while the previous one is being imported. The documents are not checked
+        by the validator.
+
+        Args:
+            table (Any): The table, a pandas DataFrame or a `pyarrow.Table` or
+                `pyarrow.RecordBatch`. Missing values are left out of the documents.
+            import_parameters (Union[DocumentImportParameters, None], optional):
+                Parameters for the import operation.
+            batch_rows (int): The number of rows imported per request.
+
+        Returns:
+            ImportResponse[TDoc]: The import response of each row, in order.
+
+        Raises:
+            TypesenseClientError: If one of the imports fails.
+        """
+        response_objs: ImportResponse[TDoc] = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending_import = None
+            for documents_jsonl in dumps_table(
+                table,
+                batch_rows,
+                self.api_call.config.float_precision,
+            ):
+                if pending_import is not None:
+                    response_objs.extend(pending_import.result())
+                pending_import = executor.submit(
+                    self._import_table_batch,
+                    documents_jsonl,
+                    import_parameters,
+                )
+            if pending_import is not None:
+                response_objs.extend(pending_import.result())
+        return response_objs
+
     def export(
         self,
         export_parameters: typing.Union[DocumentExportParameters, None] = None,
@@ -341,25 +468,333 @@ class Documents(typing.Generic[TDoc]):
         )
         return api_response
 
-    def search(self, search_parameters: SearchParameters) -> SearchResponse[TDoc]:
+    def export_documents(
+        self,
+        export_parameters: typing.Union[DocumentExportParameters, None] = None,
+    ) -> typing.List[TDoc]:
+        """
+        Export documents from the collection, decoded into the model if one is set.
+
+        Args:
+            export_parameters (Union[DocumentExportParameters, None], optional):
+                Parameters for the export operation.
+
+        Returns:
+            List[TDoc]: The exported documents.
+
+        Raises:
+            DocumentDecodeError: If a document does not match the model.
+        """
+        exported_documents: typing.List[TDoc] = self._decoder.decode_jsonl(
+            self.export(export_parameters),
+        )
+        return exported_documents
+
+    def get_many(
+        self,
+        document_ids: typing.Iterable[str],
+        include_fields: typing.Union[str, typing.List[str], None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+        max_concurrency: int = 4,
+    ) -> GetManyResponse[TDoc]:
+        """
+        Fetch documents by their ids in a few batched searches.
+
+        The ids are split into `id:[...]` filters of up to 250 ids each, sent
+        together as multi-searches of up to 50 searches, instead of retrieving
+        every document with its own request. Up to `max_concurrency` of these
+        multi-searches run at a time.
+
+        Args:
+            document_ids (Iterable[str]): The ids of the documents.
+            include_fields (Union[str, List[str], None], optional): The fields to
+                include in the documents. The id is always included.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for each multi-search, including retries.
+            max_concurrency (int): The maximum number of multi-searches in flight.
+
+        Returns:
+            GetManyResponse[TDoc]: The documents in the order of the ids, with None
+                for the ids that were not found, and the ids that were not found.
+                The documents are decoded into the model, if one is set.
+
+        Raises:
+            InvalidParameter: If an id contains a backtick, which id filters cannot
+                quote.
+            TypesenseClientError: If one of the searches fails.
+            DocumentDecodeError: If a document does not match the model.
+        """
+        document_ids = list(document_ids)
+        unique_ids = list(dict.fromkeys(document_ids))
+        searches = [
+            self._get_many_search(
+                unique_ids[chunk_start : chunk_start + _GET_MANY_CHUNK_SIZE],
+                include_fields,
+            )
+            for chunk_start in range(0, len(unique_ids), _GET_MANY_CHUNK_SIZE)
+        ]
+
+        batches = [
+            searches[batch_start : batch_start + _SEARCHES_PER_MULTI_SEARCH]
+            for batch_start in range(0, len(searches), _SEARCHES_PER_MULTI_SEARCH)
+        ]
+
+        found_documents: typing.Dict[str, TDoc] = {}
+        if batches:
+            with ThreadPoolExecutor(
+                max_workers=min(max_concurrency, len(batches)),
+            ) as executor:
+                responses = executor.map(
+                    functools.partial(
+                        self._multi_search,
+                        deadline_seconds=deadline_seconds,
+                    ),
+                    batches,
+                )
+                for response in responses:
+                    for search_result in response["results"]:
+                        self._collect_found_documents(search_result, found_documents)
+
+        return GetManyResponse(
+            documents=[
+                found_documents.get(document_id) for document_id in document_ids
+            ],
+            missing=[
+                document_id
+                for document_id in unique_ids
+                if document_id not in found_documents
+            ],
+        )
+
+    @typing.overload
+    def search(
+        self,
+        search_parameters: typing.Union[SearchParameters, StringifiedSearchParams],
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: typing.Literal[False] = False,
+        typed: typing.Literal[False] = False,
+    ) -> SearchResponse[TDoc]: ...
+
+    @typing.overload
+    def search(
+        self,
+        search_parameters: typing.Union[SearchParameters, StringifiedSearchParams],
+        deadline_seconds: typing.Union[float, None] = None,
+        *,
+        raw: typing.Literal[True],
+    ) -> RawResponse: ...
+
+    @typing.overload
+    def search(
+        self,
+        search_parameters: typing.Union[SearchParameters, StringifiedSearchParams],
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: typing.Literal[False] = False,
+        *,
+        typed: typing.Literal[True],
+    ) -> ResponseView: ...
+
+    @typing.overload
+    def search(
+        self,
+        search_parameters: typing.Union[SearchParameters, StringifiedSearchParams],
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: typing.Literal[False] = False,
+        typed: typing.Literal[False] = False,
+        *,
+        columnar: ColumnFormat,
+        column_fields: typing.Sequence[str] = (),
+    ) -> typing.Any: ...
+
+    def search(
+        self,
+        search_parameters: typing.Union[SearchParameters, StringifiedSearchParams],
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: bool = False,
+        typed: bool = False,
+        columnar: typing.Union[ColumnFormat, None] = None,
+        column_fields: typing.Sequence[str] = (),
+    ) -> typing.Union[SearchResponse[TDoc], RawResponse, ResponseView, typing.Any]:
         """
         Search for documents in the collection.
 
         Args:
-            search_parameters (SearchParameters): The search parameters.
+            search_parameters (Union[SearchParameters, StringifiedSearchParams]):
+                The search parameters, or the parameters bound from a PreparedSearch.
+            deadline_seconds (Union[float, None], optional):
+                End-to-end budget for the search, including retries.
+            raw (bool): Whether to return the undecoded response body and content
+                type, e.g. to proxy it unchanged. Defaults to False.
+            typed (bool): Whether to return a view of the response exposing its
+                fields as attributes, wrapping hits, highlights and facet counts
+                only when they are read. Defaults to False.
+            columnar (Union[ColumnFormat, None], optional): Whether to return the
+                ids, scores and `column_fields` of the hits as NumPy arrays or an
+                Arrow table, gathered in one pass over the hits. Requires NumPy or
+                pyarrow.
+            column_fields (Sequence[str]): The document fields gathered along the
+                ids and scores when columnar is set.
 
         Returns:
-            SearchResponse[TDoc]: The search response containing matching documents.
+            Union[SearchResponse[TDoc], RawResponse, ResponseView, Any]: The search
+                response containing matching documents, its undecoded body if raw
+                is set, a view of it if typed is set, or the columns of its hits if
+                columnar is set. The documents of the hits are decoded into the
+                model, if one is set.
+
+        Raises:
+            DocumentDecodeError: If a document does not match the model.
         """
         stringified_search_params = stringify_search_params(search_parameters)
+        if self.api_call.search_canonicalizer is not None:
+            stringified_search_params = self.api_call.search_canonicalizer.canonicalize(
+                stringified_search_params,
+                scope=self.collection_name,
+            )
+        if raw:
+            return self.api_call.get(
+                self._endpoint_path("search"),
+                params=stringified_search_params,
+                entity_type=SearchResponse,
+                deadline_seconds=deadline_seconds,
+                raw=True,
+            )
         response: SearchResponse[TDoc] = self.api_call.get(
             self._endpoint_path("search"),
             params=stringified_search_params,
             entity_type=SearchResponse,
             as_json=True,
+            deadline_seconds=deadline_seconds,
         )
+        if columnar is not None:
+            return hit_columns([response], column_fields, columnar)
+        if typed:
+            return as_view(SearchResponse, response, self.model)
+        if not self._decoder.passthrough:
+            self._decode_hits(response)
         return response
 
+    @typing.overload
+    def vector_search_many(
+        self,
+        embeddings: typing.Union[typing.Sequence[typing.Sequence[float]], typing.Any],
+        field_name: str,
+        k: int = 10,
+        common_params: typing.Union[MultiSearchCommonParameters, None] = None,
+        max_concurrency: int = 4,
+        deadline_seconds: typing.Union[float, None] = None,
+        as_numpy: typing.Literal[False] = False,
+    ) -> typing.List[SearchResponse[TDoc]]: ...
+
+    @typing.overload
+    def vector_search_many(
+        self,
+        embeddings: typing.Union[typing.Sequence[typing.Sequence[float]], typing.Any],
+        field_name: str,
+        k: int = 10,
+        common_params: typing.Union[MultiSearchCommonParameters, None] = None,
+        max_concurrency: int = 4,
+        deadline_seconds: typing.Union[float, None] = None,
+        *,
+        as_numpy: typing.Literal[True],
+    ) -> VectorSearchArrays: ...
+
+    def vector_search_many(
+        self,
+        embeddings: typing.Union[typing.Sequence[typing.Sequence[float]], typing.Any],
+        field_name: str,
+        k: int = 10,
+        common_params: typing.Union[MultiSearchCommonParameters, None] = None,
+        max_concurrency: int = 4,
+        deadline_seconds: typing.Union[float, None] = None,
+        as_numpy: bool = False,
+    ) -> typing.Union[typing.List[SearchResponse[TDoc]], VectorSearchArrays]:
+        """
+        Search the nearest neighbours of many query vectors.
+
+        The vector queries of all the embeddings are formatted in one pass, split
+        into multi-searches of up to 50 searches, and up to `max_concurrency` of
+        these multi-searches run at a time.
+
+        Args:
+            embeddings (Union[Sequence[Sequence[float]], Any]): The query vectors,
+                as sequences of floats or the rows of a two-dimensional NumPy array.
+            field_name (str): The name of the vector field.
+            k (int): The number of nearest neighbours of each query vector, at
+                most 250, the largest page of hits Typesense returns.
+            common_params (Union[MultiSearchCommonParameters, None], optional):
+                Parameters shared by the searches, such as `filter_by` or
+                `exclude_fields`. The query is `*` unless `q` is set.
+            max_concurrency (int): The maximum number of multi-searches in flight.
+            deadline_seconds (Union[float, None], optional): End-to-end budget
+                for each multi-search, including retries.
+            as_numpy (bool): Whether to return the ids and vector distances of the
+                hits as NumPy arrays instead of the search responses. Requires
+                NumPy. Defaults to False.
+
+        Returns:
+            Union[List[SearchResponse[TDoc]], VectorSearchArrays]: The search
+                response of each query vector, in the order of the embeddings,
+                or the ids and distances of their hits as arrays of shape (N, k)
+                if as_numpy is set. The documents of the hits are decoded into the
+                model, if one is set.
+
+        Raises:
+            InvalidParameter: If k is larger than a page of hits can be.
+            ValueError: If the embeddings are a NumPy array that is not
+                two-dimensional.
+            TypesenseClientError: If one of the searches fails.
+            DocumentDecodeError: If a document does not match the model.
+        """
+        if k > _MAX_PER_PAGE:
+            raise InvalidParameter(
+                f"k is {k}, but searches return at most {_MAX_PER_PAGE} hits.",
+            )
+        search_query = {} if common_params and "q" in common_params else {"q": "*"}
+        searches = [
+            {
+                "collection": self.collection_name,
+                **search_query,
+                "vector_query": vector_query,
+                "per_page": k,
+            }
+            for vector_query in vector_queries(
+                field_name,
+                embeddings,
+                self.api_call.config.float_precision,
+                k=k,
+            )
+        ]
+        batches = [
+            searches[batch_start : batch_start + _SEARCHES_PER_MULTI_SEARCH]
+            for batch_start in range(0, len(searches), _SEARCHES_PER_MULTI_SEARCH)
+        ]
+
+        search_results: typing.List[SearchResponse[TDoc]] = []
+        if batches:
+            with ThreadPoolExecutor(
+                max_workers=min(max_concurrency, len(batches)),
+            ) as executor:
+                responses = executor.map(
+                    functools.partial(
+                        self._multi_search,
+                        common_params=common_params,
+                        deadline_seconds=deadline_seconds,
+                    ),
+                    batches,
+                )
+                for response in responses:
+                    search_results.extend(response["results"])
+        for search_result in search_results:
+            RequestHandler.raise_for_search_result(search_result)
+
+        if as_numpy:
+            return _vector_search_arrays(search_results, k)
+        if not self._decoder.passthrough:
+            for search_result in search_results:
+                self._decode_hits(search_result)
+        return search_results
+
     def delete(
         self,
         delete_parameters: typing.Union[DeleteQueryParameters, None] = None,
@@ -381,6 +816,112 @@ class Documents(typing.Generic[TDoc]):
         )
         return response
 
+    def delete_many(
+        self,
+        document_ids: typing.Iterable[str],
+        max_concurrency: int = 4,
+        batch_size: typing.Union[int, None] = None,
+    ) -> DeleteResponse:
+        """
+        Delete documents by their ids with concurrent, chunked deletes.
+
+        The ids are split into `id:[...]` filters short enough for the request URL,
+        and up to `max_concurrency` of these deletes run at a time.
+
+        Args:
+            document_ids (Iterable[str]): The ids of the documents.
+            max_concurrency (int): The maximum number of deletes in flight.
+            batch_size (Union[int, None], optional): The number of documents the
+                server deletes per batch of each delete.
+
+        Returns:
+            DeleteResponse: The total number of documents deleted.
+
+        Raises:
+            TypesenseClientError: If one of the deletes fails.
+        """
+        delete_parameters = [
+            DeleteQueryParameters(filter_by=id_filter)
+            for id_filter in _chunked_id_filters(
+                dict.fromkeys(document_ids),
+                _DELETE_MANY_FILTER_LENGTH,
+            )
+        ]
+        if batch_size is not None:
+            for chunk_parameters in delete_parameters:
+                chunk_parameters["batch_size"] = batch_size
+        if not delete_parameters:
+            return DeleteResponse(num_deleted=0)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(delete_parameters)),
+        ) as executor:
+            responses = list(executor.map(self.delete, delete_parameters))
+        return DeleteResponse(
+            num_deleted=sum(response["num_deleted"] for response in responses),
+        )
+
+    @property
+    def _decoder(self) -> ModelDecoder[TDoc]:
+        """Get the decoder of the documents' model."""
+        return model_decoder(self.model or typing.cast(typing.Type[TDoc], dict))
+
+    def _decode_hits(self, response: SearchResponse[TDoc]) -> None:
+        """Decode the documents of the hits in a search response into the model."""
+        hits = list(response.get("hits", []))
+        for grouped_hit in response.get("grouped_hits", []):
+            hits.extend(grouped_hit["hits"])
+        for hit in hits:
+            hit["document"] = self._decoder.decode(hit["document"])
+
+    def _multi_search(
+        self,
+        searches: typing.List[typing.Dict[str, typing.Union[str, int]]],
+        common_params: typing.Union[MultiSearchCommonParameters, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+    ) -> MultiSearchResponse:
+        """Send a batch of searches of the collection as one multi-search."""
+        response: MultiSearchResponse = self.api_call.post(
+            "/multi_search",
+            body={"searches": searches},
+            params=common_params,
+            entity_type=MultiSearchResponse,
+            as_json=True,
+            deadline_seconds=deadline_seconds,
+        )
+        return response
+
+    def _get_many_search(
+        self,
+        document_ids: typing.List[str],
+        include_fields: typing.Union[str, typing.List[str], None],
+    ) -> typing.Dict[str, typing.Union[str, int]]:
+        """Build the search fetching a chunk of documents by their ids."""
+        search: typing.Dict[str, typing.Union[str, int]] = {
+            "collection": self.collection_name,
+            "q": "*",
+            "filter_by": _id_filter(document_ids),
+            "per_page": len(document_ids),
+        }
+        if include_fields:
+            if isinstance(include_fields, str):
+                include_fields = include_fields.split(",")
+            search["include_fields"] = ",".join(
+                dict.fromkeys(["id", *(field.strip() for field in include_fields)]),
+            )
+        return search
+
+    def _collect_found_documents(
+        self,
+        search_result: typing.Mapping[str, typing.Any],
+        found_documents: typing.Dict[str, TDoc],
+    ) -> None:
+        """Add the documents of a search result to the found documents by id."""
+        RequestHandler.raise_for_search_result(search_result)
+        for hit in search_result.get("hits", []):
+            document = hit["document"]
+            found_documents[str(document["id"])] = self._decoder.decode(document)
+
     def _endpoint_path(self, action: typing.Union[str, None] = None) -> str:
         """
         Construct the API endpoint path for document operations.
@@ -419,6 +960,16 @@ class Documents(typing.Generic[TDoc]):
 
         return response
 
+    def _import_table_batch(
+        self,
+        documents_jsonl: str,
+        import_parameters: _ImportParameters,
+    ) -> ImportResponse[TDoc]:
+        """Import a batch of serialized table rows."""
+        return self._parse_import_response(
+            self._import_raw(documents_jsonl.encode(), import_parameters),
+        )
+
     def _batch_import(
         self,
         documents: typing.List[TDoc],
@@ -439,7 +990,20 @@ class Documents(typing.Generic[TDoc]):
         import_parameters: _ImportParameters,
     ) -> ImportResponse[TDoc]:
         """Import a list of documents in bulk."""
-        document_strs = [json.dumps(doc) for doc in documents]
+        failures: typing.Dict[int, ImportResponseFail[TDoc]] = {}
+        validator = self.validator
+        if validator is not None:
+            write_parameters = import_parameters or {}
+            documents, failures = validator.partition(
+                documents,
+                partial=write_parameters.get("action") in _PARTIAL_ACTIONS,
+                dirty_values=write_parameters.get("dirty_values"),
+            )
+            if failures and not documents:
+                return list(failures.values())
+
+        float_precision = self.api_call.config.float_precision
+        document_strs = [dumps(doc, float_precision) for doc in documents]
         if not document_strs:
             raise TypesenseClientError("Cannot import an empty list of documents.")
 
@@ -451,7 +1015,10 @@ class Documents(typing.Generic[TDoc]):
             entity_type=str,
             as_json=False,
         )
-        return self._parse_import_response(res)
+        response_objs = self._parse_import_response(res)
+        if failures:
+            return _with_failures(response_objs, failures)
+        return response_objs
 
     def _parse_import_response(self, response: str) -> ImportResponse[TDoc]:
         """Parse the import response string into a list of response objects."""
@@ -465,3 +1032,86 @@ class Documents(typing.Generic[TDoc]):
                 ) from decode_error
             response_objs.append(res_obj_json)
         return response_objs
+
+
+def _with_failures(
+    response_objs: ImportResponse[TDoc],
+    failures: typing.Dict[int, ImportResponseFail[TDoc]],
+) -> ImportResponse[TDoc]:
+    """Insert the failures of invalid documents at their positions in the response."""
+    sent_responses = iter(response_objs)
+    return [
+        failures[document_index]
+        if document_index in failures
+        else next(sent_responses)
+        for document_index in range(len(response_objs) + len(failures))
+    ]
+
+
+def _vector_search_arrays(
+    search_results: typing.Sequence[typing.Mapping[str, typing.Any]],
+    k: int,
+) -> VectorSearchArrays:
+    """Gather the ids and vector distances of the hits of searches into arrays."""
+    import numpy  # noqa: WPS433
+
+    ids = numpy.full((len(search_results), k), None, dtype=object)
+    distances = numpy.full((len(search_results), k), numpy.nan)
+    for row_index, search_result in enumerate(search_results):
+        hits = search_result.get("hits", [])[:k]
+        ids[row_index, : len(hits)] = [hit["document"]["id"] for hit in hits]
+        distances[row_index, : len(hits)] = [
+            hit.get("vector_distance", numpy.nan) for hit in hits
+        ]
+    return VectorSearchArrays(ids=ids, distances=distances)
+
+
+def _id_filter(document_ids: typing.Iterable[str]) -> str:
+    """
+    Build the filter matching the documents with the given ids.
+
+    Raises:
+        InvalidParameter: If an id contains a backtick, which filters cannot quote.
+    """
+    quoted_ids = ",".join(_quoted_id(document_id) for document_id in document_ids)
+    return f"id:[{quoted_ids}]"
+
+
+def _quoted_id(document_id: str) -> str:
+    """Quote an id for a filter, rejecting the backticks that would end the quote."""
+    if "`" in document_id:
+        raise InvalidParameter(
+            f"Document id {document_id!r} contains a backtick, "
+            + "which filters cannot quote.",
+        )
+    return f"`{document_id}`"
+
+
+def _chunked_id_filters(
+    document_ids: typing.Iterable[str],
+    max_length: int,
+) -> typing.Iterator[str]:
+    """
+    Split ids into id filters of at most `max_length` characters once URL-encoded.
+
+    Ids of non-ASCII or reserved characters take up to nine times their length in
+    the query string of the request, so the encoded length is what is bounded.
+    """
+    empty_filter_length = _encoded_length(_id_filter(()))
+    chunk: typing.List[str] = []
+    chunk_length = empty_filter_length
+    for document_id in document_ids:
+        quoted_id_length = _encoded_length(f"{_quoted_id(document_id)},")
+        if chunk and chunk_length + quoted_id_length > max_length:
+            yield _id_filter(chunk)
+            chunk = []
+            chunk_length = empty_filter_length
+        chunk.append(document_id)
+        chunk_length += quoted_id_length
+    if chunk:
+        yield _id_filter(chunk)
+
+
+def _encoded_length(query_value: str) -> int:
+    """Get the length of a value once encoded in the query string of a URL."""
+    return len(urllib.parse.quote_plus(query_value))
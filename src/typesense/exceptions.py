@@ -15,6 +15,8 @@ Classes:
     - ServiceUnavailable: Raised when the service is unavailable.
     - HTTPStatus0Error: Raised when the HTTP status code is 0.
     - InvalidParameter: Raised when a parameter is invalid.
+    - ConcurrencyLimitExceeded: Raised when a request is shed by the concurrency limiter.
+    - DocumentDecodeError: Raised when a document does not match its model.
 
 These exception classes provide specific error types for various scenarios
 that may occur when interacting with the Typesense API.
@@ -79,3 +81,11 @@ class HTTPStatus0Error(TypesenseClientError):
 
 class InvalidParameter(TypesenseClientError):
     """Raised when a parameter is invalid."""
+
+
+class ConcurrencyLimitExceeded(TypesenseClientError):
+    """Raised when a request is shed by the client-side concurrency limiter."""
+
+
+class DocumentDecodeError(TypesenseClientError):
+    """Raised when a document cannot be decoded into its model class."""
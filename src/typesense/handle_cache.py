@@ -0,0 +1,158 @@
+"""
+This module provides a bounded cache for resource handles.
+
+Resource classes such as Collections and Documents hand out a handle object (e.g. a
+Document) for every id accessed through `__getitem__` and keep it for reuse. The
+HandleCache class keeps only the most recently used handles, so a long-running process
+touching millions of ids keeps a flat memory footprint. Handles holding state that
+cannot be rebuilt from their id, such as a collection with a schema validator, can be
+pinned so that they are never evicted. The locks of the caches are replaced in
+processes created with `os.fork`, as another thread may have held one during the fork.
+
+Classes:
+    HandleCache: A least-recently-used mapping of resource ids to handles.
+
+Note: This module is part of the Typesense Python client library and is used internally
+by other components of the library.
+"""
+
+import os
+import sys
+import threading
+import weakref
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+TKey = typing.TypeVar("TKey")
+THandle = typing.TypeVar("THandle")
+
+DEFAULT_HANDLE_CACHE_SIZE: typing.Final[int] = 1024
+
+# Keyed by id, as caches are dicts and cannot be hashed into a WeakSet.
+_handle_caches: "weakref.WeakValueDictionary[int, HandleCache[typing.Any, typing.Any]]"
+_handle_caches = weakref.WeakValueDictionary()
+
+
+class HandleCache(typing.OrderedDict[TKey, THandle]):
+    """
+    A least-recently-used mapping of resource ids to handles.
+
+    Reading or writing a handle marks it as most recently used; once the cache
+    holds more than `max_size` handles, the least recently used unpinned ones are
+    evicted. Reads and writes are serialized by a lock, as threads sharing a client
+    share its handle caches.
+
+    Attributes:
+        max_size (int): The maximum number of handles kept, unless more are pinned.
+        is_pinned (Union[Callable[[THandle], bool], None]): Tells whether a handle
+            holds state and must not be evicted.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_HANDLE_CACHE_SIZE,
+        is_pinned: typing.Union[typing.Callable[[THandle], bool], None] = None,
+    ) -> None:
+        """
+        Initialize the HandleCache.
+
+        Args:
+            max_size (int): The maximum number of handles kept, unless more are pinned.
+            is_pinned (Union[Callable[[THandle], bool], None]): Tells whether a
+                handle holds state and must not be evicted.
+        """
+        super().__init__()
+        self.max_size = max_size
+        self.is_pinned = is_pinned
+        self._lock = threading.Lock()
+        _handle_caches[id(self)] = self
+
+    def get_or_create(
+        self,
+        key: TKey,
+        create_handle: typing.Callable[[], THandle],
+    ) -> THandle:
+        """
+        Get the handle of a key, creating and storing it first if it is missing.
+
+        The lookup and the creation happen under the lock, so threads asking for
+        the same key get the same handle, and the handle is returned even if it is
+        evicted right away.
+
+        Args:
+            key (TKey): The resource id.
+            create_handle (Callable[[], THandle]): Creates the handle of the key.
+
+        Returns:
+            THandle: The cached or newly created handle.
+        """
+        with self._lock:
+            if key in self:
+                handle = super().__getitem__(key)
+                self.move_to_end(key)
+            else:
+                handle = create_handle()
+                self._store(key, handle)
+        return handle
+
+    def __getitem__(self, key: TKey) -> THandle:
+        """
+        Get a handle and mark it as most recently used.
+
+        Args:
+            key (TKey): The resource id.
+
+        Returns:
+            THandle: The cached handle.
+        """
+        with self._lock:
+            handle = super().__getitem__(key)
+            self.move_to_end(key)
+        return handle
+
+    def __setitem__(self, key: TKey, handle: THandle) -> None:
+        """
+        Store a handle and evict the least recently used ones beyond `max_size`.
+
+        Args:
+            key (TKey): The resource id.
+            handle (THandle): The handle to cache.
+        """
+        with self._lock:
+            self._store(key, handle)
+
+    def reset_after_fork(self) -> None:
+        """Replace the lock, which another thread may have held during a fork."""
+        self._lock = threading.Lock()
+
+    def _store(self, key: TKey, handle: THandle) -> None:
+        """Store a handle as most recently used and evict beyond `max_size`."""
+        super().__setitem__(key, handle)
+        self.move_to_end(key)
+        self._evict()
+
+    def _evict(self) -> None:
+        """Evict the least recently used unpinned handles beyond `max_size`."""
+        excess = len(self) - self.max_size
+        for _ in range(len(self)):
+            if excess <= 0:
+                return
+            oldest_key, oldest_handle = next(iter(self.items()))
+            if self.is_pinned is not None and self.is_pinned(oldest_handle):
+                self.move_to_end(oldest_key)
+            else:
+                self.popitem(last=False)
+                excess -= 1
+
+
+def _reset_after_fork() -> None:
+    """Replace the locks of every HandleCache in a forked child."""
+    for handle_cache in list(_handle_caches.values()):
+        handle_cache.reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
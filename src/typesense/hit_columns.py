@@ -0,0 +1,173 @@
+"""
+This module gathers the hits of search responses into columnar arrays.
+
+Offline evaluations run many searches and then read the ids, scores and a few fields
+of every hit. Gathering them from the nested hits in Python loops, or decoding every
+document into the collection's model first, dominates the time spent on the
+responses. The hit_columns function walks the hits once, appending each value to the
+list of its column, and converts every column to a NumPy array or an Arrow column in
+a single call.
+
+Functions:
+    hit_columns: Gather the ids, scores and fields of the hits of searches.
+
+Dependencies:
+    - numpy (optional): Builds the columns as NumPy arrays
+    - pyarrow (optional): Builds the columns as an Arrow table
+    - typesense.request_handler: Raises the errors of failed searches
+
+Note: This module is part of the Typesense Python client library and is used internally
+by other components of the library.
+"""
+
+import sys
+
+from typesense.request_handler import RequestHandler
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+ColumnFormat = typing.Literal["numpy", "arrow"]
+
+_Columns = typing.Dict[str, typing.List[typing.Any]]
+
+
+def hit_columns(
+    search_results: typing.Sequence[typing.Mapping[str, typing.Any]],
+    fields: typing.Sequence[str] = (),
+    column_format: ColumnFormat = "numpy",
+    search_index: bool = False,
+) -> typing.Any:
+    """
+    Gather the ids, scores and fields of the hits of searches.
+
+    The columns are `id`, `search_index` if requested, `text_match`,
+    `vector_distance`, then the requested fields of the documents. Hits of grouped
+    searches are gathered group after group.
+
+    As NumPy arrays, ids and fields are object arrays unless all their values are
+    numbers or bools, missing text match scores are 0 and missing vector distances
+    are NaN. As an Arrow table, missing values are nulls.
+
+    Args:
+        search_results (Sequence[Mapping[str, Any]]): The search responses, or the
+            results of a multi-search.
+        fields (Sequence[str]): The top-level document fields to gather.
+        column_format (ColumnFormat): Whether to build NumPy arrays or an Arrow
+            table. Defaults to NumPy.
+        search_index (bool): Whether to add the position of the search each hit
+            belongs to, e.g. for the flattened hits of a multi-search.
+
+    Returns:
+        Any: The columns by name as NumPy arrays, or a `pyarrow.Table`.
+
+    Raises:
+        TypesenseClientError: If one of the searches failed.
+    """
+    columns = _gather_columns(search_results, fields, search_index)
+    if column_format == "arrow":
+        return _arrow_table(columns)
+    return _numpy_arrays(columns)
+
+
+def _gather_columns(
+    search_results: typing.Sequence[typing.Mapping[str, typing.Any]],
+    fields: typing.Sequence[str],
+    search_index: bool,
+) -> _Columns:
+    """Gather the values of the hits of searches in one list per column."""
+    ids: typing.List[typing.Any] = []
+    search_indices: typing.List[int] = []
+    text_matches: typing.List[typing.Union[int, None]] = []
+    vector_distances: typing.List[typing.Union[float, None]] = []
+    columns: _Columns = {"id": ids}
+    if search_index:
+        columns["search_index"] = search_indices
+    columns["text_match"] = text_matches
+    columns["vector_distance"] = vector_distances
+    field_columns = [
+        (field_name, columns.setdefault(field_name, []))
+        for field_name in dict.fromkeys(fields)
+        if field_name not in columns
+    ]
+
+    for result_index, search_result in enumerate(search_results):
+        RequestHandler.raise_for_search_result(search_result)
+        hits = list(search_result.get("hits", []))
+        for grouped_hit in search_result.get("grouped_hits", []):
+            hits.extend(grouped_hit["hits"])
+        for hit in hits:
+            document = hit["document"]
+            ids.append(document.get("id"))
+            text_matches.append(hit.get("text_match"))
+            vector_distances.append(hit.get("vector_distance"))
+            for field_name, field_values in field_columns:
+                field_values.append(document.get(field_name))
+        search_indices.extend([result_index] * len(hits))
+    return columns
+
+
+def _numpy_arrays(columns: _Columns) -> typing.Dict[str, typing.Any]:
+    """Convert the gathered columns to NumPy arrays."""
+    import numpy  # noqa: WPS433
+
+    arrays: typing.Dict[str, typing.Any] = {}
+    for column_name, column_values in columns.items():
+        if column_name == "search_index":
+            arrays[column_name] = numpy.array(column_values, dtype=numpy.int64)
+        elif column_name == "text_match":
+            arrays[column_name] = numpy.array(
+                [text_match or 0 for text_match in column_values],
+                dtype=numpy.uint64,
+            )
+        elif column_name == "vector_distance":
+            arrays[column_name] = numpy.array(
+                [
+                    numpy.nan if distance is None else distance
+                    for distance in column_values
+                ],
+                dtype=numpy.float64,
+            )
+        else:
+            arrays[column_name] = _numpy_column(numpy, column_values)
+    return arrays
+
+
+def _numpy_column(
+    numpy: typing.Any,
+    column_values: typing.List[typing.Any],
+) -> typing.Any:
+    """Convert the values of an id or field column to a NumPy array."""
+    if column_values and all(isinstance(value, bool) for value in column_values):
+        return numpy.array(column_values, dtype=bool)
+    if column_values and all(
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+        for value in column_values
+    ):
+        return numpy.array(column_values)
+    array = numpy.empty(len(column_values), dtype=object)
+    array[:] = column_values
+    return array
+
+
+def _arrow_table(columns: _Columns) -> typing.Any:
+    """Convert the gathered columns to an Arrow table."""
+    import pyarrow  # noqa: WPS433
+
+    column_types = {
+        "id": pyarrow.string(),
+        "search_index": pyarrow.int64(),
+        "text_match": pyarrow.uint64(),
+        "vector_distance": pyarrow.float64(),
+    }
+    return pyarrow.table(
+        {
+            column_name: pyarrow.array(
+                column_values,
+                type=column_types.get(column_name),
+            )
+            for column_name, column_values in columns.items()
+        },
+    )
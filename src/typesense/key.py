@@ -33,6 +33,8 @@ class Key:
         api_call (ApiCall): The API call object for making requests.
     """
 
+    __slots__ = ("key_id", "api_call")
+
     def __init__(self, api_call: ApiCall, key_id: int) -> None:
         """
         Initialize the Key object.
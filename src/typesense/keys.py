@@ -29,6 +29,7 @@ import json
 import sys
 
 from typesense.api_call import ApiCall
+from typesense.handle_cache import HandleCache
 from typesense.key import Key
 from typesense.types.document import GenerateScopedSearchKeyParams
 from typesense.types.key import (
@@ -54,7 +55,7 @@ class Keys:
     Attributes:
         resource_path (str): The API resource path for key operations.
         api_call (ApiCall): The API call object for making requests.
-        keys (Dict[int, Key]): A dictionary of Key objects.
+        keys (HandleCache[int, Key]): A bounded cache of Key objects.
     """
 
     resource_path: typing.Final[str] = "/keys"
@@ -67,7 +68,9 @@ class Keys:
             api_call (ApiCall): The API call object for making requests.
         """
         self.api_call = api_call
-        self.keys: typing.Dict[int, Key] = {}
+        self.keys: HandleCache[int, Key] = HandleCache(
+            api_call.config.handle_cache_size,
+        )
 
     def __getitem__(self, key_id: int) -> Key:
         """
@@ -79,9 +82,7 @@ class Keys:
         Returns:
             Key: The Key object for the given ID.
         """
-        if not self.keys.get(key_id):
-            self.keys[key_id] = Key(self.api_call, key_id)
-        return self.keys[key_id]
+        return self.keys.get_or_create(key_id, lambda: Key(self.api_call, key_id))
 
     def create(self, schema: ApiKeyCreateSchema) -> ApiKeyCreateResponseSchema:
         """
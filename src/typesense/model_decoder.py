@@ -0,0 +1,247 @@
+"""
+This module decodes Typesense documents into user-supplied model classes.
+
+`Client.typed_collection(model=...)` records the model of a collection's documents.
+When the model is a class rather than a TypedDict (a dataclass, a msgspec Struct or a
+plain, possibly slotted, class), search hits, retrieved documents and exports are
+decoded straight into it. Each model gets one decoder that validates the documents
+against the model's fields and builds the instances, so callers no longer convert
+the returned dictionaries themselves.
+
+Classes:
+    ModelDecoder: Validates documents and builds instances of a model class.
+
+Functions:
+    model_decoder: Get the cached decoder of a model.
+
+Dependencies:
+    - typesense.exceptions: Provides the DocumentDecodeError exception
+    - msgspec (optional): Decodes msgspec Struct models, when they are used
+
+Note: This module is part of the Typesense Python client library and is used internally
+by other components of the library.
+"""
+
+import functools
+import inspect
+import json
+import sys
+import types
+
+from typesense.exceptions import DocumentDecodeError
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+TModel = typing.TypeVar("TModel")
+
+_FieldCheck = typing.Callable[[typing.Any], bool]
+
+_UNION_TYPES: typing.Final[typing.Tuple[typing.Any, ...]] = (
+    typing.Union,
+    getattr(types, "UnionType", typing.Union),
+)
+
+
+class ModelDecoder(typing.Generic[TModel]):
+    """
+    Validates documents and builds instances of a model class.
+
+    TypedDict models, and dict itself, describe plain dictionaries, so their
+    documents are passed through unchanged. Other models are built from the fields
+    their constructor accepts: fields the model does not declare are dropped, missing
+    required fields and values of the wrong type raise a DocumentDecodeError.
+
+    Attributes:
+        model (Type[TModel]): The model class.
+        passthrough (bool): Whether documents are returned unchanged.
+    """
+
+    __slots__ = (
+        "model",
+        "passthrough",
+        "_checks",
+        "_required",
+        "_accepts_any_field",
+        "_struct_decoder",
+        "_struct_decode_error",
+    )
+
+    def __init__(self, model: typing.Type[TModel]) -> None:
+        """
+        Initialize the ModelDecoder.
+
+        Args:
+            model (Type[TModel]): The model class.
+        """
+        self.model = model
+        self.passthrough = model is dict or typing.is_typeddict(model)
+        self._checks: typing.Dict[str, typing.Union[_FieldCheck, None]] = {}
+        self._required: typing.FrozenSet[str] = frozenset()
+        self._accepts_any_field = False
+        self._struct_decoder: typing.Any = None
+        self._struct_decode_error: typing.Type[Exception] = ValueError
+        if self.passthrough:
+            return
+
+        if hasattr(model, "__struct_fields__"):
+            import msgspec  # noqa: WPS433
+
+            self._struct_decoder = msgspec.json.Decoder(model)
+            self._struct_decode_error = msgspec.DecodeError
+
+        field_types = _field_types(model)
+        required_fields = set()
+        for parameter in inspect.signature(model).parameters.values():
+            if parameter.kind is inspect.Parameter.VAR_KEYWORD:
+                self._accepts_any_field = True
+                continue
+            if parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+                continue
+            self._checks[parameter.name] = _type_check(
+                field_types.get(parameter.name, parameter.annotation),
+            )
+            if parameter.default is inspect.Parameter.empty:
+                required_fields.add(parameter.name)
+        self._required = frozenset(required_fields)
+
+    def decode(self, document: typing.Mapping[str, typing.Any]) -> TModel:
+        """
+        Decode a document into an instance of the model.
+
+        Args:
+            document (Mapping[str, Any]): The document, as decoded from JSON.
+
+        Returns:
+            TModel: The model instance, or the document itself for TypedDict models.
+
+        Raises:
+            DocumentDecodeError: If the document does not match the model.
+        """
+        if self.passthrough:
+            return typing.cast(TModel, document)
+
+        missing_fields = self._required.difference(document)
+        if missing_fields:
+            raise DocumentDecodeError(
+                f"Document is missing required fields of {self.model.__name__}: "
+                + f"{', '.join(sorted(missing_fields))}.",
+            )
+
+        model_fields = {}
+        for field_name, field_value in document.items():
+            if field_name not in self._checks:
+                if self._accepts_any_field:
+                    model_fields[field_name] = field_value
+                continue
+            field_check = self._checks[field_name]
+            if field_check is not None and not field_check(field_value):
+                raise DocumentDecodeError(
+                    f"Field `{field_name}` of {self.model.__name__} has an invalid "
+                    + f"value: {field_value!r}.",
+                )
+            model_fields[field_name] = field_value
+        return self.model(**model_fields)
+
+    def decode_json(self, document_json: typing.Union[str, bytes]) -> TModel:
+        """
+        Decode a JSON-encoded document into an instance of the model.
+
+        msgspec Struct models are decoded straight from the JSON text by msgspec,
+        without building an intermediate dictionary.
+
+        Args:
+            document_json (Union[str, bytes]): The JSON-encoded document.
+
+        Returns:
+            TModel: The model instance, or the document for TypedDict models.
+
+        Raises:
+            DocumentDecodeError: If the document does not match the model.
+        """
+        if self._struct_decoder is not None:
+            try:
+                return typing.cast(TModel, self._struct_decoder.decode(document_json))
+            except self._struct_decode_error as decode_error:
+                raise DocumentDecodeError(str(decode_error)) from decode_error
+        return self.decode(json.loads(document_json))
+
+    def decode_jsonl(self, documents_jsonl: str) -> typing.List[TModel]:
+        """
+        Decode JSONL-encoded documents, such as an export, into model instances.
+
+        Args:
+            documents_jsonl (str): The JSONL-encoded documents.
+
+        Returns:
+            List[TModel]: The model instances, in order.
+
+        Raises:
+            DocumentDecodeError: If a document does not match the model.
+        """
+        return [
+            self.decode_json(document_json)
+            for document_json in documents_jsonl.splitlines()
+            if document_json
+        ]
+
+
+@functools.lru_cache(maxsize=None)
+def model_decoder(model: typing.Type[TModel]) -> ModelDecoder[TModel]:
+    """
+    Get the cached decoder of a model.
+
+    Args:
+        model (Type[TModel]): The model class.
+
+    Returns:
+        ModelDecoder[TModel]: The decoder of the model.
+    """
+    return ModelDecoder(model)
+
+
+def _field_types(model: type) -> typing.Dict[str, typing.Any]:
+    """Get the annotated field types of a model, if they can be resolved."""
+    for annotated in (model, model.__init__):  # type: ignore[misc]
+        try:
+            field_types = typing.get_type_hints(annotated)
+        except (NameError, TypeError):
+            continue
+        if field_types:
+            return field_types
+    return {}
+
+
+def _type_check(annotation: typing.Any) -> typing.Union[_FieldCheck, None]:
+    """Build the check of a field's value from its annotation, if it can be checked."""
+    if annotation is inspect.Parameter.empty or annotation is typing.Any:
+        return None
+
+    origin = typing.get_origin(annotation)
+    if origin in _UNION_TYPES:
+        member_checks = [_type_check(member) for member in typing.get_args(annotation)]
+        if any(member_check is None for member_check in member_checks):
+            return None
+        return lambda field_value: any(
+            member_check(field_value)  # type: ignore[misc]
+            for member_check in member_checks
+        )
+
+    expected_type = origin or annotation
+    if expected_type is type(None):
+        return lambda field_value: field_value is None
+    if expected_type is float:
+        return lambda field_value: isinstance(field_value, (int, float)) and not (
+            isinstance(field_value, bool)
+        )
+    if expected_type is int:
+        return lambda field_value: isinstance(field_value, int) and not (
+            isinstance(field_value, bool)
+        )
+    if expected_type is tuple:
+        return lambda field_value: isinstance(field_value, (list, tuple))
+    if isinstance(expected_type, type) and expected_type.__module__ == "builtins":
+        return lambda field_value: isinstance(field_value, expected_type)
+    return None
@@ -9,8 +9,11 @@ Classes:
 
 Dependencies:
     - typesense.api_call: Provides the ApiCall class for making API requests.
+    - typesense.hit_columns: Gathers the hits of the results into columnar arrays.
     - typesense.preprocess:
        Provides the stringify_search_params function for parameter processing.
+    - typesense.request_handler: Provides the RawResponse type.
+    - typesense.response_view: Provides the typed views of responses.
     - typesense.types.document:
         Provides the MultiSearchCommonParameters type.
     - typesense.types.multi_search:
@@ -22,7 +25,10 @@ Note: This module uses conditional imports to support both Python 3.11+ and earl
 import sys
 
 from typesense.api_call import ApiCall
+from typesense.hit_columns import ColumnFormat, hit_columns
 from typesense.preprocess import stringify_search_params
+from typesense.request_handler import RawResponse
+from typesense.response_view import ResponseView, as_view
 from typesense.types.document import MultiSearchCommonParameters
 from typesense.types.multi_search import MultiSearchRequestSchema, MultiSearchResponse
 
@@ -54,11 +60,60 @@ class MultiSearch:
         """
         self.api_call = api_call
 
+    @typing.overload
     def perform(
         self,
         search_queries: MultiSearchRequestSchema,
         common_params: typing.Union[MultiSearchCommonParameters, None] = None,
-    ) -> MultiSearchResponse:
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: typing.Literal[False] = False,
+        typed: typing.Literal[False] = False,
+    ) -> MultiSearchResponse: ...
+
+    @typing.overload
+    def perform(
+        self,
+        search_queries: MultiSearchRequestSchema,
+        common_params: typing.Union[MultiSearchCommonParameters, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+        *,
+        raw: typing.Literal[True],
+    ) -> RawResponse: ...
+
+    @typing.overload
+    def perform(
+        self,
+        search_queries: MultiSearchRequestSchema,
+        common_params: typing.Union[MultiSearchCommonParameters, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: typing.Literal[False] = False,
+        *,
+        typed: typing.Literal[True],
+    ) -> ResponseView: ...
+
+    @typing.overload
+    def perform(
+        self,
+        search_queries: MultiSearchRequestSchema,
+        common_params: typing.Union[MultiSearchCommonParameters, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: typing.Literal[False] = False,
+        typed: typing.Literal[False] = False,
+        *,
+        columnar: ColumnFormat,
+        column_fields: typing.Sequence[str] = (),
+    ) -> typing.Any: ...
+
+    def perform(
+        self,
+        search_queries: MultiSearchRequestSchema,
+        common_params: typing.Union[MultiSearchCommonParameters, None] = None,
+        deadline_seconds: typing.Union[float, None] = None,
+        raw: bool = False,
+        typed: bool = False,
+        columnar: typing.Union[ColumnFormat, None] = None,
+        column_fields: typing.Sequence[str] = (),
+    ) -> typing.Union[MultiSearchResponse, RawResponse, ResponseView, typing.Any]:
         """
         Perform a multi-search operation.
 
@@ -73,25 +128,74 @@ class MultiSearch:
                     parameter dictionaries.
             common_params (Union[MultiSearchCommonParameters, None], optional):
                 Common parameters to apply to all search queries. Defaults to None.
+            deadline_seconds (Union[float, None], optional):
+                End-to-end budget for the request, including retries.
+            raw (bool): Whether to return the undecoded response body and content
+                type, e.g. to proxy it unchanged. Defaults to False.
+            typed (bool): Whether to return a view of the response exposing its
+                fields as attributes, wrapping results and hits only when they are
+                read. Defaults to False.
+            columnar (Union[ColumnFormat, None], optional): Whether to return the
+                ids, scores and `column_fields` of the hits of all the searches as
+                NumPy arrays or an Arrow table, with the position of the search of
+                each hit in a `search_index` column. Requires NumPy or pyarrow.
+            column_fields (Sequence[str]): The document fields gathered along the
+                ids and scores when columnar is set.
 
         Returns:
-            MultiSearchResponse:
+            Union[MultiSearchResponse, RawResponse, ResponseView, Any]:
                 The response from the multi-search operation, containing
-                    the results of all search queries.
+                    the results of all search queries, its undecoded body
+                    if raw is set, a view of it if typed is set, or the
+                    columns of the hits if columnar is set.
+
+        Raises:
+            TypesenseClientError: If columnar is set and one of the searches failed.
         """
         stringified_search_params = [
             stringify_search_params(search_params)
             for search_params in search_queries.get("searches")
         ]
+        canonicalizer = self.api_call.search_canonicalizer
+        if canonicalizer is not None:
+            inherited_params = frozenset(common_params or ())
+            stringified_search_params = [
+                canonicalizer.canonicalize(
+                    search_params,
+                    scope=search_params.get("collection", ""),
+                    inherited_params=inherited_params,
+                )
+                for search_params in stringified_search_params
+            ]
         search_body = {
             "searches": stringified_search_params,
             "union": search_queries.get("union", False),
         }
+        if raw:
+            return self.api_call.post(
+                MultiSearch.resource_path,
+                body=search_body,
+                params=common_params,
+                entity_type=MultiSearchResponse,
+                deadline_seconds=deadline_seconds,
+                raw=True,
+            )
         response: MultiSearchResponse = self.api_call.post(
             MultiSearch.resource_path,
             body=search_body,
             params=common_params,
             as_json=True,
             entity_type=MultiSearchResponse,
+            deadline_seconds=deadline_seconds,
         )
+        if columnar is not None:
+            search_results = response.get("results", [response])
+            return hit_columns(
+                search_results,
+                column_fields,
+                columnar,
+                search_index=True,
+            )
+        if typed:
+            return as_view(MultiSearchResponse, response)
         return response
@@ -39,6 +39,8 @@ class NLSearchModel:
         api_call (ApiCall): The API call object for making requests.
     """
 
+    __slots__ = ("model_id", "api_call")
+
     def __init__(self, api_call: ApiCall, model_id: str) -> None:
         """
         Initialize the NLSearchModel object.
@@ -26,6 +26,7 @@ versions through the use of the typing_extensions library.
 import sys
 
 from typesense.api_call import ApiCall
+from typesense.handle_cache import HandleCache
 from typesense.types.nl_search_model import (
     NLSearchModelCreateSchema,
     NLSearchModelSchema,
@@ -50,8 +51,8 @@ class NLSearchModels(object):
     Attributes:
         resource_path (str): The API resource path for NL search models operations.
         api_call (ApiCall): The API call object for making requests.
-        nl_search_models (Dict[str, NLSearchModel]):
-            A dictionary of NLSearchModel objects.
+        nl_search_models (HandleCache[str, NLSearchModel]):
+            A bounded cache of NLSearchModel objects.
     """
 
     resource_path: typing.Final[str] = "/nl_search_models"
@@ -64,7 +65,9 @@ class NLSearchModels(object):
             api_call (ApiCall): The API call object for making requests.
         """
         self.api_call = api_call
-        self.nl_search_models: typing.Dict[str, NLSearchModel] = {}
+        self.nl_search_models: HandleCache[str, NLSearchModel] = HandleCache(
+            api_call.config.handle_cache_size,
+        )
 
     def __getitem__(self, model_id: str) -> NLSearchModel:
         """
@@ -76,12 +79,10 @@ class NLSearchModels(object):
         Returns:
             NLSearchModel: The NLSearchModel object for the given ID.
         """
-        if model_id not in self.nl_search_models:
-            self.nl_search_models[model_id] = NLSearchModel(
-                self.api_call,
-                model_id,
-            )
-        return self.nl_search_models[model_id]
+        return self.nl_search_models.get_or_create(
+            model_id,
+            lambda: NLSearchModel(self.api_call, model_id),
+        )
 
     def create(self, model: NLSearchModelCreateSchema) -> NLSearchModelSchema:
         """
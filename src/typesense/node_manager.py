@@ -9,6 +9,9 @@ Key features:
 - Nearest node prioritization (if configured)
 - Node health tracking and updates
 - Periodic health checks based on a configurable interval
+- Leader-aware selection of the node that receives writes (if enabled)
+- Nearest node selection from probed latencies (if enabled)
+- Cache-affinity selection of the node that serves a search (if enabled)
 
 Classes:
     NodeManager: Manages the nodes in a Typesense cluster configuration.
@@ -30,11 +33,18 @@ used internally by other components of the library.
 """
 
 import copy
+import hashlib
+import sys
 import time
 
 from typesense.configuration import Configuration, Node
 from typesense.logger import logger
 
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
 
 class NodeManager:
     """
@@ -47,6 +57,9 @@ class NodeManager:
         config (Configuration): The configuration object for the Typesense client.
         nodes (List[Node]): A copy of the nodes from the configuration.
         node_index (int): The index of the current node in the rotation.
+        leader_node (Node | None): The last known Raft leader of the cluster.
+        latency_ranking (List[Tuple[Node, float]]): The reachable nodes and their
+            probed latencies in seconds, fastest first.
     """
 
     def __init__(self, config: Configuration):
@@ -59,6 +72,10 @@ class NodeManager:
         self.config = config
         self.nodes = copy.deepcopy(config.nodes)
         self.node_index = 0
+        self.leader_node: typing.Union[Node, None] = None
+        self._leader_check_ts = 0
+        self.latency_ranking: typing.List[typing.Tuple[Node, float]] = []
+        self._latency_probe_ts = 0
         self._initialize_nodes()
 
     def get_node(self) -> Node:
@@ -71,11 +88,10 @@ class NodeManager:
         Returns:
             Node: The selected node for the next operation.
         """
-        if self.config.nearest_node:
-            if self.config.nearest_node.healthy or self._is_due_for_health_check(
-                self.config.nearest_node,
-            ):
-                return self.config.nearest_node
+        nearest_node = self.nearest_node
+        if nearest_node:
+            if nearest_node.healthy or self._is_due_for_health_check(nearest_node):
+                return nearest_node
 
         node_index = 0
         while node_index < len(self.nodes):
@@ -88,6 +104,123 @@ class NodeManager:
         logger.debug("No healthy nodes were found. Returning the next node.")
         return self.nodes[self.node_index]
 
+    def get_affinity_node(self, affinity_key: str) -> Node:
+        """
+        Get the preferred healthy node of a request key.
+
+        Nodes are ranked by rendezvous hashing of the key and each node's URL, so a
+        key keeps its node across processes and only the keys of a node that fails
+        move, to the next node of their ranking. The nearest node is not considered.
+
+        Args:
+            affinity_key (str): The key of the request, e.g. its canonical search.
+
+        Returns:
+            Node: The highest ranked healthy node, or the next node of the
+                round-robin rotation if none is healthy.
+        """
+        ranked_nodes = sorted(
+            self.nodes,
+            key=lambda node: _rendezvous_score(affinity_key, node),
+            reverse=True,
+        )
+        for node in ranked_nodes:
+            if node.healthy or self._is_due_for_health_check(node):
+                return node
+        return self.get_node()
+
+    @property
+    def nearest_node(self) -> typing.Union[Node, None]:
+        """
+        Get the effective nearest node.
+
+        This is the fastest probed node if latency probing is enabled and has found
+        a reachable node, and the configured nearest node otherwise.
+
+        Returns:
+            Union[Node, None]: The effective nearest node, if any.
+        """
+        if self.config.auto_nearest_node and self.latency_ranking:
+            return self.latency_ranking[0][0]
+        return self.config.nearest_node
+
+    def set_latency_ranking(
+        self,
+        ranking: typing.List[typing.Tuple[Node, float]],
+    ) -> None:
+        """
+        Record the result of a latency probe.
+
+        Args:
+            ranking (List[Tuple[Node, float]]): The reachable nodes and their
+                latencies in seconds, fastest first.
+        """
+        self.latency_ranking = ranking
+        self._latency_probe_ts = int(time.time())
+
+    def is_due_for_latency_probe(self) -> bool:
+        """
+        Check if the node latencies should be probed again.
+
+        Returns:
+            bool: True if latency probing is enabled and the probe interval has
+                elapsed since the last probe.
+        """
+        if not self.config.auto_nearest_node:
+            return False
+        current_epoch_ts = int(time.time())
+        return bool(
+            (current_epoch_ts - self._latency_probe_ts)
+            > self.config.latency_probe_interval_seconds,
+        )
+
+    def get_write_node(self) -> Node:
+        """
+        Get the node that should receive the next write.
+
+        This is the known leader if it is healthy, so writes skip the extra hop a
+        follower adds by proxying them; otherwise it falls back to `get_node`.
+
+        Returns:
+            Node: The selected node for the next write.
+        """
+        if self.leader_node and (
+            self.leader_node.healthy or self._is_due_for_health_check(self.leader_node)
+        ):
+            return self.leader_node
+        return self.get_node()
+
+    def set_leader(self, node: typing.Union[Node, None]) -> None:
+        """
+        Record the result of a leader lookup.
+
+        Args:
+            node (Union[Node, None]): The leader node, or None if no leader was found.
+        """
+        self.leader_node = node
+        self._leader_check_ts = int(time.time())
+
+    def invalidate_leader(self) -> None:
+        """Forget the known leader so it is looked up again before the next write."""
+        self.leader_node = None
+        self._leader_check_ts = 0
+
+    def is_due_for_leader_check(self) -> bool:
+        """
+        Check if the leader should be looked up again.
+
+        Returns:
+            bool: True if leader-aware writes are enabled and the refresh interval
+                has elapsed since the last lookup.
+        """
+        if not self.config.leader_aware_writes:
+            return False
+        current_epoch_ts = int(time.time())
+        return bool(
+            (current_epoch_ts - self._leader_check_ts)
+            > self.config.leader_refresh_interval_seconds,
+        )
+
     def set_node_health(self, node: Node, is_healthy: bool) -> None:
         """
         Set the health status of a node and update its last access timestamp.
@@ -126,3 +259,12 @@ class NodeManager:
             self.set_node_health(self.config.nearest_node, is_healthy=True)
         for node in self.nodes:
             self.set_node_health(node, is_healthy=True)
+
+
+def _rendezvous_score(affinity_key: str, node: Node) -> int:
+    """Get the stable score of a node for a key, the same in every process."""
+    digest = hashlib.blake2b(
+        f"{node.url()}|{affinity_key}".encode(),
+        digest_size=8,
+    ).digest()
+    return int.from_bytes(digest, "big")
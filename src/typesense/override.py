@@ -42,6 +42,8 @@ class Override:
         override_id (str): The ID of the override.
     """
 
+    __slots__ = ("api_call", "collection_name", "override_id")
+
     @warn_deprecation(  # type: ignore[misc]
         "The override API (collections/{collection}/overrides/{override_id}) is deprecated is removed on v30+. "
         "Use curation sets (curation_sets) instead.",
@@ -32,6 +32,7 @@ import sys
 from typing_extensions import deprecated
 
 from typesense.api_call import ApiCall
+from typesense.handle_cache import HandleCache
 from typesense.logger import warn_deprecation
 from typesense.override import Override
 from typesense.types.override import (
@@ -58,7 +59,7 @@ class Overrides:
         RESOURCE_PATH (str): The API resource path for overrides.
         api_call (ApiCall): The API call object for making requests.
         collection_name (str): The name of the collection.
-        overrides (Dict[str, Override]): A dictionary of Override objects.
+        overrides (HandleCache[str, Override]): A bounded cache of Override objects.
     """
 
     resource_path: typing.Final[str] = "overrides"
@@ -81,7 +82,9 @@ class Overrides:
         """
         self.api_call = api_call
         self.collection_name = collection_name
-        self.overrides: typing.Dict[str, Override] = {}
+        self.overrides: HandleCache[str, Override] = HandleCache(
+            api_call.config.handle_cache_size,
+        )
 
     def __getitem__(self, override_id: str) -> Override:
         """
@@ -93,13 +96,10 @@ class Overrides:
         Returns:
             Override: The Override object for the given ID.
         """
-        if not self.overrides.get(override_id):
-            self.overrides[override_id] = Override(
-                self.api_call,
-                self.collection_name,
-                override_id,
-            )
-        return self.overrides[override_id]
+        return self.overrides.get_or_create(
+            override_id,
+            lambda: Override(self.api_call, self.collection_name, override_id),
+        )
 
     def upsert(self, override_id: str, schema: OverrideCreateSchema) -> OverrideSchema:
         """
@@ -9,12 +9,20 @@ Key features:
 - Convert individual values (int, str, bool) to strings
 - Process lists of parameters into comma-separated strings
 - Stringify search parameter dictionaries
+- Prepare search parameter templates that are stringified once and bound per call
+- Canonicalize search parameters to maximize server-side cache hits
 
 Functions:
     stringify: Convert a single value to a string.
     process_param_list: Convert a list of parameters to a comma-separated string.
     stringify_search_params: Convert a dictionary of search parameters to strings.
 
+Classes:
+    StringifiedSearchParams: Search parameters that are already stringified.
+    PreparedSearch: A search parameter template stringified once.
+    CacheKeyMetrics: Cardinality metrics of the cache keys of searches.
+    SearchCanonicalizer: Canonicalizes search parameters and tracks their cache keys.
+
 Types:
     _ListTypes: Type alias for a list of strings, integers, or booleans.
     _Types: Type alias for a single string, integer, or boolean.
@@ -28,7 +36,11 @@ Dependencies:
 Note: This module uses conditional imports to support both Python 3.11+ and earlier versions.
 """
 
+import re
 import sys
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
 
 from typesense.exceptions import InvalidParameter
 
@@ -48,6 +60,72 @@ ParamSchema: typing.TypeAlias = typing.Dict[
 ]
 StringifiedParamSchema: typing.TypeAlias = typing.Dict[str, str]
 
+_LIST_PARAMS: typing.Final[typing.FrozenSet[str]] = frozenset(
+    (
+        "query_by",
+        "query_by_weights",
+        "sort_by",
+        "facet_by",
+        "include_fields",
+        "exclude_fields",
+        "highlight_fields",
+        "highlight_full_fields",
+        "group_by",
+        "prefix",
+        "infix",
+        "num_typos",
+    ),
+)
+_UNORDERED_LIST_PARAMS: typing.Final[typing.FrozenSet[str]] = frozenset(
+    (
+        "include_fields",
+        "exclude_fields",
+        "highlight_fields",
+        "highlight_full_fields",
+    ),
+)
+_FILTER_PARAMS: typing.Final[typing.FrozenSet[str]] = frozenset(
+    ("filter_by", "facet_query"),
+)
+_DEFAULT_SEARCH_PARAMS: typing.Final[typing.Mapping[str, str]] = MappingProxyType(
+    {
+        "page": "1",
+        "per_page": "10",
+        "prefix": "true",
+        "num_typos": "2",
+        "drop_tokens_threshold": "1",
+        "typo_tokens_threshold": "1",
+        "prioritize_exact_match": "true",
+        "enable_overrides": "true",
+        "exhaustive_search": "false",
+        "use_cache": "false",
+        "snippet_threshold": "30",
+        "highlight_affix_num_tokens": "4",
+        "highlight_start_tag": "<mark>",
+        "highlight_end_tag": "</mark>",
+    },
+)
+_PRESET_PARAM: typing.Final[str] = "preset"
+_DEFAULT_MAX_TRACKED_KEYS: typing.Final[int] = 10_000
+_WHITESPACE = re.compile(r"\s+")
+_FILTER_LOGICAL_OPERATOR = re.compile(r"\s*(&&|\|\|)\s*")
+_FILTER_PUNCTUATION = re.compile(r"\s*([()\[\],])\s*")
+
+
+class StringifiedSearchParams(typing.Dict[str, str]):
+    """
+    Search parameters that are already stringified.
+
+    `stringify_search_params` returns instances of this class as is, so parameters
+    bound from a PreparedSearch skip the stringification pass of every search. They
+    are recognized by their `is_stringified` flag rather than by class, which keeps
+    working when the module is reloaded and the class is recreated.
+    """
+
+    __slots__ = ()
+
+    is_stringified: typing.ClassVar[bool] = True
+
 
 def stringify(argument: _Types) -> str:
     """
@@ -134,6 +212,9 @@ def stringify_search_params(parameter_dict: ParamSchema) -> StringifiedParamSche
         >>> stringify_search_params({"a": [True, False, True], "b": [1, 2, 3]})
         {"a": "true,false,true", "b": "1,2,3"}
     """
+    if getattr(parameter_dict, "is_stringified", False):
+        return typing.cast(StringifiedSearchParams, parameter_dict)
+
     stringified_params: StringifiedParamSchema = {}
     for key, param_value in parameter_dict.items():
         if isinstance(param_value, list):
@@ -145,3 +226,243 @@ def stringify_search_params(parameter_dict: ParamSchema) -> StringifiedParamSche
                 f"Value {param_value} is not a string, integer, or boolean",
             )
     return stringified_params
+
+
+class PreparedSearch:
+    """
+    A search parameter template stringified once.
+
+    Most searches share large fixed parts (`query_by`, `facet_by`, `include_fields`,
+    weights) and only vary a few parameters (`q`, `filter_by`, `page`). A prepared
+    search validates and stringifies the fixed parts once; binding it per call only
+    stringifies the variable parts, and the bound parameters are passed through
+    `stringify_search_params` untouched.
+
+    Attributes:
+        params (Mapping[str, str]): The frozen, stringified template parameters.
+
+    Examples:
+        >>> prepared = PreparedSearch({"query_by": ["name", "brand"], "per_page": 20})
+        >>> prepared.bind(q="shoe", page=2)
+        {'query_by': 'name,brand', 'per_page': '20', 'q': 'shoe', 'page': '2'}
+    """
+
+    __slots__ = ("params",)
+
+    def __init__(self, template: ParamSchema) -> None:
+        """
+        Initialize the PreparedSearch.
+
+        Args:
+            template (ParamSchema): The fixed search parameters.
+
+        Raises:
+            InvalidParameter: If a value is not a string, integer, or boolean.
+        """
+        self.params: typing.Mapping[str, str] = MappingProxyType(
+            stringify_search_params(template),
+        )
+
+    def bind(
+        self,
+        **variable_params: typing.Union[_Types, _ListTypes],
+    ) -> StringifiedSearchParams:
+        """
+        Bind the variable parameters of a search to the template.
+
+        Args:
+            variable_params (Union[_Types, _ListTypes]): The variable parameters,
+                overriding the template parameters of the same name.
+
+        Returns:
+            StringifiedSearchParams: The stringified parameters of the search.
+
+        Raises:
+            InvalidParameter: If a value is not a string, integer, or boolean.
+        """
+        bound_params = StringifiedSearchParams(self.params)
+        bound_params.update(stringify_search_params(variable_params))
+        return bound_params
+
+
+class CacheKeyMetrics(typing.TypedDict):
+    """
+    Cardinality metrics of the cache keys of searches.
+
+    Attributes:
+        searches (int): The number of canonicalized searches.
+        distinct_keys (int): The number of distinct searches as they were built.
+        distinct_canonical_keys (int): The number of distinct searches after
+            canonicalization, i.e. the server-side cache keys they produce.
+    """
+
+    searches: int
+    distinct_keys: int
+    distinct_canonical_keys: int
+
+
+class SearchCanonicalizer:
+    """
+    Canonicalizes search parameters and tracks the cardinality of their cache keys.
+
+    Typesense caches search results keyed on the exact request, so semantically
+    identical searches built differently miss each other's cache entries. The
+    canonical form sorts parameters by name, sorts the items of list parameters
+    whose order has no meaning (e.g. `include_fields`), strips spacing around list
+    items and filter operators, and drops parameters set to their server-side
+    default. The order of `facet_by` is kept, as it orders the facet counts of the
+    response, and defaults are kept for searches using a `preset`, where they
+    override the values of the preset.
+
+    Comparing `distinct_keys` with `distinct_canonical_keys` in `metrics()` shows
+    how many cache entries canonicalization collapses. Only the most recently seen
+    `max_tracked_keys` keys of each kind are tracked, so a long-running process
+    keeps a flat memory footprint.
+    """
+
+    __slots__ = (
+        "max_tracked_keys",
+        "_lock",
+        "_searches",
+        "_keys",
+        "_canonical_keys",
+    )
+
+    def __init__(self, max_tracked_keys: int = _DEFAULT_MAX_TRACKED_KEYS) -> None:
+        """
+        Initialize the SearchCanonicalizer.
+
+        Args:
+            max_tracked_keys (int): The number of distinct cache keys of each kind
+                tracked for the metrics; the least recently seen ones are dropped.
+        """
+        self.max_tracked_keys = max_tracked_keys
+        self._lock = threading.Lock()
+        self._searches = 0
+        self._keys: typing.OrderedDict[int, None] = OrderedDict()
+        self._canonical_keys: typing.OrderedDict[int, None] = OrderedDict()
+
+    def canonicalize(
+        self,
+        search_params: StringifiedParamSchema,
+        scope: str = "",
+        inherited_params: typing.AbstractSet[str] = frozenset(),
+    ) -> StringifiedSearchParams:
+        """
+        Canonicalize stringified search parameters and record their cache keys.
+
+        Args:
+            search_params (StringifiedParamSchema): The stringified search parameters.
+            scope (str): What the search runs against, e.g. the collection name,
+                used to tell apart the cache keys of different collections.
+            inherited_params (AbstractSet[str]): Parameters that override inherited
+                values, such as the common parameters of a multi-search, and thus
+                are kept even when set to their default. All defaults are kept if
+                one of them is a `preset`.
+
+        Returns:
+            StringifiedSearchParams: The canonical search parameters.
+
+        Examples:
+            >>> SearchCanonicalizer().canonicalize(
+            ...     {"q": "shoe", "include_fields": "name, id", "page": "1"},
+            ... )
+            {'include_fields': 'id,name', 'q': 'shoe'}
+        """
+        keeps_defaults = (
+            _PRESET_PARAM in search_params or _PRESET_PARAM in inherited_params
+        )
+        canonical_params = StringifiedSearchParams()
+        for param_name in sorted(search_params):
+            param_value = _canonical_value(param_name, search_params[param_name])
+            is_default = _DEFAULT_SEARCH_PARAMS.get(param_name) == param_value
+            if is_default and not keeps_defaults and param_name not in inherited_params:
+                continue
+            canonical_params[param_name] = param_value
+
+        key = hash((scope, tuple(search_params.items())))
+        canonical_key = hash((scope, tuple(canonical_params.items())))
+        with self._lock:
+            self._searches += 1
+            self._track(self._keys, key)
+            self._track(self._canonical_keys, canonical_key)
+        return canonical_params
+
+    def metrics(self) -> CacheKeyMetrics:
+        """
+        Get the cardinality metrics of the cache keys seen so far.
+
+        Returns:
+            CacheKeyMetrics: The number of searches and of distinct cache keys.
+        """
+        with self._lock:
+            return CacheKeyMetrics(
+                searches=self._searches,
+                distinct_keys=len(self._keys),
+                distinct_canonical_keys=len(self._canonical_keys),
+            )
+
+    def reset(self) -> None:
+        """Reset the metrics."""
+        with self._lock:
+            self._searches = 0
+            self._keys.clear()
+            self._canonical_keys.clear()
+
+    def reset_after_fork(self) -> None:
+        """Replace the lock, which another thread may have held during a fork."""
+        self._lock = threading.Lock()
+
+    def _track(self, tracked_keys: typing.OrderedDict[int, None], key: int) -> None:
+        """Record a key as most recently seen, dropping the least recent beyond max."""
+        tracked_keys[key] = None
+        tracked_keys.move_to_end(key)
+        if len(tracked_keys) > self.max_tracked_keys:
+            tracked_keys.popitem(last=False)
+
+
+def _canonical_value(param_name: str, param_value: str) -> str:
+    """Get the canonical form of a stringified search parameter."""
+    if param_name in _LIST_PARAMS:
+        list_items = [
+            _WHITESPACE.sub(" ", list_item.strip())
+            for list_item in _split_top_level(param_value)
+        ]
+        if param_name in _UNORDERED_LIST_PARAMS:
+            list_items.sort()
+        return ",".join(list_items)
+    if param_name in _FILTER_PARAMS:
+        return _canonical_filter(param_value)
+    return param_value
+
+
+def _canonical_filter(filter_value: str) -> str:
+    """Collapse the spacing of a filter expression, outside of backtick quotes."""
+    filter_parts = filter_value.split("`")
+    for part_index in range(0, len(filter_parts), 2):
+        filter_part = _FILTER_PUNCTUATION.sub(r"\1", filter_parts[part_index])
+        filter_part = _FILTER_LOGICAL_OPERATOR.sub(r" \1 ", filter_part)
+        filter_parts[part_index] = _WHITESPACE.sub(" ", filter_part)
+    return "`".join(filter_parts).strip()
+
+
+def _split_top_level(param_value: str) -> typing.List[str]:
+    """Split a list parameter on the commas outside of brackets and backticks."""
+    list_items = []
+    depth = 0
+    in_quotes = False
+    item_start = 0
+    for char_index, char in enumerate(param_value):
+        if char == "`":
+            in_quotes = not in_quotes
+        elif in_quotes:
+            continue
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            list_items.append(param_value[item_start:char_index])
+            item_start = char_index + 1
+    list_items.append(param_value[item_start:])
+    return list_items
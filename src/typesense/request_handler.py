@@ -4,6 +4,7 @@ This module provides functionality for handling HTTP requests in the Typesense c
 Classes:
     - RequestHandler: Manages HTTP requests to the Typesense API.
     - SessionFunctionKwargs: Type for keyword arguments in session functions.
+    - RawResponse: Type for undecoded response bodies.
 
 The RequestHandler class interacts with the Typesense API to manage HTTP requests,
 handle authentication, and process responses. It provides methods to send requests,
@@ -14,14 +15,15 @@ versions through the use of the typing_extensions library.
 
 Key Features:
 - Handles authentication via API key
-- Supports JSON and non-JSON responses
+- Supports JSON, non-JSON and undecoded raw responses
 - Provides custom error handling for various HTTP status codes
 - Normalizes boolean parameters for API requests
+- Serializes request bodies holding NumPy arrays and scalars
+- Freezes the authentication headers once per handler to keep requests cheap
 
 Note: This module relies on the 'requests' library for making HTTP requests.
 """
 
-import json
 import sys
 from types import MappingProxyType
 
@@ -45,6 +47,7 @@ from typesense.exceptions import (
     ServiceUnavailable,
     TypesenseClientError,
 )
+from typesense.serialization import dumps
 
 TEntityDict = typing.TypeVar("TEntityDict")
 TParams = typing.TypeVar("TParams")
@@ -76,7 +79,7 @@ class SessionFunctionKwargs(typing.Generic[TParams, TBody], typing.TypedDict):
 
         data (Optional[Union[TBody, str, None]]): Body of the request.
 
-        headers (Optional[Dict[str, str]]): Headers for the request.
+        headers (Optional[Mapping[str, str]]): Headers for the request.
 
         timeout (float): Timeout for the request in seconds.
 
@@ -85,11 +88,25 @@ class SessionFunctionKwargs(typing.Generic[TParams, TBody], typing.TypedDict):
 
     params: typing.NotRequired[typing.Union[TParams, None]]
     data: typing.NotRequired[typing.Union[TBody, str, None]]
-    headers: typing.NotRequired[typing.Dict[str, str]]
+    headers: typing.NotRequired[typing.Mapping[str, str]]
     timeout: float
     verify: bool
 
 
+class RawResponse(typing.TypedDict):
+    """
+    Type definition for an undecoded response body.
+
+    Attributes:
+        content (bytes): The response body, exactly as sent by the server.
+
+        content_type (str): The Content-Type header of the response.
+    """
+
+    content: bytes
+    content_type: str
+
+
 class RequestHandler:
     """
     Handles HTTP requests to the Typesense API.
@@ -100,6 +117,8 @@ class RequestHandler:
     Attributes:
         api_key_header_name (str): The header name for the API key.
         config (Configuration): The configuration object for the Typesense client.
+        headers (Mapping[str, str]): The frozen API key and additional headers sent
+            with every request.
     """
 
     api_key_header_name: typing.Final[str] = "X-TYPESENSE-API-KEY"
@@ -112,6 +131,12 @@ class RequestHandler:
             config (Configuration): The configuration object for the Typesense client.
         """
         self.config = config
+        self.headers: typing.Mapping[str, str] = MappingProxyType(
+            {
+                self.api_key_header_name: config.api_key,
+                **config.additional_headers,
+            },
+        )
 
     @typing.overload
     def make_request(
@@ -120,6 +145,7 @@ class RequestHandler:
         url: str,
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Literal[False],
+        raw: typing.Literal[False] = False,
         **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
     ) -> str:
         """
@@ -153,6 +179,7 @@ class RequestHandler:
         url: str,
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Literal[True],
+        raw: typing.Literal[False] = False,
         **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
     ) -> TEntityDict:
         """
@@ -176,14 +203,51 @@ class RequestHandler:
             TypesenseClientError: If the API returns an error response.
         """
 
+    @typing.overload
+    def make_request(
+        self,
+        fn: typing.Callable[..., requests.models.Response],
+        url: str,
+        entity_type: typing.Type[TEntityDict],
+        as_json: bool,
+        raw: typing.Literal[True],
+        **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
+    ) -> RawResponse:
+        """
+        Make an HTTP request to the Typesense API and return the undecoded response.
+
+        This overload is used when raw is set to True, so the response body can be
+        passed on without being decoded and re-encoded.
+
+        Args:
+            fn (Callable): The HTTP method function to use (e.g., requests.get).
+
+            url (str): The URL to send the request to.
+
+            entity_type (Type[TEntityDict]): The expected type of the response entity.
+
+            as_json (bool): Ignored for raw responses.
+
+            raw (Literal[True]): Specifies that the response should not be decoded.
+
+            kwargs: Additional keyword arguments for the request.
+
+        Returns:
+            RawResponse: The response body and content type.
+
+        Raises:
+            TypesenseClientError: If the API returns an error response.
+        """
+
     def make_request(
         self,
         fn: typing.Callable[..., requests.models.Response],
         url: str,
         entity_type: typing.Type[TEntityDict],
         as_json: typing.Union[typing.Literal[True], typing.Literal[False]] = True,
+        raw: bool = False,
         **kwargs: typing.Unpack[SessionFunctionKwargs[TParams, TBody]],
-    ) -> typing.Union[TEntityDict, str]:
+    ) -> typing.Union[TEntityDict, str, RawResponse]:
         """
         Make an HTTP request to the Typesense API.
 
@@ -196,24 +260,26 @@ class RequestHandler:
 
             as_json (bool): Whether to return the response as JSON. Defaults to True.
 
+            raw (bool): Whether to return the undecoded response body and content
+                type, ignoring as_json. Defaults to False.
+
             kwargs: Additional keyword arguments for the request.
 
         Returns:
-            Union[TEntityDict, str]: The response, either as a JSON object or a string.
+            Union[TEntityDict, str, RawResponse]: The response, either as a JSON
+                object, a string or the undecoded body.
 
         Raises:
             TypesenseClientError: If the API returns an error response.
         """
-        headers = {
-            self.api_key_header_name: self.config.api_key,
-        }
-        headers.update(self.config.additional_headers)
-
-        kwargs.setdefault("headers", {}).update(headers)
+        request_headers = kwargs.get("headers")
+        kwargs["headers"] = (
+            {**request_headers, **self.headers} if request_headers else self.headers
+        )
         kwargs.setdefault("timeout", self.config.connection_timeout_seconds)
         kwargs.setdefault("verify", self.config.verify)
         if kwargs.get("data") and not isinstance(kwargs["data"], (str, bytes)):
-            kwargs["data"] = json.dumps(kwargs["data"])
+            kwargs["data"] = dumps(kwargs["data"], self.config.float_precision)
 
         response = fn(url, **kwargs)
 
@@ -224,6 +290,12 @@ class RequestHandler:
                 error_message,
             )
 
+        if raw:
+            return RawResponse(
+                content=response.content,
+                content_type=response.headers.get("Content-Type", ""),
+            )
+
         if as_json:
             res: TEntityDict = response.json()
             return res
@@ -233,7 +305,7 @@ class RequestHandler:
     @staticmethod
     def normalize_params(params: TParams) -> None:
         """
-        Normalize boolean parameters in the request.
+        Normalize boolean parameters in the request, in place.
 
         Args:
             params (TParams): The parameters to normalize.
@@ -247,6 +319,56 @@ class RequestHandler:
             if isinstance(parameter_value, bool):
                 params[key] = str(parameter_value).lower()
 
+    @staticmethod
+    def raise_for_search_result(search_result: typing.Mapping[str, typing.Any]) -> None:
+        """
+        Raise the error a search of a multi-search failed with, if any.
+
+        Multi-searches succeed as a whole and report the failure of each search in
+        its result, with the status code the search alone would have returned.
+
+        Args:
+            search_result (Mapping[str, Any]): The result of the search.
+
+        Raises:
+            TypesenseClientError: If the search failed.
+        """
+        if "error" in search_result:
+            error_code = search_result.get("code", 0)
+            raise RequestHandler._get_exception(error_code)(
+                error_code,
+                search_result["error"],
+            )
+
+    @staticmethod
+    def normalized_params(params: TParams) -> TParams:
+        """
+        Get the parameters with boolean values normalized, leaving the input untouched.
+
+        The parameters are returned as is when they hold no boolean values, so the
+        common case does not copy them.
+
+        Args:
+            params (TParams): The parameters to normalize.
+
+        Returns:
+            TParams: The normalized parameters.
+
+        Raises:
+            ValueError: If params is not a dictionary.
+        """
+        if not isinstance(params, typing.Dict):
+            raise ValueError("Params must be a dictionary.")
+        if not any(isinstance(value, bool) for value in params.values()):
+            return params
+        return typing.cast(
+            TParams,
+            {
+                key: str(value).lower() if isinstance(value, bool) else value
+                for key, value in params.items()
+            },
+        )
+
     @staticmethod
     def _get_error_message(response: requests.Response) -> str:
         """
@@ -0,0 +1,177 @@
+"""
+This module provides request lanes that isolate classes of Typesense requests.
+
+Each request class (interactive, bulk or admin) can be given its own lane with a
+dedicated connection pool, a cap on in-flight requests and its own timeout, so that
+user-facing searches never queue behind long-running imports.
+
+Classes:
+    RequestLane: The connection pool, concurrency cap and timeout of a request class.
+
+Functions:
+    classify_request: Infer the request class of an API call.
+
+Dependencies:
+    - requests: For the per-lane sessions and connection pools
+    - typesense.configuration: Provides the RequestClass and RequestClassConfigDict types
+    - typesense.exceptions: Custom exception classes
+
+Note: This module is part of the Typesense Python client library and is used internally
+by other components of the library.
+"""
+
+import contextlib
+import sys
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from typesense.configuration import RequestClass, RequestClassConfigDict
+from typesense.exceptions import Timeout
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+_BULK_ACTIONS: typing.Final[typing.Tuple[str, ...]] = (
+    "/documents/import",
+    "/documents/export",
+)
+
+
+def classify_request(method: str, endpoint: str) -> RequestClass:
+    """
+    Infer the request class of an API call from its method and endpoint.
+
+    Imports, exports and update or delete by filter are bulk requests; searches and
+    single-document operations are interactive; everything else is admin.
+
+    Args:
+        method (str): The HTTP method of the request.
+        endpoint (str): The API endpoint of the request.
+
+    Returns:
+        RequestClass: The inferred request class.
+
+    Examples:
+        >>> classify_request("POST", "/collections/books/documents/import")
+        'bulk'
+        >>> classify_request("GET", "/collections/books/documents/search")
+        'interactive'
+        >>> classify_request("GET", "/keys")
+        'admin'
+    """
+    if endpoint.endswith(_BULK_ACTIONS):
+        return "bulk"
+    if endpoint.endswith("/documents/") and method in {"PATCH", "DELETE"}:
+        return "bulk"
+    if endpoint == "/multi_search" or "/documents/" in endpoint:
+        return "interactive"
+    return "admin"
+
+
+class RequestLane:
+    """
+    The dedicated connection pool, concurrency cap and timeout of a request class.
+
+    Attributes:
+        session (requests.Session): The session owning the lane's connection pool.
+        connection_timeout_seconds (float): The timeout of each request attempt.
+        max_concurrent_requests (int | None): The cap on in-flight requests, if any.
+        pool_maxsize (int | None): The number of pooled connections per node, if set.
+    """
+
+    def __init__(
+        self,
+        connection_timeout_seconds: float,
+        max_concurrent_requests: typing.Union[int, None] = None,
+        pool_maxsize: typing.Union[int, None] = None,
+    ) -> None:
+        """
+        Initialize the RequestLane.
+
+        Args:
+            connection_timeout_seconds (float): The timeout of each request attempt.
+            max_concurrent_requests (Union[int, None]): The cap on in-flight requests.
+            pool_maxsize (Union[int, None]): The number of pooled connections per node.
+        """
+        self.connection_timeout_seconds = connection_timeout_seconds
+        self.max_concurrent_requests = max_concurrent_requests
+        self.pool_maxsize = pool_maxsize
+        self.reset()
+
+    @classmethod
+    def from_config(
+        cls,
+        config: RequestClassConfigDict,
+        default_timeout_seconds: float,
+    ) -> "RequestLane":
+        """
+        Create a lane from a `request_classes` configuration entry.
+
+        Args:
+            config (RequestClassConfigDict): The lane configuration.
+            default_timeout_seconds (float): The timeout to use if none is configured.
+
+        Returns:
+            RequestLane: The configured lane.
+        """
+        return cls(
+            connection_timeout_seconds=config.get(
+                "connection_timeout_seconds",
+                default_timeout_seconds,
+            ),
+            max_concurrent_requests=config.get("max_concurrent_requests", None),
+            pool_maxsize=config.get("pool_maxsize", None),
+        )
+
+    def reset(self) -> None:
+        """
+        Create a fresh session, connection pool and concurrency cap for the lane.
+
+        This is also used in forked child processes, which must not reuse the
+        sockets and locks inherited from their parent.
+        """
+        self.session = requests.Session()
+        if self.pool_maxsize is not None:
+            adapter = HTTPAdapter(pool_maxsize=self.pool_maxsize)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        self._semaphore = (
+            threading.BoundedSemaphore(self.max_concurrent_requests)
+            if self.max_concurrent_requests is not None
+            else None
+        )
+
+    @contextlib.contextmanager
+    def slot(
+        self,
+        deadline: typing.Union[float, None] = None,
+    ) -> typing.Iterator[None]:
+        """
+        Hold one of the lane's in-flight slots for the duration of the block.
+
+        Args:
+            deadline (Union[float, None], optional): The monotonic timestamp by which
+                a slot must be free. Waits indefinitely if None.
+
+        Yields:
+            None: Control while the slot is held.
+
+        Raises:
+            Timeout: If no slot frees up before the deadline.
+        """
+        if self._semaphore is None:
+            yield
+            return
+
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+        if not self._semaphore.acquire(timeout=timeout):
+            raise Timeout("Request deadline exceeded")
+        try:
+            yield
+        finally:
+            self._semaphore.release()
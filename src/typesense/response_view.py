@@ -0,0 +1,390 @@
+"""
+This module provides typed, lazily-wrapped views over decoded Typesense responses.
+
+A view exposes the fields declared by one of the response TypedDicts in
+`typesense.types` (such as SearchResponse) as read-only attributes. The view classes
+are generated once per TypedDict and declare no per-instance storage beyond a
+reference to the decoded data, so creating a view is cheap. Nested TypedDicts, and
+lists or dicts of them, are only wrapped in their own views when the field is read:
+reading `response.hits[0].document` never touches the other hits, their highlights
+or the facet counts. Documents are decoded into the collection's model class when it
+is not a TypedDict, again only when they are read.
+
+Classes:
+    ResponseView: Base class of the views generated from response TypedDicts.
+    ViewList: A read-only sequence wrapping its items in views on access.
+    ViewMapping: A read-only mapping wrapping its values in views on access.
+
+Functions:
+    view_type: Get the view class generated for a response TypedDict.
+    as_view: Wrap decoded response data in the view class of its TypedDict.
+
+Dependencies:
+    - typesense.model_decoder: Decodes documents into model classes
+
+Note: This module is part of the Typesense Python client library and is used internally
+by other components of the library.
+"""
+
+import collections.abc
+import sys
+
+from typesense.model_decoder import model_decoder
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+_Converter = typing.Callable[[typing.Any], typing.Any]
+
+_view_types: typing.Dict[
+    typing.Tuple[type, typing.Union[type, None]],
+    typing.Type["ResponseView"],
+] = {}
+
+
+class ResponseView:
+    """
+    Base class of the views generated from response TypedDicts.
+
+    Declared fields are read as attributes, missing optional fields read as None,
+    and the view also supports read-only item access to the underlying data.
+
+    Attributes:
+        typed_dict (type): The TypedDict the view class was generated from.
+    """
+
+    __slots__ = ("_data",)
+
+    typed_dict: typing.ClassVar[type]
+
+    def __init__(self, data: typing.Mapping[str, typing.Any]) -> None:
+        """
+        Initialize the view.
+
+        Args:
+            data (Mapping[str, Any]): The decoded response data.
+        """
+        self._data = data
+
+    if typing.TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> typing.Any:
+            """Get a declared field of the view."""
+            raise AttributeError(name)
+
+    def __getitem__(self, key: str) -> typing.Any:
+        """
+        Get a field of the underlying data, without wrapping it in a view.
+
+        Args:
+            key (str): The field name.
+
+        Returns:
+            Any: The field value, as decoded from JSON.
+        """
+        return self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Check whether the underlying data has a field.
+
+        Args:
+            key (object): The field name.
+
+        Returns:
+            bool: Whether the field is present.
+        """
+        return key in self._data
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare the view with another view or mapping.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: Whether both hold the same data.
+        """
+        if isinstance(other, ResponseView):
+            return self._data == other._data  # noqa: WPS437
+        return self._data == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """
+        Get the representation of the view.
+
+        Returns:
+            str: The view class name and its data.
+        """
+        return f"{type(self).__name__}({self._data!r})"
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+        """
+        Get a field of the underlying data, or a default if it is missing.
+
+        Args:
+            key (str): The field name.
+            default (Any): The value returned if the field is missing.
+
+        Returns:
+            Any: The field value, as decoded from JSON.
+        """
+        return self._data.get(key, default)
+
+    def to_dict(self) -> typing.Mapping[str, typing.Any]:
+        """
+        Get the underlying decoded data.
+
+        Returns:
+            Mapping[str, Any]: The data the view wraps.
+        """
+        return self._data
+
+
+class ViewList(collections.abc.Sequence):  # type: ignore[type-arg]
+    """A read-only sequence wrapping its items in views on access."""
+
+    __slots__ = ("_items", "_convert")
+
+    def __init__(
+        self,
+        items: typing.Sequence[typing.Any],
+        convert: _Converter,
+    ) -> None:
+        """
+        Initialize the ViewList.
+
+        Args:
+            items (Sequence[Any]): The decoded items.
+            convert (Callable[[Any], Any]): Wraps a single item.
+        """
+        self._items = items
+        self._convert = convert
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        """
+        Get an item, or a list of items for a slice, wrapped in views.
+
+        Args:
+            index (Any): The index or slice.
+
+        Returns:
+            Any: The wrapped item or items.
+        """
+        if isinstance(index, slice):
+            return [self._convert(item) for item in self._items[index]]
+        return self._convert(self._items[index])
+
+    def __len__(self) -> int:
+        """
+        Get the number of items.
+
+        Returns:
+            int: The number of items.
+        """
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare the items with another sequence.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: Whether both hold the same items.
+        """
+        if isinstance(other, ViewList):
+            return self._items == other._items  # noqa: WPS437
+        return list(self) == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """
+        Get the representation of the list.
+
+        Returns:
+            str: The underlying items.
+        """
+        return f"ViewList({self._items!r})"
+
+
+class ViewMapping(collections.abc.Mapping):  # type: ignore[type-arg]
+    """A read-only mapping wrapping its values in views on access."""
+
+    __slots__ = ("_items", "_convert")
+
+    def __init__(
+        self,
+        items: typing.Mapping[str, typing.Any],
+        convert: _Converter,
+    ) -> None:
+        """
+        Initialize the ViewMapping.
+
+        Args:
+            items (Mapping[str, Any]): The decoded values by key.
+            convert (Callable[[Any], Any]): Wraps a single value.
+        """
+        self._items = items
+        self._convert = convert
+
+    def __getitem__(self, key: str) -> typing.Any:
+        """
+        Get a value wrapped in its view.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            Any: The wrapped value.
+        """
+        return self._convert(self._items[key])
+
+    def __iter__(self) -> typing.Iterator[str]:
+        """
+        Iterate over the keys.
+
+        Returns:
+            Iterator[str]: The keys.
+        """
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        """
+        Get the number of keys.
+
+        Returns:
+            int: The number of keys.
+        """
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        """
+        Get the representation of the mapping.
+
+        Returns:
+            str: The underlying values by key.
+        """
+        return f"ViewMapping({self._items!r})"
+
+
+def view_type(
+    typed_dict: type,
+    document_model: typing.Union[type, None] = None,
+) -> typing.Type[ResponseView]:
+    """
+    Get the view class generated for a response TypedDict.
+
+    The class is generated on first use and cached. Type variables such as the
+    document type of a search hit are bound to `document_model`: documents are
+    wrapped in views of it when it is a TypedDict, and decoded into it otherwise.
+
+    Args:
+        typed_dict (type): The response TypedDict, e.g. SearchResponse.
+        document_model (Union[type, None], optional): The model of the documents
+            of the collection.
+
+    Returns:
+        Type[ResponseView]: The view class.
+    """
+    cache_key = (typed_dict, document_model)
+    cached_view_type = _view_types.get(cache_key)
+    if cached_view_type is not None:
+        return cached_view_type
+
+    namespace: typing.Dict[str, typing.Any] = {
+        "__slots__": (),
+        "__doc__": f"A lazily-wrapped view of {typed_dict.__name__}.",
+        "typed_dict": typed_dict,
+    }
+    generated_view_type = type(
+        f"{typed_dict.__name__}View",
+        (ResponseView,),
+        namespace,
+    )
+    _view_types[cache_key] = generated_view_type
+
+    for field_name, annotation in typing.get_type_hints(typed_dict).items():
+        setattr(
+            generated_view_type,
+            field_name,
+            _field_property(field_name, _converter(annotation, document_model)),
+        )
+    return generated_view_type
+
+
+def as_view(
+    typed_dict: type,
+    data: typing.Mapping[str, typing.Any],
+    document_model: typing.Union[type, None] = None,
+) -> ResponseView:
+    """
+    Wrap decoded response data in the view class of its TypedDict.
+
+    Args:
+        typed_dict (type): The response TypedDict, e.g. SearchResponse.
+        data (Mapping[str, Any]): The decoded response data.
+        document_model (Union[type, None], optional): The model of the documents
+            of the collection.
+
+    Returns:
+        ResponseView: The view of the data.
+
+    Examples:
+        >>> response = as_view(SearchResponse, {"found": 1, "hits": [{"text_match": 7}]})
+        >>> response.found, response.hits[0].text_match
+        (1, 7)
+    """
+    return view_type(typed_dict, document_model)(data)
+
+
+def _field_property(field_name: str, convert: typing.Union[_Converter, None]) -> property:
+    """Create the read-only property exposing a field of a view."""
+    if convert is None:
+
+        def get_field(view: ResponseView) -> typing.Any:
+            return view._data.get(field_name)  # noqa: WPS437
+
+    else:
+
+        def get_field(view: ResponseView) -> typing.Any:  # noqa: WPS440
+            field_value = view._data.get(field_name)  # noqa: WPS437
+            return None if field_value is None else convert(field_value)
+
+    return property(get_field, doc=f"The `{field_name}` field.")
+
+
+def _converter(
+    annotation: typing.Any,
+    document_model: typing.Union[type, None],
+) -> typing.Union[_Converter, None]:
+    """Get the function wrapping values of an annotation, or None to keep them."""
+    if isinstance(annotation, typing.TypeVar):
+        if document_model is None:
+            return None
+        if not typing.is_typeddict(document_model):
+            decode: _Converter = model_decoder(document_model).decode
+            return decode
+        annotation = document_model
+
+    origin = typing.get_origin(annotation) or annotation
+    if typing.is_typeddict(origin):
+        return view_type(origin, document_model)
+
+    type_arguments = typing.get_args(annotation)
+    if origin is list and type_arguments:
+        item_converter = _converter(type_arguments[0], document_model)
+        if item_converter is not None:
+            return lambda items: ViewList(items, item_converter)
+    if origin is dict and len(type_arguments) == 2:
+        value_converter = _converter(type_arguments[1], document_model)
+        if value_converter is not None:
+            return lambda items: ViewMapping(items, value_converter)
+    return None
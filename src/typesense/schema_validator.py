@@ -0,0 +1,436 @@
+"""
+This module validates documents against the schema of a collection before they are sent.
+
+The server only reports invalid documents (values of the wrong type, missing required
+fields, vectors with the wrong number of dimensions) after the whole import batch has
+been serialized, sent and indexed. The SchemaValidator class compiles the fields of a
+collection schema into per-field checks once, then checks documents locally and
+filters out the invalid ones before serialization, applying the same fixes as the
+server's `dirty_values` modes.
+
+Classes:
+    SchemaValidator: Checks and fixes documents against a collection schema.
+
+Dependencies:
+    - numpy (optional): NumPy arrays and scalars are checked by their dtype
+    - typesense.serialization: Serializes the documents of failures
+    - typesense.types.collection: Provides the CollectionSchema type
+    - typesense.types.document: Provides the DocumentSchema and ImportResponseFail types
+
+Note: This module is part of the Typesense Python client library and is used internally
+by other components of the library.
+"""
+
+import json
+import sys
+
+from typesense.serialization import dumps
+from typesense.types.collection import CollectionCreateSchema, CollectionFieldSchema
+from typesense.types.document import DocumentSchema, ImportResponseFail
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+TDoc = typing.TypeVar("TDoc", bound=DocumentSchema)
+
+DirtyValues = typing.Literal["reject", "coerce_or_reject", "coerce_or_drop", "drop"]
+
+_Check = typing.Callable[[typing.Any], bool]
+_Coerce = typing.Callable[[typing.Any], typing.Any]
+
+_INT32_RANGE: typing.Final[range] = range(-(2**31), 2**31)
+_INT64_RANGE: typing.Final[range] = range(-(2**63), 2**63)
+_BOOL_STRINGS: typing.Final[typing.Dict[str, bool]] = {"true": True, "false": False}
+_INVALID_DOCUMENT_CODE: typing.Final[int] = 400
+_NUMPY_ARRAY_KINDS: typing.Final[typing.Dict[str, str]] = {
+    "int32": "iu",
+    "int64": "iu",
+    "float": "iuf",
+}
+
+
+class _FieldRule(typing.NamedTuple):
+    """The compiled check of a schema field."""
+
+    name: str
+    description: str
+    optional: bool
+    check: _Check
+    coerce: typing.Union[_Coerce, None]
+
+
+class SchemaValidator:
+    """
+    Checks and fixes documents against a collection schema.
+
+    Fields with a concrete type are checked: strings, integers within their range,
+    floats, booleans, geopoints, objects and arrays of them, and the dimensions of
+    vector fields. Fields typed `auto`, `string*`, `image` or `geopolygon`, fields
+    named by a regular expression, nested fields and embedding fields are left to the
+    server, and fields missing from the schema are accepted, as the server stores
+    them unindexed.
+
+    Invalid values are handled like the server's `dirty_values` parameter: `reject`
+    rejects the document, `drop` drops the value, and the `coerce_or_*` modes first
+    try to convert it, e.g. the string "42" for an int32 field. As on the server,
+    `coerce_or_reject` is the default.
+
+    One-dimensional NumPy arrays are accepted for `float[]`, `int32[]` and `int64[]`
+    fields by their dtype and shape, and NumPy scalars for number fields.
+
+    Attributes:
+        dirty_values (DirtyValues): How invalid values are handled.
+    """
+
+    __slots__ = ("dirty_values", "_rules")
+
+    def __init__(
+        self,
+        schema: CollectionCreateSchema,
+        dirty_values: DirtyValues = "coerce_or_reject",
+    ) -> None:
+        """
+        Compile the checks of a collection schema.
+
+        Args:
+            schema (CollectionCreateSchema): The collection schema, e.g. as returned
+                by `Collection.retrieve`.
+            dirty_values (DirtyValues): How invalid values are handled.
+        """
+        self.dirty_values = dirty_values
+        field_rules = [
+            field_rule
+            for field_rule in map(_compile_field, schema["fields"])
+            if field_rule is not None
+        ]
+        if all(field_rule.name != "id" for field_rule in field_rules):
+            field_rules.append(_ID_RULE)
+        self._rules = tuple(field_rules)
+
+    def validate(
+        self,
+        document: TDoc,
+        partial: bool = False,
+        dirty_values: typing.Union[DirtyValues, None] = None,
+    ) -> typing.Tuple[typing.Union[TDoc, None], typing.Union[str, None]]:
+        """
+        Check a document and apply the fixes of the `dirty_values` mode.
+
+        The document itself is never modified; a copy is returned if it was fixed.
+
+        Args:
+            document (TDoc): The document.
+            partial (bool): Whether the document only holds the fields to change,
+                as for the `update` and `emplace` actions, so that only the fields
+                it holds are checked.
+            dirty_values (Union[DirtyValues, None]): How invalid values are handled,
+                overriding the mode of the validator.
+
+        Returns:
+            Tuple[Union[TDoc, None], Union[str, None]]: The document, fixed if
+                needed, and None, or None and the reason the document is invalid.
+        """
+        dirty_values = dirty_values or self.dirty_values
+        fixed_document: typing.Union[typing.Dict[str, typing.Any], None] = None
+        for field_rule in self._rules:
+            field_value = document.get(field_rule.name)
+            if field_value is None:
+                if field_rule.optional or (partial and field_rule.name not in document):
+                    continue
+                return None, (
+                    f"Field `{field_rule.name}` has been declared in the schema, "
+                    + "but is not found in the document."
+                )
+            if field_rule.check(field_value):
+                continue
+
+            fixed_value = _fix(field_rule, field_value, dirty_values)
+            if fixed_value is None and (
+                dirty_values in {"reject", "coerce_or_reject"}
+                or not field_rule.optional
+            ):
+                return None, (
+                    f"Field `{field_rule.name}` must be {field_rule.description}."
+                )
+            if fixed_document is None:
+                fixed_document = dict(document)
+            if fixed_value is None:
+                del fixed_document[field_rule.name]  # noqa: WPS420
+            else:
+                fixed_document[field_rule.name] = fixed_value
+
+        if fixed_document is None:
+            return document, None
+        return typing.cast(TDoc, fixed_document), None
+
+    def partition(
+        self,
+        documents: typing.Iterable[TDoc],
+        partial: bool = False,
+        dirty_values: typing.Union[DirtyValues, None] = None,
+    ) -> typing.Tuple[
+        typing.List[TDoc],
+        typing.Dict[int, ImportResponseFail[TDoc]],
+    ]:
+        """
+        Split documents into the valid ones and the failures of the invalid ones.
+
+        Args:
+            documents (Iterable[TDoc]): The documents.
+            partial (bool): Whether the documents only hold the fields to change,
+                so that only the fields they hold are checked.
+            dirty_values (Union[DirtyValues, None]): How invalid values are handled,
+                overriding the mode of the validator.
+
+        Returns:
+            Tuple[List[TDoc], Dict[int, ImportResponseFail[TDoc]]]: The valid
+                documents, fixed if needed, and the failures of the invalid ones by
+                their position, shaped like the failures the server reports, with
+                the document as a JSON string.
+        """
+        valid_documents: typing.List[TDoc] = []
+        failures: typing.Dict[int, ImportResponseFail[TDoc]] = {}
+        for document_index, document in enumerate(documents):
+            valid_document, error = self.validate(document, partial, dirty_values)
+            if valid_document is None:
+                failures[document_index] = ImportResponseFail(
+                    success=False,
+                    error=typing.cast(str, error),
+                    code=_INVALID_DOCUMENT_CODE,
+                    document=typing.cast(TDoc, _document_json(document)),
+                )
+            else:
+                valid_documents.append(valid_document)
+        return valid_documents, failures
+
+
+def _fix(
+    field_rule: _FieldRule,
+    field_value: typing.Any,
+    dirty_values: DirtyValues,
+) -> typing.Any:
+    """Get the fixed value of an invalid field, or None if it cannot be kept."""
+    if dirty_values == "reject" or dirty_values == "drop":
+        return None
+    if field_rule.coerce is None:
+        return None
+    try:
+        coerced_value = field_rule.coerce(field_value)
+    except (TypeError, ValueError):
+        return None
+    return coerced_value if field_rule.check(coerced_value) else None
+
+
+def _document_json(document: typing.Mapping[str, typing.Any]) -> str:
+    """Serialize a rejected document like the line the server would have received."""
+    try:
+        document_json: str = dumps(document)
+    except (TypeError, ValueError):
+        document_json = json.dumps(document, default=repr)
+    return document_json
+
+
+def _compile_field(field: CollectionFieldSchema[str]) -> typing.Union[_FieldRule, None]:
+    """Compile the check of a schema field, or None if it is left to the server."""
+    field_name = field["name"]
+    type_name = field.get("type", "auto")
+    if "embed" in field or "." in field_name or _is_regex(field_name):
+        return None
+
+    is_array = type_name.endswith("[]")
+    item_type = type_name[:-2] if is_array else type_name
+    item_check = _ITEM_CHECKS.get(item_type)
+    if item_check is None:
+        return None
+    item_coerce = _ITEM_COERCIONS.get(item_type)
+
+    check = item_check
+    coerce = item_coerce
+    description, plural_description = _TYPE_DESCRIPTIONS[item_type]
+    if is_array:
+        num_dim = field.get("num_dim")
+        check = _array_check(item_check, num_dim, _ndarray_check(item_type))
+        coerce = None if item_coerce is None else _array_coerce(item_coerce)
+        array_length = f"{int(num_dim)} " if num_dim else ""
+        description = f"an array of {array_length}{plural_description}"
+    return _FieldRule(
+        name=field_name,
+        description=description,
+        optional=field.get("optional", False) or field_name == "id",
+        check=check,
+        coerce=coerce,
+    )
+
+
+def _is_regex(field_name: str) -> bool:
+    """Check whether a field name is a regular expression matching several fields."""
+    return any(character in field_name for character in "*^$[]()+?\\|")
+
+
+def _is_int(field_value: typing.Any) -> bool:
+    """Check whether a value is an integer, excluding booleans."""
+    if isinstance(field_value, int):
+        return not isinstance(field_value, bool)
+    return _is_numpy_scalar(field_value, "iu")
+
+
+def _is_number(field_value: typing.Any) -> bool:
+    """Check whether a value is an integer or a float, excluding booleans."""
+    if isinstance(field_value, (int, float)):
+        return not isinstance(field_value, bool)
+    return _is_numpy_scalar(field_value, "iuf")
+
+
+def _int_check(int_range: range) -> _Check:
+    """Build the check of an integer field with the given range."""
+    return lambda field_value: _is_int(field_value) and int(field_value) in int_range
+
+
+def _is_numpy_scalar(field_value: typing.Any, dtype_kinds: str) -> bool:
+    """Check whether a value is a NumPy scalar of one of the dtype kinds."""
+    numpy = sys.modules.get("numpy")
+    return (
+        numpy is not None
+        and isinstance(field_value, numpy.generic)
+        and field_value.dtype.kind in dtype_kinds
+    )
+
+
+def _is_ndarray(field_value: typing.Any) -> bool:
+    """Check whether a value is a NumPy array, without importing NumPy."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(field_value, numpy.ndarray)
+
+
+def _ndarray_check(item_type: str) -> typing.Union[_Check, None]:
+    """Build the check of NumPy arrays for an array field, if they are accepted."""
+    dtype_kinds = _NUMPY_ARRAY_KINDS.get(item_type)
+    if dtype_kinds is None:
+        return None
+    int_range = _INT_RANGES.get(item_type)
+
+    def check(field_value: typing.Any) -> bool:  # noqa: WPS430
+        if field_value.ndim != 1 or field_value.dtype.kind not in dtype_kinds:
+            return False
+        if int_range is None or not field_value.size:
+            return True
+        return (
+            int(field_value.min()) in int_range and int(field_value.max()) in int_range
+        )
+
+    return check
+
+
+def _is_geopoint(field_value: typing.Any) -> bool:
+    """Check whether a value is a latitude and longitude pair."""
+    return (
+        isinstance(field_value, (list, tuple))
+        and len(field_value) == 2
+        and all(map(_is_number, field_value))
+    )
+
+
+def _array_check(
+    item_check: _Check,
+    num_dim: typing.Union[float, None],
+    ndarray_check: typing.Union[_Check, None],
+) -> _Check:
+    """Build the check of an array field from the checks of its items and arrays."""
+    expected_length = int(num_dim) if num_dim else None
+
+    def check(field_value: typing.Any) -> bool:  # noqa: WPS430
+        if ndarray_check is not None and _is_ndarray(field_value):
+            return ndarray_check(field_value) and (
+                expected_length is None or len(field_value) == expected_length
+            )
+        return (
+            isinstance(field_value, (list, tuple))
+            and (expected_length is None or len(field_value) == expected_length)
+            and all(map(item_check, field_value))
+        )
+
+    return check
+
+
+def _array_coerce(item_coerce: _Coerce) -> _Coerce:
+    """Build the coercion of an array field from the coercion of its items."""
+    return lambda field_value: [
+        item_coerce(item_value)
+        for item_value in typing.cast(typing.List[typing.Any], field_value)
+    ]
+
+
+def _coerce_string(field_value: typing.Any) -> str:
+    """Coerce a scalar to a string, like the server does."""
+    if isinstance(field_value, bool):
+        return str(field_value).lower()
+    if _is_number(field_value):
+        return str(field_value)
+    raise TypeError(field_value)
+
+
+def _coerce_int(field_value: typing.Any) -> int:
+    """Coerce a numeric string or an integral float to an integer."""
+    if isinstance(field_value, float) and field_value.is_integer():
+        return int(field_value)
+    if isinstance(field_value, str):
+        return int(field_value)
+    raise TypeError(field_value)
+
+
+def _coerce_float(field_value: typing.Any) -> float:
+    """Coerce a numeric string to a float."""
+    if isinstance(field_value, str):
+        return float(field_value)
+    raise TypeError(field_value)
+
+
+def _coerce_bool(field_value: typing.Any) -> bool:
+    """Coerce the strings "true" and "false" to booleans."""
+    if isinstance(field_value, str) and field_value.lower() in _BOOL_STRINGS:
+        return _BOOL_STRINGS[field_value.lower()]
+    raise ValueError(field_value)
+
+
+_ITEM_CHECKS: typing.Final[typing.Dict[str, _Check]] = {
+    "string": lambda field_value: isinstance(field_value, str),
+    "int32": _int_check(_INT32_RANGE),
+    "int64": _int_check(_INT64_RANGE),
+    "float": _is_number,
+    "bool": lambda field_value: isinstance(field_value, bool),
+    "geopoint": _is_geopoint,
+    "object": lambda field_value: isinstance(field_value, dict),
+}
+
+_INT_RANGES: typing.Final[typing.Dict[str, range]] = {
+    "int32": _INT32_RANGE,
+    "int64": _INT64_RANGE,
+}
+
+_ITEM_COERCIONS: typing.Final[typing.Dict[str, _Coerce]] = {
+    "string": _coerce_string,
+    "int32": _coerce_int,
+    "int64": _coerce_int,
+    "float": _coerce_float,
+    "bool": _coerce_bool,
+}
+
+_TYPE_DESCRIPTIONS: typing.Final[typing.Dict[str, typing.Tuple[str, str]]] = {
+    "string": ("a string", "strings"),
+    "int32": ("an int32", "int32 values"),
+    "int64": ("an int64", "int64 values"),
+    "float": ("a float", "floats"),
+    "bool": ("a bool", "bools"),
+    "geopoint": ("a geopoint", "geopoints"),
+    "object": ("an object", "objects"),
+}
+
+_ID_RULE: typing.Final[_FieldRule] = _FieldRule(
+    name="id",
+    description="a string",
+    optional=True,
+    check=_ITEM_CHECKS["string"],
+    coerce=None,
+)
@@ -0,0 +1,471 @@
+"""
+This module serializes request bodies and documents, with native support for NumPy values.
+
+Documents often carry `float[]` embeddings as NumPy arrays, which the standard JSON
+encoder cannot serialize; converting them with `.tolist()` leaves the stdlib to format
+every float in Python, which dominates the CPU time of large imports. Top-level
+one-dimensional numeric arrays are instead formatted by NumPy in a single vectorized
+pass and spliced into the JSON text, optionally rounded to a fixed number of decimals.
+Other NumPy values, such as scalars or nested arrays, are converted to built-in types.
+
+NumPy is never imported by this module: documents can only hold NumPy values once the
+application imported it, so documents without them are serialized by the standard
+JSON encoder at no extra cost.
+
+Tables, pandas DataFrames or Arrow tables and record batches, are serialized to JSONL
+column by column: the values of each column are formatted together, NumPy and Arrow
+numeric columns in a vectorized pass, and the formatted values are joined row by row,
+without ever building a dict per row.
+
+Functions:
+    dumps: Serialize a document or request body to JSON.
+    dumps_table: Serialize the rows of a table to JSONL, batch by batch.
+    vector_query: Build the `vector_query` search parameter of a vector.
+    vector_queries: Build the `vector_query` search parameters of many vectors.
+
+Dependencies:
+    - numpy (optional): Formats arrays, when the serialized values hold any
+    - pyarrow (optional): Reads the columns of Arrow tables, when serializing them
+
+Note: This module is part of the Typesense Python client library and is used internally
+by other components of the library.
+"""
+
+import json
+import sys
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+_VectorOption = typing.Union[int, float, str, bool]
+
+_ColumnValues = typing.List[typing.Union[str, None]]
+
+_NUMERIC_DTYPE_KINDS: typing.Final[str] = "iuf"
+
+
+def dumps(
+    body: typing.Any,
+    float_precision: typing.Union[int, None] = None,
+) -> str:
+    """
+    Serialize a document or request body to JSON.
+
+    Args:
+        body (Any): The document or body, which may hold NumPy arrays and scalars.
+        float_precision (Union[int, None], optional): The number of decimals floats
+            of NumPy arrays are rounded to. Defaults to their shortest exact form.
+
+    Returns:
+        str: The JSON text.
+
+    Raises:
+        TypeError: If the body holds values that cannot be serialized.
+        ValueError: If a NumPy array of the body holds NaN or infinite floats.
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is None:
+        return json.dumps(body)
+    if not isinstance(body, dict):
+        return json.dumps(body, default=_to_builtin)
+
+    array_fields = {
+        field_name: field_value
+        for field_name, field_value in body.items()
+        if isinstance(field_value, numpy.ndarray)
+        and field_value.ndim == 1
+        and field_value.dtype.kind in _NUMERIC_DTYPE_KINDS
+    }
+    if not array_fields:
+        return json.dumps(body, default=_to_builtin)
+
+    other_fields = {
+        field_name: field_value
+        for field_name, field_value in body.items()
+        if field_name not in array_fields
+    }
+    array_fragments = ",".join(
+        f"{json.dumps(field_name)}:[{_format_array(field_value, float_precision)}]"
+        for field_name, field_value in array_fields.items()
+    )
+    if not other_fields:
+        return f"{{{array_fragments}}}"
+    return f"{json.dumps(other_fields, default=_to_builtin)[:-1]},{array_fragments}}}"
+
+
+def dumps_table(
+    table: typing.Any,
+    batch_rows: int = 1000,
+    float_precision: typing.Union[int, None] = None,
+) -> typing.Iterator[str]:
+    """
+    Serialize the rows of a table to JSONL, batch by batch.
+
+    Each row becomes a document holding the columns of the table. Missing values,
+    such as nulls, NaN or None, are left out of the documents, as are non-finite
+    floats. The index of a DataFrame is ignored.
+
+    Args:
+        table (Any): The table, a pandas DataFrame or a `pyarrow.Table` or
+            `pyarrow.RecordBatch`.
+        batch_rows (int): The maximum number of rows of each batch.
+        float_precision (Union[int, None], optional): The number of decimals floats
+            are rounded to. Defaults to their shortest exact form.
+
+    Yields:
+        str: The JSONL of each batch of rows, in order.
+
+    Raises:
+        ValueError: If an array or list of numbers holds NaN, infinite floats or
+            nulls, as its elements cannot be left out like the values of a column.
+    """
+    if type(table).__module__.split(".")[0] == "pyarrow":
+        batches = _arrow_batches(table, batch_rows, float_precision)
+    else:
+        batches = _pandas_batches(table, batch_rows, float_precision)
+    for num_rows, columns in batches:
+        yield _jsonl(num_rows, columns)
+
+
+def vector_query(
+    field_name: str,
+    vector: typing.Union[typing.Sequence[float], typing.Any],
+    float_precision: typing.Union[int, None] = None,
+    **options: _VectorOption,
+) -> str:
+    """
+    Build the `vector_query` search parameter of a vector.
+
+    Args:
+        field_name (str): The name of the vector field.
+        vector (Union[Sequence[float], Any]): The query vector, as a sequence of
+            floats or a NumPy array.
+        float_precision (Union[int, None], optional): The number of decimals the
+            floats of a NumPy array are rounded to.
+        options (Union[int, float, str, bool]): Options of the vector query, such
+            as `k` or `distance_threshold`.
+
+    Returns:
+        str: The vector query.
+
+    Raises:
+        ValueError: If a NumPy vector holds NaN or infinite floats.
+
+    Examples:
+        >>> vector_query("embedding", [0.25, 0.5], k=10)
+        'embedding:([0.25,0.5], k:10)'
+    """
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(vector, numpy.ndarray):
+        formatted_vector = _format_array(vector.ravel(), float_precision)
+    else:
+        formatted_vector = ",".join(map(repr, map(float, vector)))
+    return f"{field_name}:([{formatted_vector}]{_format_options(options)})"
+
+
+def vector_queries(
+    field_name: str,
+    vectors: typing.Union[typing.Sequence[typing.Sequence[float]], typing.Any],
+    float_precision: typing.Union[int, None] = None,
+    **options: _VectorOption,
+) -> typing.List[str]:
+    """
+    Build the `vector_query` search parameters of many vectors.
+
+    The values of a NumPy matrix are formatted in a single vectorized pass.
+
+    Args:
+        field_name (str): The name of the vector field.
+        vectors (Union[Sequence[Sequence[float]], Any]): The query vectors, as
+            sequences of floats or the rows of a two-dimensional NumPy array.
+        float_precision (Union[int, None], optional): The number of decimals the
+            floats of a NumPy array are rounded to.
+        options (Union[int, float, str, bool]): Options of the vector queries, such
+            as `k` or `distance_threshold`.
+
+    Returns:
+        List[str]: The vector query of each vector, in order.
+
+    Raises:
+        ValueError: If a NumPy array is not two-dimensional, or holds NaN or
+            infinite floats.
+    """
+    if not len(vectors):
+        return []
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(vectors, numpy.ndarray):
+        if vectors.ndim != 2:
+            raise ValueError(
+                "Query vectors must be the rows of a two-dimensional array, "
+                + f"got an array of {vectors.ndim} dimensions.",
+            )
+        matrix = vectors
+        if matrix.dtype.kind == "f" and float_precision is not None:
+            matrix = matrix.round(float_precision)
+        _check_finite(numpy, matrix)
+        formatted_vectors = [",".join(row) for row in matrix.astype(str).tolist()]
+    else:
+        formatted_vectors = [
+            ",".join(map(repr, map(float, vector))) for vector in vectors
+        ]
+    formatted_options = _format_options(options)
+    return [
+        f"{field_name}:([{formatted_vector}]{formatted_options})"
+        for formatted_vector in formatted_vectors
+    ]
+
+
+def _format_array(array: typing.Any, float_precision: typing.Union[int, None]) -> str:
+    """Format the values of a one-dimensional numeric array in one vectorized pass."""
+    _check_finite(sys.modules["numpy"], array)
+    return ",".join(_format_values(array, float_precision))
+
+
+def _check_finite(numpy: typing.Any, array: typing.Any) -> None:
+    """Reject NaN and infinite floats, which have no JSON representation."""
+    if array.dtype.kind == "f" and not numpy.isfinite(array).all():
+        raise ValueError("Out of range float values are not JSON compliant")
+
+
+def _format_values(
+    array: typing.Any,
+    float_precision: typing.Union[int, None],
+) -> typing.List[str]:
+    """Format each value of a one-dimensional numeric or boolean array."""
+    if array.dtype.kind == "b":
+        return ["true" if array_value else "false" for array_value in array.tolist()]
+    if array.dtype.kind == "f" and float_precision is not None:
+        array = array.round(float_precision)
+    return typing.cast(typing.List[str], array.astype(str).tolist())
+
+
+def _jsonl(num_rows: int, columns: typing.List[_ColumnValues]) -> str:
+    """Join the formatted `"name":value` pairs of the columns into JSONL rows."""
+    if not columns:
+        return "\n".join(["{}"] * num_rows)
+    return "\n".join(
+        f"{{{','.join(filter(None, row_pairs))}}}" for row_pairs in zip(*columns)
+    )
+
+
+def _column_pairs(
+    column_name: typing.Any,
+    column_values: _ColumnValues,
+) -> _ColumnValues:
+    """Prefix the formatted values of a column with its name, skipping missing ones."""
+    prefix = f"{json.dumps(str(column_name))}:"
+    return [
+        None if column_value is None else prefix + column_value
+        for column_value in column_values
+    ]
+
+
+def _format_numbers(
+    numpy: typing.Any,
+    array: typing.Any,
+    missing: typing.Any,
+    float_precision: typing.Union[int, None],
+) -> _ColumnValues:
+    """Format a numeric or boolean column, leaving out missing and non-finite values."""
+    if array.dtype.kind == "f":
+        non_finite = ~numpy.isfinite(array)
+        missing = non_finite if missing is None else missing | non_finite
+    column_values: _ColumnValues = list(_format_values(array, float_precision))
+    if missing is not None:
+        for row_index in numpy.flatnonzero(missing).tolist():
+            column_values[row_index] = None
+    return column_values
+
+
+def _format_objects(
+    column_values: typing.Iterable[typing.Any],
+    missing: typing.Sequence[bool],
+    float_precision: typing.Union[int, None],
+) -> _ColumnValues:
+    """Format a column of arbitrary values, one value at a time."""
+    return [
+        None if is_missing else _format_object(column_value, float_precision)
+        for column_value, is_missing in zip(column_values, missing)
+    ]
+
+
+def _format_object(
+    column_value: typing.Any,
+    float_precision: typing.Union[int, None],
+) -> str:
+    """Format a value of a column, with vectorized formatting of numeric arrays."""
+    numpy = sys.modules.get("numpy")
+    if (
+        numpy is not None
+        and isinstance(column_value, numpy.ndarray)
+        and column_value.ndim == 1
+        and column_value.dtype.kind in _NUMERIC_DTYPE_KINDS
+    ):
+        return f"[{_format_array(column_value, float_precision)}]"
+    return dumps(column_value, float_precision)
+
+
+def _pandas_batches(
+    frame: typing.Any,
+    batch_rows: int,
+    float_precision: typing.Union[int, None],
+) -> typing.Iterator[typing.Tuple[int, typing.List[_ColumnValues]]]:
+    """Format the columns of the batches of rows of a pandas DataFrame."""
+    import numpy  # noqa: WPS433
+
+    for batch_start in range(0, len(frame), batch_rows):
+        batch = frame.iloc[batch_start : batch_start + batch_rows]
+        columns: typing.List[_ColumnValues] = []
+        for column_name, series in batch.items():
+            missing = series.isna().to_numpy()
+            if missing.any() and series.dtype.kind in "biu":
+                array = series.to_numpy(
+                    dtype=series.dtype.numpy_dtype,
+                    na_value=series.dtype.numpy_dtype.type(0),
+                )
+            else:
+                array = series.to_numpy()
+            if array.dtype.kind in "biuf":
+                column_values = _format_numbers(
+                    numpy,
+                    array,
+                    missing if missing.any() else None,
+                    float_precision,
+                )
+            else:
+                column_values = _format_objects(
+                    array.tolist(),
+                    missing.tolist(),
+                    float_precision,
+                )
+            columns.append(_column_pairs(column_name, column_values))
+        yield len(batch), columns
+
+
+def _arrow_batches(
+    table: typing.Any,
+    batch_rows: int,
+    float_precision: typing.Union[int, None],
+) -> typing.Iterator[typing.Tuple[int, typing.List[_ColumnValues]]]:
+    """Format the columns of the batches of rows of an Arrow table or record batch."""
+    import pyarrow  # noqa: WPS433
+
+    if isinstance(table, pyarrow.RecordBatch):
+        table = pyarrow.Table.from_batches([table])
+    for batch in table.to_batches(max_chunksize=batch_rows):
+        yield batch.num_rows, [
+            _column_pairs(
+                column_name,
+                _format_arrow_column(pyarrow, column, float_precision),
+            )
+            for column_name, column in zip(batch.schema.names, batch.columns)
+        ]
+
+
+def _format_arrow_column(
+    pyarrow: typing.Any,
+    column: typing.Any,
+    float_precision: typing.Union[int, None],
+) -> _ColumnValues:
+    """Format an Arrow column, with vectorized formatting of numbers and vectors."""
+    import numpy  # noqa: WPS433
+
+    column_type = column.type
+    missing = None
+    if column.null_count:
+        missing = column.is_null().to_numpy(zero_copy_only=False)
+    if _is_arrow_number(pyarrow, column_type):
+        if column.null_count:
+            column = column.fill_null(
+                False if pyarrow.types.is_boolean(column_type) else 0,
+            )
+        return _format_numbers(
+            numpy,
+            column.to_numpy(zero_copy_only=False),
+            missing,
+            float_precision,
+        )
+    if _is_arrow_list(pyarrow, column_type) and _is_arrow_number(
+        pyarrow,
+        column_type.value_type,
+    ):
+        return _format_arrow_vectors(numpy, column, missing, float_precision)
+    return [
+        None if column_value is None else json.dumps(column_value)
+        for column_value in column.to_pylist()
+    ]
+
+
+def _format_arrow_vectors(
+    numpy: typing.Any,
+    column: typing.Any,
+    missing: typing.Any,
+    float_precision: typing.Union[int, None],
+) -> _ColumnValues:
+    """Format an Arrow column of numeric lists, such as embeddings, in one pass."""
+    import pyarrow.compute  # noqa: WPS433
+
+    present_column = column if missing is None else column.drop_null()
+    flat_column = present_column.flatten()
+    if flat_column.null_count:
+        raise ValueError("Lists of numbers cannot hold null values")
+    flat_array = flat_column.to_numpy(zero_copy_only=False)
+    _check_finite(numpy, flat_array)
+    flat_values = _format_values(flat_array, float_precision)
+    lengths = pyarrow.compute.list_value_length(present_column)
+    ends = numpy.cumsum(lengths.to_numpy(zero_copy_only=False)).tolist()
+    vectors = [
+        f"[{','.join(flat_values[start:end])}]"
+        for start, end in zip([0, *ends[:-1]], ends)
+    ]
+    if missing is None:
+        return typing.cast(_ColumnValues, vectors)
+    present_vectors = iter(vectors)
+    return [
+        None if is_missing else next(present_vectors) for is_missing in missing.tolist()
+    ]
+
+
+def _is_arrow_number(pyarrow: typing.Any, column_type: typing.Any) -> bool:
+    """Check whether an Arrow type is an integer, float or boolean type."""
+    return bool(
+        pyarrow.types.is_integer(column_type)
+        or pyarrow.types.is_floating(column_type)
+        or pyarrow.types.is_boolean(column_type),
+    )
+
+
+def _is_arrow_list(pyarrow: typing.Any, column_type: typing.Any) -> bool:
+    """Check whether an Arrow type is a list type."""
+    return bool(
+        pyarrow.types.is_list(column_type)
+        or pyarrow.types.is_large_list(column_type)
+        or pyarrow.types.is_fixed_size_list(column_type),
+    )
+
+
+def _format_options(options: typing.Mapping[str, _VectorOption]) -> str:
+    """Format the options of a vector query."""
+    return "".join(
+        f", {option_name}:{_format_option(option_value)}"
+        for option_name, option_value in options.items()
+    )
+
+
+def _format_option(option_value: _VectorOption) -> str:
+    """Format the value of a vector query option."""
+    if isinstance(option_value, bool):
+        return str(option_value).lower()
+    return str(option_value)
+
+
+def _to_builtin(field_value: typing.Any) -> typing.Any:
+    """Convert a NumPy array or scalar the JSON encoder does not know to built-ins."""
+    to_builtin = getattr(field_value, "tolist", None)
+    if to_builtin is None or type(field_value).__module__ != "numpy":
+        raise TypeError(
+            f"Object of type {type(field_value).__name__} is not JSON serializable",
+        )
+    return to_builtin()
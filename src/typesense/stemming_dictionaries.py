@@ -36,6 +36,7 @@ else:
 import json
 
 from typesense.api_call import ApiCall
+from typesense.handle_cache import HandleCache
 from typesense.stemming_dictionary import StemmingDictionary
 from typesense.types.stemming import (
     StemmingDictionariesRetrieveSchema,
@@ -52,8 +53,8 @@ class StemmingDictionaries:
 
     Attributes:
         api_call (ApiCall): The API call object for making requests.
-        stemming_dictionaries (Dict[str, StemmingDictionary]): A dictionary of
-            StemmingDictionary objects.
+        stemming_dictionaries (HandleCache[str, StemmingDictionary]):
+            A bounded cache of StemmingDictionary objects.
     """
 
     resource_path: typing.Final[str] = "/stemming/dictionaries"
@@ -66,7 +67,9 @@ class StemmingDictionaries:
             api_call (ApiCall): The API call object for making requests.
         """
         self.api_call = api_call
-        self.stemming_dictionaries: typing.Dict[str, StemmingDictionary] = {}
+        self.stemming_dictionaries: HandleCache[str, StemmingDictionary] = HandleCache(
+            api_call.config.handle_cache_size,
+        )
 
     def __getitem__(self, dictionary_id: str) -> StemmingDictionary:
         """
@@ -78,12 +81,10 @@ class StemmingDictionaries:
         Returns:
             StemmingDictionary: The StemmingDictionary object for the given ID.
         """
-        if not self.stemming_dictionaries.get(dictionary_id):
-            self.stemming_dictionaries[dictionary_id] = StemmingDictionary(
-                self.api_call,
-                dictionary_id,
-            )
-        return self.stemming_dictionaries[dictionary_id]
+        return self.stemming_dictionaries.get_or_create(
+            dictionary_id,
+            lambda: StemmingDictionary(self.api_call, dictionary_id),
+        )
 
     def retrieve(self) -> StemmingDictionariesRetrieveSchema:
         """
@@ -37,6 +37,8 @@ class StemmingDictionary:
         dict_id (str): The ID of the stemming dictionary.
     """
 
+    __slots__ = ("api_call", "dict_id")
+
     def __init__(self, api_call: ApiCall, dict_id: str):
         """
         Initialize the StemmingDictionary object.
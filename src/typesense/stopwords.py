@@ -24,6 +24,7 @@ versions through the use of the typing_extensions library.
 import sys
 
 from typesense.api_call import ApiCall
+from typesense.handle_cache import HandleCache
 from typesense.stopwords_set import StopwordsSet
 from typesense.types.stopword import (
     StopwordCreateSchema,
@@ -47,7 +48,8 @@ class Stopwords:
     Attributes:
         RESOURCE_PATH (str): The API resource path for stopwords operations.
         api_call (ApiCall): The API call object for making requests.
-        stopwords_sets (Dict[str, StopwordsSet]): A dictionary of StopwordsSet objects.
+        stopwords_sets (HandleCache[str, StopwordsSet]):
+            A bounded cache of StopwordsSet objects.
     """
 
     resource_path: typing.Final[str] = "/stopwords"
@@ -60,7 +62,9 @@ class Stopwords:
             api_call (ApiCall): The API call object for making requests.
         """
         self.api_call = api_call
-        self.stopwords_sets: typing.Dict[str, StopwordsSet] = {}
+        self.stopwords_sets: HandleCache[str, StopwordsSet] = HandleCache(
+            api_call.config.handle_cache_size,
+        )
 
     def __getitem__(self, stopwords_set_id: str) -> StopwordsSet:
         """
@@ -72,12 +76,10 @@ class Stopwords:
         Returns:
             StopwordsSet: The StopwordsSet object for the given ID.
         """
-        if not self.stopwords_sets.get(stopwords_set_id):
-            self.stopwords_sets[stopwords_set_id] = StopwordsSet(
-                self.api_call,
-                stopwords_set_id,
-            )
-        return self.stopwords_sets[stopwords_set_id]
+        return self.stopwords_sets.get_or_create(
+            stopwords_set_id,
+            lambda: StopwordsSet(self.api_call, stopwords_set_id),
+        )
 
     def upsert(
         self,
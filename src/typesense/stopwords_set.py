@@ -36,6 +36,8 @@ class StopwordsSet:
         api_call (ApiCall): The API call object for making requests.
     """
 
+    __slots__ = ("stopwords_set_id", "api_call")
+
     def __init__(self, api_call: ApiCall, stopwords_set_id: str) -> None:
         """
         Initialize the StopwordsSet object.
@@ -39,6 +39,8 @@ class Synonym:
         synonym_id (str): The ID of the synonym.
     """
 
+    __slots__ = ("api_call", "collection_name", "synonym_id")
+
     @warn_deprecation(  # type: ignore[misc]
         "The synonym API (collections/{collection}/synonyms/{synonym_id}) is deprecated is removed on v30+. "
         "Use synonym sets (synonym_sets) instead.",
@@ -18,6 +18,8 @@ from typesense.types.synonym_set import (
 
 
 class SynonymSet:
+    __slots__ = ("api_call", "name")
+
     def __init__(self, api_call: ApiCall, name: str) -> None:
         self.api_call = api_call
         self.name = name
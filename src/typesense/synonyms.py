@@ -30,6 +30,7 @@ import sys
 from typing_extensions import deprecated
 
 from typesense.api_call import ApiCall
+from typesense.handle_cache import HandleCache
 from typesense.logger import warn_deprecation
 from typesense.synonym import Synonym
 from typesense.types.synonym import (
@@ -56,7 +57,7 @@ class Synonyms:
         RESOURCE_PATH (str): The API resource path for synonyms.
         api_call (ApiCall): The API call object for making requests.
         collection_name (str): The name of the collection.
-        synonyms (Dict[str, Synonym]): A dictionary of Synonym objects.
+        synonyms (HandleCache[str, Synonym]): A bounded cache of Synonym objects.
     """
 
     resource_path: typing.Final[str] = "synonyms"
@@ -76,7 +77,9 @@ class Synonyms:
         """
         self.api_call = api_call
         self.collection_name = collection_name
-        self.synonyms: typing.Dict[str, Synonym] = {}
+        self.synonyms: HandleCache[str, Synonym] = HandleCache(
+            api_call.config.handle_cache_size,
+        )
 
     def __getitem__(self, synonym_id: str) -> Synonym:
         """
@@ -88,13 +91,10 @@ class Synonyms:
         Returns:
             Synonym: The Synonym object for the given ID.
         """
-        if not self.synonyms.get(synonym_id):
-            self.synonyms[synonym_id] = Synonym(
-                self.api_call,
-                self.collection_name,
-                synonym_id,
-            )
-        return self.synonyms[synonym_id]
+        return self.synonyms.get_or_create(
+            synonym_id,
+            lambda: Synonym(self.api_call, self.collection_name, synonym_id),
+        )
 
     def upsert(self, synonym_id: str, schema: SynonymCreateSchema) -> SynonymSchema:
         """
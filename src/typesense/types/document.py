@@ -783,6 +783,7 @@ class Hit(typing.Generic[TDoc], typing.TypedDict):
       highlight (dict[str, Highlight]): Dictionary of highlights in the hit.
       text_match (int): Text match in the hit.
       text_match_info (TextMatchInfo): Text match information in the hit.
+      vector_distance (float): Distance of the document to the query vector.
     """
 
     document: TDoc
@@ -790,6 +791,7 @@ class Hit(typing.Generic[TDoc], typing.TypedDict):
     highlight: typing.Dict[str, Highlight]
     text_match: int
     text_match_info: TextMatchInfo
+    vector_distance: typing.NotRequired[float]
 
 
 class GroupedHit(typing.Generic[TDoc], typing.TypedDict):
@@ -954,3 +956,34 @@ class RetrieveParameters(typing.TypedDict):
 
     include_fields: typing.NotRequired[typing.Union[str, typing.List[str]]]
     exclude_fields: typing.NotRequired[typing.Union[str, typing.List[str]]]
+
+
+class GetManyResponse(typing.Generic[TDoc], typing.TypedDict):
+    """
+    Response from fetching documents by their ids.
+
+    Attributes:
+      documents (list[TDoc | None]): The documents, in the order of the requested
+        ids, with None for the ids that were not found.
+      missing (list[str]): The requested ids that were not found.
+    """
+
+    documents: typing.List[typing.Union[TDoc, None]]
+    missing: typing.List[str]
+
+
+class VectorSearchArrays(typing.TypedDict):
+    """
+    The nearest neighbours of many query vectors, as NumPy arrays.
+
+    Rows follow the order of the query vectors and columns the rank of the hits.
+    Rows with fewer than `k` hits are padded with None ids and NaN distances.
+
+    Attributes:
+      ids (numpy.ndarray): The ids of the hits, an object array of shape (N, k).
+      distances (numpy.ndarray): The vector distances of the hits, a float array
+        of shape (N, k).
+    """
+
+    ids: typing.Any
+    distances: typing.Any
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import logging
+import os
 import sys
+import threading
 import time
 
 from pytest_mock import MockFixture
@@ -19,9 +21,13 @@ import requests_mock
 from pytest_mock import MockerFixture
 
 from tests.utils.object_assertions import assert_match_object, assert_object_lists_match
+from typesense import api_call as api_call_module
+from typesense import client as client_module
 from typesense import exceptions
+from typesense import handle_cache as handle_cache_module
 from typesense.api_call import ApiCall, RequestHandler
-from typesense.configuration import Configuration, Node
+from typesense.client import Client
+from typesense.configuration import ConfigDict, Configuration, Node
 from typesense.logger import logger
 
 
@@ -170,6 +176,85 @@ def test_normalize_params_with_no_booleans() -> None:
     assert parameter_dict == {"key1": "value", "key2": 123}
 
 
+def test_normalized_params_does_not_mutate() -> None:
+    """Test that it normalizes boolean values into a copy of the parameters."""
+    parameter_dict = {"key1": True, "key2": "value"}
+
+    normalized = RequestHandler.normalized_params(parameter_dict)
+
+    assert normalized == {"key1": "true", "key2": "value"}
+    assert parameter_dict == {"key1": True, "key2": "value"}
+
+
+def test_normalized_params_without_booleans_is_not_copied() -> None:
+    """Test that it returns parameters without boolean values as is."""
+    parameter_dict = {"key1": "value", "key2": 123}
+
+    assert RequestHandler.normalized_params(parameter_dict) is parameter_dict
+
+
+def test_normalized_params_with_non_dict() -> None:
+    """Test that it raises when a non-dictionary is passed."""
+    with pytest.raises(ValueError):
+        RequestHandler.normalized_params("string")
+
+
+def test_request_does_not_mutate_caller_arguments(fake_api_call: ApiCall) -> None:
+    """Test that the caller's parameters and headers are left untouched."""
+    parameter_set = {"key1": True}
+    headers = {"X-Custom": "value"}
+
+    with requests_mock.Mocker() as request_mocker:
+        request_mocker.get("http://nearest:8108/test", json={}, status_code=200)
+
+        fake_api_call.request_handler.make_request(
+            requests.get,
+            "http://nearest:8108/test",
+            entity_type=typing.Dict[str, str],
+            as_json=True,
+            headers=headers,
+            timeout=1,
+        )
+        fake_api_call.get(
+            "/test",
+            params=parameter_set,
+            entity_type=typing.Dict[str, str],
+        )
+
+        request = request_mocker.request_history[0]
+
+    assert request.headers["X-Custom"] == "value"
+    assert request.headers["X-TYPESENSE-API-KEY"] == "test-api-key"
+    assert headers == {"X-Custom": "value"}
+    assert parameter_set == {"key1": True}
+
+
+@pytest.mark.benchmark
+def test_make_request_overhead(fake_config: Configuration) -> None:
+    """Track the per-request overhead of `make_request` on top of the transport."""
+    request_handler = RequestHandler(fake_config)
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = b"{}"  # noqa: WPS437
+    iterations = 10_000
+
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        request_handler.make_request(
+            lambda url, **kwargs: response,
+            "http://nearest:8108/test",
+            entity_type=str,
+            as_json=False,
+            params={"q": "value"},
+            timeout=1,
+        )
+    overhead_us = (time.perf_counter() - start_time) / iterations * 1_000_000
+    sys.stdout.write(f"make_request overhead: {overhead_us:.2f} us\n")
+
+    assert overhead_us < 20
+
+
 def test_additional_headers(fake_api_call: ApiCall) -> None:
     """Test the `make_request` method with additional headers from the config."""
     session = requests.sessions.Session()
@@ -630,3 +715,427 @@ def test_max_retries_no_last_exception(fake_api_call: ApiCall) -> None:
             num_retries=10,
             last_exception=None,
         )
+
+
+def test_deadline_caps_attempt_timeout(fake_api_call: ApiCall) -> None:
+    """Test that each attempt only gets the remaining deadline budget."""
+    fake_api_call.config.connection_timeout_seconds = 10
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get(
+            "http://nearest:8108/test",
+            json={"key": "value"},
+            status_code=200,
+        )
+
+        fake_api_call.get(
+            "/test",
+            entity_type=typing.Dict[str, str],
+            deadline_seconds=0.5,
+        )
+
+        assert 0 < request_mocker.request_history[0].timeout <= 0.5
+
+
+def test_deadline_from_config(fake_api_call: ApiCall) -> None:
+    """Test that the configured deadline is used when none is passed per call."""
+    fake_api_call.config.connection_timeout_seconds = 10
+    fake_api_call.config.deadline_seconds = 0.5
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get(
+            "http://nearest:8108/test",
+            json={"key": "value"},
+            status_code=200,
+        )
+
+        fake_api_call.get("/test", entity_type=typing.Dict[str, str])
+
+        assert 0 < request_mocker.request_history[0].timeout <= 0.5
+
+
+def test_deadline_exceeded_stops_retrying(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that it fails fast once the deadline has expired."""
+    mocker.patch("time.monotonic", side_effect=[0, 0.5, 2])
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get(
+            "http://nearest:8108/test",
+            exc=requests.exceptions.ConnectTimeout,
+        )
+        request_mocker.get(
+            "http://node0:8108/test",
+            json={"key": "value"},
+            status_code=200,
+        )
+
+        with pytest.raises(exceptions.Timeout, match="Request deadline exceeded"):
+            fake_api_call.get(
+                "/test",
+                entity_type=typing.Dict[str, str],
+                deadline_seconds=1,
+            )
+
+        assert request_mocker.call_count == 1
+
+
+def test_leader_aware_writes(fake_config_dict: ConfigDict) -> None:
+    """Test that writes go to the leader while reads keep the regular selection."""
+    fake_config_dict["leader_aware_writes"] = True
+    api_call = ApiCall(Configuration(fake_config_dict))
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("http://node0:8108/debug", json={"state": 4})
+        request_mocker.get("http://node1:8108/debug", json={"state": 1})
+        request_mocker.post("http://node1:8108/test", json={"key": "value"})
+        request_mocker.get("http://nearest:8108/test", json={"key": "value"})
+
+        api_call.post("/test", body={}, entity_type=typing.Dict[str, str])
+        api_call.post("/test", body={}, entity_type=typing.Dict[str, str])
+        api_call.get("/test", entity_type=typing.Dict[str, str])
+
+        assert [request.url for request in request_mocker.request_history] == [
+            "http://node0:8108/debug",
+            "http://node1:8108/debug",
+            "http://node1:8108/test",
+            "http://node1:8108/test",
+            "http://nearest:8108/test",
+        ]
+        assert api_call.node_manager.leader_node is api_call.node_manager.nodes[1]
+
+
+def test_leader_aware_writes_keep_reads_off_the_leader(
+    fake_config_dict: ConfigDict,
+) -> None:
+    """Test that searches and node operations sent with POST are not writes."""
+    fake_config_dict["leader_aware_writes"] = True
+    api_call = ApiCall(Configuration(fake_config_dict))
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.post(
+            "http://nearest:8108/collections/companies/documents/search",
+            json={"hits": []},
+        )
+        request_mocker.post("http://nearest:8108/multi_search", json={"results": []})
+        request_mocker.post(
+            "http://nearest:8108/operations/db/compact",
+            json={"success": True},
+        )
+
+        for endpoint in (
+            "/collections/companies/documents/search",
+            "/multi_search",
+            "/operations/db/compact",
+        ):
+            api_call.post(endpoint, body={}, entity_type=typing.Dict[str, str])
+
+        assert request_mocker.call_count == 3
+        assert api_call.node_manager.leader_node is None
+
+
+def test_success_marks_the_node_used_as_healthy(
+    fake_config_dict: ConfigDict,
+) -> None:
+    """Test that a successful request marks the node it was sent to as healthy."""
+    fake_config_dict["leader_aware_writes"] = True
+    api_call = ApiCall(Configuration(fake_config_dict))
+    leader = api_call.node_manager.nodes[1]
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("http://node0:8108/debug", json={"state": 4})
+        request_mocker.get("http://node1:8108/debug", json={"state": 1})
+        request_mocker.post("http://node1:8108/test", json={"key": "value"})
+
+        api_call.post("/test", body={}, entity_type=typing.Dict[str, str])
+        leader.healthy = False
+        leader.last_access_ts = 0
+        api_call.post("/test", body={}, entity_type=typing.Dict[str, str])
+
+        assert leader.healthy
+        assert request_mocker.request_history[-1].url == "http://node1:8108/test"
+
+
+def test_leader_is_looked_up_again_after_failure(
+    fake_config_dict: ConfigDict,
+) -> None:
+    """Test that a failed write to the leader triggers a new leader lookup."""
+    fake_config_dict["leader_aware_writes"] = True
+    api_call = ApiCall(Configuration(fake_config_dict))
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("http://node0:8108/debug", json={"state": 4})
+        request_mocker.get(
+            "http://node1:8108/debug",
+            [{"json": {"state": 1}}, {"json": {"state": 4}}],
+        )
+        request_mocker.get("http://node2:8108/debug", json={"state": 1})
+        request_mocker.post(
+            "http://node1:8108/test",
+            exc=requests.exceptions.ConnectTimeout,
+        )
+        request_mocker.post("http://node2:8108/test", json={"key": "value"})
+
+        response = api_call.post("/test", body={}, entity_type=typing.Dict[str, str])
+
+        assert response == {"key": "value"}
+        assert api_call.node_manager.leader_node is api_call.node_manager.nodes[2]
+        assert request_mocker.request_history[-1].url == "http://node2:8108/test"
+
+
+def test_auto_nearest_node_uses_fastest_node(
+    fake_config_dict: ConfigDict,
+    mocker: MockerFixture,
+) -> None:
+    """Test that the fastest probed node becomes the effective nearest node."""
+    fake_config_dict["auto_nearest_node"] = True
+    latencies = {"nearest": 0.3, "node0": 0.2, "node1": None, "node2": 0.1}
+    mocker.patch.object(
+        ApiCall,
+        "_probe_node_latency",
+        side_effect=lambda node: latencies[node.host],
+    )
+
+    api_call = ApiCall(Configuration(fake_config_dict))
+
+    ranking = api_call.node_manager.latency_ranking
+    assert [(node.host, latency) for node, latency in ranking] == [
+        ("node2", 0.1),
+        ("node0", 0.2),
+        ("nearest", 0.3),
+    ]
+    assert api_call.node_manager.get_node() is api_call.node_manager.nodes[2]
+
+
+def test_due_latency_probe_runs_in_the_background(
+    fake_config_dict: ConfigDict,
+    mocker: MockerFixture,
+) -> None:
+    """Test that requests start due latency probes without waiting for them."""
+    fake_config_dict["auto_nearest_node"] = True
+    latencies = {"nearest": 0.1, "node0": 0.2, "node1": 0.3, "node2": 0.4}
+    probe_released = threading.Event()
+
+    def probe_node_latency(node: Node) -> float:
+        if latencies["node2"] < latencies["nearest"]:
+            probe_released.wait(timeout=5)
+        return latencies[node.host]
+
+    mocker.patch.object(
+        ApiCall,
+        "_probe_node_latency",
+        side_effect=probe_node_latency,
+    )
+    api_call = ApiCall(Configuration(fake_config_dict))
+    latencies["node2"] = 0.01
+    api_call.node_manager._latency_probe_ts = 0
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("http://nearest:8108/test", json={"key": "value"})
+        api_call.get("/test", entity_type=typing.Dict[str, str])
+        api_call.get("/test", entity_type=typing.Dict[str, str])
+
+    probe_thread = api_call._latency_probe_thread
+    assert probe_thread is not None
+    probe_released.set()
+    probe_thread.join(timeout=5)
+
+    assert request_mocker.call_count == 2
+    assert api_call.node_manager.get_node() is api_call.node_manager.nodes[2]
+
+
+def test_probe_node_latencies_skips_unreachable_nodes(
+    fake_api_call: ApiCall,
+) -> None:
+    """Test that nodes failing the health probe are left out of the ranking."""
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("http://nearest:8108/health", json={"ok": True})
+        request_mocker.get("http://node0:8108/health", json={"ok": True})
+        request_mocker.get(
+            "http://node1:8108/health",
+            exc=requests.exceptions.ConnectTimeout,
+        )
+        request_mocker.get("http://node2:8108/health", status_code=503)
+
+        ranking = fake_api_call.probe_node_latencies()
+
+    assert sorted(node.host for node, _ in ranking) == ["nearest", "node0"]
+    assert fake_api_call.node_manager.latency_ranking == ranking
+
+
+def test_probe_node_latencies_without_nodes(fake_api_call: ApiCall) -> None:
+    """Test that probing a client without candidate nodes ranks no node."""
+    fake_api_call.node_manager.nodes = []
+    fake_api_call.config.nearest_node = None
+
+    assert fake_api_call.probe_node_latencies() == []
+
+
+def test_reset_after_fork(fake_config_dict: ConfigDict) -> None:
+    """Test that connection pools, node state and locks are rebuilt after a fork."""
+    fake_config_dict["request_classes"] = {"bulk": {"pool_maxsize": 2}}
+    fake_config_dict["canonicalize_searches"] = True
+    api_call = ApiCall(Configuration(fake_config_dict))
+    lane_session = api_call.request_lanes["bulk"].session
+    node_manager = api_call.node_manager
+    node_manager.nodes[0].healthy = False
+    assert api_call.search_canonicalizer is not None
+    canonicalizer_lock = api_call.search_canonicalizer._lock
+    canonicalizer_lock.acquire()
+    client = Client(fake_config_dict)
+    collections = client.collections
+    attribute_lock = client._attribute_lock
+    attribute_lock.acquire()
+    handle_cache_lock = collections.collections._lock
+    handle_cache_lock.acquire()
+
+    api_call_module._reset_after_fork()
+    client_module._reset_after_fork()
+    handle_cache_module._reset_after_fork()
+
+    assert api_call.request_lanes["bulk"].session is not lane_session
+    assert api_call.node_manager is not node_manager
+    assert api_call.node_manager.nodes[0].healthy
+    assert not api_call.search_canonicalizer._lock.locked()
+    assert client._attribute_lock is not attribute_lock
+    assert not collections.collections._lock.locked()
+    canonicalizer_lock.release()
+    attribute_lock.release()
+    handle_cache_lock.release()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork")
+def test_forked_child_gets_new_session() -> None:
+    """Test that a forked child does not share the parent's session."""
+    parent_session_id = id(api_call_module.session)
+    read_fd, write_fd = os.pipe()
+
+    child_pid = os.fork()
+    if child_pid == 0:  # pragma: no cover
+        is_new_session = id(api_call_module.session) != parent_session_id
+        os.write(write_fd, b"1" if is_new_session else b"0")
+        os._exit(0)  # noqa: WPS437
+
+    os.close(write_fd)
+    child_result = os.read(read_fd, 1)
+    os.close(read_fd)
+    os.waitpid(child_pid, 0)
+
+    assert child_result == b"1"
+
+
+def test_warmup(fake_api_call: ApiCall) -> None:
+    """Test that warmup opens connections to every node and checks their health."""
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("http://nearest:8108/health", json={"ok": True})
+        request_mocker.get("http://node0:8108/health", json={"ok": True})
+        request_mocker.get("http://node1:8108/health", json={"ok": True})
+        request_mocker.get(
+            "http://node2:8108/health",
+            exc=requests.exceptions.ConnectionError,
+        )
+
+        warmed_connections = fake_api_call.warmup(connections_per_node=2)
+
+        assert request_mocker.call_count == 8
+
+    assert warmed_connections == {
+        "http://node0:8108": 2,
+        "http://node1:8108": 2,
+        "http://node2:8108": 0,
+        "http://nearest:8108": 2,
+    }
+    assert not fake_api_call.node_manager.nodes[2].healthy
+
+
+def test_warmup_caps_threads(
+    fake_api_call: ApiCall,
+    mocker: MockerFixture,
+) -> None:
+    """Test that warmup runs at most 32 requests at a time, however many it sends."""
+    executor = mocker.patch.object(
+        api_call_module,
+        "ThreadPoolExecutor",
+        wraps=api_call_module.ThreadPoolExecutor,
+    )
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get(requests_mock.ANY, json={"ok": True})
+
+        warmed_connections = fake_api_call.warmup(connections_per_node=10)
+
+        assert request_mocker.call_count == 40
+
+    executor.assert_called_once_with(max_workers=32)
+    assert warmed_connections["http://node0:8108"] == 10
+
+
+def test_warmup_rejects_no_connections(fake_api_call: ApiCall) -> None:
+    """Test that warmup rejects a number of connections per node below 1."""
+    with pytest.raises(exceptions.InvalidParameter):
+        fake_api_call.warmup(connections_per_node=0)
+
+
+def test_warmup_without_nodes(fake_api_call: ApiCall) -> None:
+    """Test that warming up a client without candidate nodes opens nothing."""
+    fake_api_call.node_manager.nodes = []
+    fake_api_call.config.nearest_node = None
+
+    assert fake_api_call.warmup() == {}
+
+
+def test_cache_affinity_routing(fake_config_dict: ConfigDict) -> None:
+    """Test that identical searches go to the same node and others spread out."""
+    fake_config_dict["cache_affinity_routing"] = True
+    api_call = ApiCall(Configuration(fake_config_dict))
+    endpoint = "/collections/companies/documents/search"
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get(requests_mock.ANY, json={"found": 0})
+
+        for _ in range(3):
+            api_call.get(endpoint, typing.Dict[str, int], params={"q": "a", "x": "1"})
+        api_call.get(endpoint, typing.Dict[str, int], params={"x": "1", "q": "a"})
+        first_hosts = {request.hostname for request in request_mocker.request_history}
+        for query_index in range(20):
+            search_params = {"q": str(query_index)}
+            api_call.get(endpoint, typing.Dict[str, int], params=search_params)
+        hosts = {request.hostname for request in request_mocker.request_history}
+
+    assert len(first_hosts) == 1
+    assert hosts == {"node0", "node1", "node2"}
+
+
+def test_cache_affinity_routing_falls_back_on_failure(
+    fake_config_dict: ConfigDict,
+) -> None:
+    """Test that a search moves to its next ranked node when its node fails."""
+    fake_config_dict["cache_affinity_routing"] = True
+    api_call = ApiCall(Configuration(fake_config_dict))
+    search_body = {"searches": [{"collection": "companies", "q": "a"}]}
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.post(requests_mock.ANY, json={"results": []})
+        api_call.post("/multi_search", typing.Dict[str, str], body=search_body)
+        preferred_url = request_mocker.last_request.url
+        request_mocker.post(preferred_url, exc=requests.exceptions.ConnectTimeout)
+
+        api_call.post("/multi_search", typing.Dict[str, str], body=search_body)
+        api_call.post("/multi_search", typing.Dict[str, str], body=search_body)
+        urls = [request.url for request in request_mocker.request_history]
+
+    assert urls[:2] == [preferred_url, preferred_url]
+    assert urls[2] != preferred_url
+    assert urls[3] == urls[2]
+
+
+def test_cache_affinity_routing_is_off_by_default(fake_api_call: ApiCall) -> None:
+    """Test that searches keep the regular node selection by default."""
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get(requests_mock.ANY, json={"found": 0})
+
+        fake_api_call.get(
+            "/collections/companies/documents/search",
+            typing.Dict[str, int],
+            params={"q": "a"},
+        )
+
+        assert request_mocker.last_request.hostname == "nearest"
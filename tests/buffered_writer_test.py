@@ -0,0 +1,239 @@
+"""Tests for the BufferedWriter class."""
+
+import json
+import sys
+import time
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+import pytest
+import requests_mock
+
+from typesense import buffered_writer
+from typesense.buffered_writer import BufferedWriter
+from typesense.collection import Collection
+from typesense.exceptions import ServerError, TypesenseClientError
+from typesense.schema_validator import SchemaValidator
+
+_IMPORT_URL = "http://nearest:8108/collections/companies/documents/import"
+_DELETE_URL = "http://nearest:8108/collections/companies/documents/"
+
+
+def _imported(
+    request_mocker: requests_mock.Mocker,
+) -> typing.List[typing.Tuple[str, typing.List[typing.Dict[str, typing.Any]]]]:
+    """Get the action and documents of every import that was sent."""
+    return [
+        (
+            request.qs["action"][0],
+            [json.loads(line) for line in request.text.splitlines()],
+        )
+        for request in request_mocker.request_history
+        if request.method == "POST"
+    ]
+
+
+def test_coalesces_writes(fake_collection: Collection) -> None:
+    """Test that repeated writes to an id are coalesced into its last state."""
+    writer = BufferedWriter(fake_collection, max_age_seconds=None)
+
+    with requests_mock.Mocker() as mock:
+        mock.post(_IMPORT_URL, text='{"success": true}\n{"success": true}')
+        mock.delete(_DELETE_URL, json={"num_deleted": 1})
+
+        writer.upsert({"id": "0", "company_name": "A", "num_employees": 1})
+        writer.update({"id": "0", "num_employees": 2})
+        writer.update({"id": "1", "num_employees": 3})
+        writer.update({"id": "1", "company_name": "B"})
+        writer.upsert({"id": "2", "company_name": "C", "num_employees": 4})
+        writer.delete("2")
+        writer.delete("3")
+        writer.update({"id": "3", "num_employees": 5})
+
+        assert writer.pending_count == 4
+        assert not mock.called
+
+        writer.flush()
+
+        assert _imported(mock) == [
+            ("upsert", [{"id": "0", "company_name": "A", "num_employees": 2}]),
+            ("update", [{"id": "1", "num_employees": 3, "company_name": "B"}]),
+        ]
+        assert mock.request_history[-1].qs["filter_by"] == ["id:[`2`,`3`]"]
+    assert writer.pending_count == 0
+
+
+def test_delete_replaces_write_of_numeric_id(fake_collection: Collection) -> None:
+    """Test that a delete by numeric id replaces the pending write of that id."""
+    writer = BufferedWriter(fake_collection, max_age_seconds=None)
+
+    with requests_mock.Mocker() as mock:
+        mock.delete(_DELETE_URL, json={"num_deleted": 1})
+
+        writer.upsert({"id": 5, "company_name": "A", "num_employees": 1})
+        writer.delete(5)
+
+        assert writer.pending_count == 1
+
+        writer.flush()
+
+        assert mock.call_count == 1
+        assert mock.request_history[0].qs["filter_by"] == ["id:[`5`]"]
+
+
+def test_partial_updates_pass_validation(fake_collection: Collection) -> None:
+    """Test that partial updates are not rejected for missing required fields."""
+    fake_collection.documents.validator = SchemaValidator(
+        {
+            "name": "companies",
+            "fields": [
+                {"name": "company_name", "type": "string"},
+                {"name": "num_employees", "type": "int32"},
+            ],
+        },
+    )
+    writer = BufferedWriter(fake_collection, max_age_seconds=None)
+
+    with requests_mock.Mocker() as mock:
+        mock.post(_IMPORT_URL, text='{"success": true}')
+
+        writer.update({"id": "0", "num_employees": 2})
+        writer.close()
+
+        assert _imported(mock) == [("update", [{"id": "0", "num_employees": 2}])]
+
+
+def test_flushes_on_size(fake_collection: Collection) -> None:
+    """Test that reaching the maximum batch size flushes the pending writes."""
+    writer = BufferedWriter(fake_collection, max_batch_size=2, max_age_seconds=None)
+
+    with requests_mock.Mocker() as mock:
+        mock.post(_IMPORT_URL, text='{"success": true}\n{"success": true}')
+
+        writer.upsert({"id": "0", "company_name": "A", "num_employees": 1})
+        assert not mock.called
+        writer.upsert({"id": "1", "company_name": "B", "num_employees": 2})
+
+        assert mock.call_count == 1
+    assert writer.pending_count == 0
+
+
+def test_flushes_on_age(fake_collection: Collection) -> None:
+    """Test that pending writes are flushed once the oldest reaches the maximum age."""
+    with requests_mock.Mocker() as mock:
+        mock.post(_IMPORT_URL, text='{"success": true}')
+        writer = BufferedWriter(fake_collection, max_age_seconds=0.05)
+
+        writer.upsert({"id": "0", "company_name": "A", "num_employees": 1})
+        deadline = time.monotonic() + 5
+        while not mock.called and time.monotonic() < deadline:
+            time.sleep(0.01)
+        writer.close()
+
+        assert mock.call_count == 1
+
+
+def test_reports_failed_documents(fake_collection: Collection) -> None:
+    """Test that documents the server fails to write are passed to the callback."""
+    failures: typing.List[typing.Dict[str, typing.Any]] = []
+    writer = BufferedWriter(
+        fake_collection,
+        max_age_seconds=None,
+        on_failure=failures.append,
+    )
+
+    with requests_mock.Mocker() as mock:
+        mock.post(
+            _IMPORT_URL,
+            text='{"success": true}\n'
+            + '{"success": false, "error": "Bad field.", "code": 400, '
+            + '"document": "{\\"id\\": \\"1\\"}"}',
+        )
+
+        writer.upsert({"id": "0", "company_name": "A", "num_employees": 1})
+        writer.upsert({"id": "1"})
+        writer.flush()
+
+    assert [failure["error"] for failure in failures] == ["Bad field."]
+
+
+def test_failed_flush_keeps_newer_writes(fake_collection: Collection) -> None:
+    """Test that a failed flush requeues its writes without overwriting newer ones."""
+    writer = BufferedWriter(fake_collection, max_age_seconds=None)
+
+    with requests_mock.Mocker() as mock:
+        mock.post(requests_mock.ANY, status_code=500, json={"message": "Error"})
+
+        writer.upsert({"id": "0", "company_name": "A", "num_employees": 1})
+        with pytest.raises(ServerError):
+            writer.flush()
+
+        assert writer.pending_count == 1
+
+        mock.post(requests_mock.ANY, text='{"success": true}')
+        writer.update({"id": "0", "num_employees": 2})
+        writer.close()
+
+        assert _imported(mock)[-1] == (
+            "upsert",
+            [{"id": "0", "company_name": "A", "num_employees": 2}],
+        )
+
+
+def test_failed_flush_merges_updates_buffered_during_it(
+    fake_collection: Collection,
+) -> None:
+    """Test that an update buffered during a failed flush is merged into its upsert."""
+    writer = BufferedWriter(fake_collection, max_age_seconds=None)
+
+    def fail_after_update(request: typing.Any, context: typing.Any) -> str:
+        writer.update({"id": "0", "num_employees": 2})
+        context.status_code = 500
+        return '{"message": "Error"}'
+
+    with requests_mock.Mocker() as mock:
+        mock.post(requests_mock.ANY, text=fail_after_update)
+
+        writer.upsert({"id": "0", "company_name": "A", "num_employees": 1})
+        with pytest.raises(ServerError):
+            writer.flush()
+
+        mock.post(requests_mock.ANY, text='{"success": true}')
+        writer.close()
+
+        assert _imported(mock)[-1] == (
+            "upsert",
+            [{"id": "0", "company_name": "A", "num_employees": 2}],
+        )
+
+
+def test_open_writers_are_drained_at_exit(fake_collection: Collection) -> None:
+    """Test that the exit hook drains the writers that were not closed."""
+    writer = BufferedWriter(fake_collection, max_age_seconds=60)
+
+    with requests_mock.Mocker() as mock:
+        mock.delete(_DELETE_URL, json={"num_deleted": 1})
+        writer.delete("0")
+
+        buffered_writer._close_open_writers()
+
+        assert mock.call_count == 1
+    assert writer.pending_count == 0
+    assert writer not in buffered_writer._open_writers
+
+
+def test_close_drains_and_rejects_writes(fake_collection: Collection) -> None:
+    """Test that closing the writer drains it and rejects further writes."""
+    with requests_mock.Mocker() as mock:
+        mock.delete(_DELETE_URL, json={"num_deleted": 1})
+
+        with BufferedWriter(fake_collection) as writer:
+            writer.delete("0")
+
+        assert mock.call_count == 1
+
+    with pytest.raises(TypesenseClientError):
+        writer.delete("1")
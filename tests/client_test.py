@@ -1,9 +1,27 @@
 """Tests for the Client class."""
 
+import asyncio
+import dataclasses
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests_mock
+from pytest_mock import MockerFixture
+
 from tests.fixtures.document_fixtures import Companies
 from tests.utils.object_assertions import assert_match_object, assert_object_lists_match
 from typesense.client import Client
 from typesense.configuration import ConfigDict
+from typesense.schema_validator import SchemaValidator
+
+
+@dataclasses.dataclass
+class CompanyRecord:
+    """A dataclass document model."""
+
+    id: str
+    company_name: str
 
 
 def test_client_init(fake_config_dict: ConfigDict) -> None:
@@ -34,6 +52,51 @@ def test_client_init(fake_config_dict: ConfigDict) -> None:
     assert fake_client.debug
 
 
+def test_attributes_are_created_once_across_threads(
+    fake_config_dict: ConfigDict,
+    mocker: MockerFixture,
+) -> None:
+    """Test that concurrent first accesses share a single ApiCall."""
+    from typesense import api_call as api_call_module
+
+    api_call_class = api_call_module.ApiCall
+    instances = []
+    instances_lock = threading.Lock()
+
+    def create_api_call(*args: object) -> object:
+        time.sleep(0.01)
+        api_call = api_call_class(*args)
+        with instances_lock:
+            instances.append(api_call)
+        return api_call
+
+    mocker.patch.object(api_call_module, "ApiCall", side_effect=create_api_call)
+    fake_client = Client(fake_config_dict)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        api_calls = list(
+            executor.map(lambda _: fake_client.collections.api_call, range(8)),
+        )
+
+    assert len(instances) == 1
+    assert all(api_call is instances[0] for api_call in api_calls)
+
+
+def test_warmup_async(fake_client: Client) -> None:
+    """Test that the client can warm up connections from async code."""
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("/health", json={"ok": True})
+
+        warmed_connections = asyncio.run(fake_client.warmup_async())
+
+    assert warmed_connections == {
+        "http://node0:8108": 1,
+        "http://node1:8108": 1,
+        "http://node2:8108": 1,
+        "http://nearest:8108": 1,
+    }
+
+
 def test_get_collection(fake_client: Client) -> None:
     """Test the Client class get_collection method."""
     collection = fake_client.typed_collection(model=Companies, name="companies")
@@ -41,6 +104,44 @@ def test_get_collection(fake_client: Client) -> None:
     assert collection
     assert collection.name == "companies"
     assert collection.documents.documents is not None
+    assert collection.documents.model is Companies
+
+
+def test_typed_collection_does_not_change_the_cached_collection(
+    fake_client: Client,
+) -> None:
+    """Test that typed collections are new instances with their own model."""
+    cached_collection = fake_client.collections["companies"]
+    cached_collection.documents.validator = SchemaValidator(
+        {"name": "companies", "fields": []},
+    )
+
+    typed_collection = fake_client.typed_collection(model=Companies)
+    dataclass_collection = fake_client.typed_collection(
+        model=CompanyRecord,
+        name="companies",
+    )
+
+    assert cached_collection.documents.model is None
+    assert typed_collection.documents.model is Companies
+    assert dataclass_collection.documents.model is CompanyRecord
+    assert typed_collection is not cached_collection
+    assert typed_collection.documents.validator is cached_collection.documents.validator
+
+
+def test_typed_collections_are_cached_and_share_the_validator(
+    fake_client: Client,
+) -> None:
+    """Test that typed collections are reused and follow the shared validator."""
+    typed_collection = fake_client.typed_collection(model=Companies)
+
+    assert fake_client.typed_collection(model=Companies) is typed_collection
+    assert typed_collection.documents.validator is None
+
+    validator = SchemaValidator({"name": "companies", "fields": []})
+    fake_client.collections["companies"].documents.validator = validator
+
+    assert typed_collection.documents.validator is validator
 
 
 def test_get_collection_no_name(fake_client: Client) -> None:
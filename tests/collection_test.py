@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import time
 
 import requests_mock
@@ -252,3 +253,103 @@ def test_actual_update(
     }
 
     assert_to_contain_object(response.get("fields")[0], expected.get("fields")[0])
+
+
+def test_enable_validation(fake_collection: Collection) -> None:
+    """Test that invalid documents are reported without being sent on import."""
+    schema = {
+        "name": "companies",
+        "fields": [
+            {"name": "company_name", "type": "string"},
+            {"name": "num_employees", "type": "int32"},
+        ],
+    }
+
+    with requests_mock.Mocker() as mock:
+        mock.get("http://nearest:8108/collections/companies", json=schema)
+        mock.post(
+            "http://nearest:8108/collections/companies/documents/import",
+            text='{"success": true}\n{"success": true}',
+        )
+
+        fake_collection.enable_validation()
+        response = fake_collection.documents.import_(
+            [
+                {"id": "0", "company_name": "A", "num_employees": 1},
+                {"id": "1", "company_name": "B"},
+                {"id": "2", "company_name": "C", "num_employees": 3},
+            ],
+        )
+
+        assert [
+            document["id"]
+            for document in map(json.loads, mock.last_request.text.splitlines())
+        ] == ["0", "2"]
+
+    assert [document_response["success"] for document_response in response] == [
+        True,
+        False,
+        True,
+    ]
+    assert response[1]["code"] == 400
+
+
+def test_enable_validation_checks_updates_partially(
+    fake_collection: Collection,
+) -> None:
+    """Test that updates are only checked for their fields, with their dirty_values."""
+    schema = {
+        "name": "companies",
+        "fields": [
+            {"name": "company_name", "type": "string"},
+            {"name": "num_employees", "type": "int32"},
+        ],
+    }
+
+    with requests_mock.Mocker() as mock:
+        mock.get("http://nearest:8108/collections/companies", json=schema)
+        mock.post(
+            "http://nearest:8108/collections/companies/documents/import",
+            text='{"success": true}',
+        )
+
+        fake_collection.enable_validation()
+        response = fake_collection.documents.import_(
+            [
+                {"id": "0", "num_employees": 2},
+                {"id": "1", "num_employees": "3"},
+            ],
+            {"action": "update", "dirty_values": "reject"},
+        )
+
+        assert [
+            document["id"]
+            for document in map(json.loads, mock.last_request.text.splitlines())
+        ] == ["0"]
+
+    assert [document_response["success"] for document_response in response] == [
+        True,
+        False,
+    ]
+
+
+def test_enable_validation_all_invalid(fake_collection: Collection) -> None:
+    """Test that an import of only invalid documents sends no request."""
+    schema = {"name": "companies", "fields": [{"name": "name", "type": "string"}]}
+
+    with requests_mock.Mocker() as mock:
+        mock.get("http://nearest:8108/collections/companies", json=schema)
+        fake_collection.enable_validation()
+
+        response = fake_collection.documents.import_([{"id": "0", "name": ["A"]}])
+
+        assert mock.call_count == 1
+
+    assert response == [
+        {
+            "success": False,
+            "error": "Field `name` must be a string.",
+            "code": 400,
+            "document": '{"id": "0", "name": ["A"]}',
+        },
+    ]
@@ -0,0 +1,165 @@
+"""Tests for the AdaptiveConcurrencyLimiter class."""
+
+import sys
+import time
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+import pytest
+import requests_mock
+
+from typesense.api_call import ApiCall
+from typesense.concurrency_limiter import AdaptiveConcurrencyLimiter
+from typesense.configuration import ConfigDict, Configuration
+from typesense.exceptions import (
+    ConcurrencyLimitExceeded,
+    ServiceUnavailable,
+    Timeout,
+)
+
+
+def test_from_config() -> None:
+    """Test that the limiter is created from the configuration entry."""
+    limiter = AdaptiveConcurrencyLimiter.from_config(
+        {"initial_limit": 4, "min_limit": 2, "max_limit": 8},
+    )
+
+    assert limiter.limit == 4
+    assert limiter.min_limit == 2
+    assert limiter.max_limit == 8
+    assert limiter.max_queue_seconds is None
+
+
+def test_slot_increases_limit_on_success() -> None:
+    """Test that successful requests grow the limit additively."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+
+    for _ in range(10):
+        with limiter.slot():
+            assert limiter.in_flight == 1
+
+    assert limiter.limit == 3
+    assert limiter.in_flight == 0
+
+
+def test_slot_decreases_limit_on_service_unavailable() -> None:
+    """Test that a 503 shrinks the limit multiplicatively."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, min_limit=3)
+
+    with pytest.raises(ServiceUnavailable):
+        with limiter.slot():
+            raise ServiceUnavailable(503, "Overloaded")
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+    with pytest.raises(ServiceUnavailable):
+        with limiter.slot():
+            raise ServiceUnavailable(503, "Overloaded")
+
+    assert limiter.limit == 3
+
+
+def test_slot_keeps_limit_on_other_errors() -> None:
+    """Test that errors unrelated to overload leave the limit unchanged."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+
+    with pytest.raises(ValueError):
+        with limiter.slot():
+            raise ValueError("Unrelated")
+
+    assert limiter.limit == 8
+    assert limiter.in_flight == 0
+
+
+def test_release_decreases_limit_on_latency_spike() -> None:
+    """Test that a latency well above the baseline counts as overload."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=2)
+
+    limiter.acquire()
+    limiter.release(latency=0.01)
+    limiter.acquire()
+    limiter.release(latency=0.1)
+
+    assert limiter.limit == 4
+
+
+def test_release_decreases_limit_once_per_round_trip() -> None:
+    """Test that a burst of 503s to concurrent requests shrinks the limit once."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+    acquired_times = [limiter.acquire() for _ in range(4)]
+
+    for acquired_at in acquired_times:
+        limiter.release(overloaded=True, acquired_at=acquired_at)
+
+    assert limiter.limit == 4
+
+    limiter.release(overloaded=True, acquired_at=limiter.acquire())
+
+    assert limiter.limit == 2
+
+
+def test_release_freezes_baseline_while_overloaded() -> None:
+    """Test that latencies observed under overload do not raise the baseline."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_tolerance=2)
+
+    limiter.release(latency=0.01, acquired_at=limiter.acquire())
+    limiter.release(latency=1.0, acquired_at=limiter.acquire())
+    assert limiter.limit == 4
+
+    limiter.release(latency=0.03, acquired_at=limiter.acquire())
+
+    assert limiter.limit == 2
+
+
+def test_acquire_sheds_when_queue_wait_exceeded() -> None:
+    """Test that requests are shed once the maximum queue wait is exceeded."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_queue_seconds=0)
+
+    limiter.acquire()
+    with pytest.raises(ConcurrencyLimitExceeded):
+        limiter.acquire()
+
+    limiter.release()
+    limiter.acquire()
+    assert limiter.in_flight == 1
+
+
+def test_acquire_fails_at_deadline() -> None:
+    """Test that waiting for a slot stops at the deadline of the request."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+
+    limiter.acquire()
+    with pytest.raises(Timeout, match="Request deadline exceeded"):
+        limiter.acquire(deadline=time.monotonic() + 0.05)
+
+    assert limiter.in_flight == 1
+
+
+def test_api_call_adapts_limit(fake_config_dict: ConfigDict) -> None:
+    """Test that the ApiCall shrinks the limit when nodes respond with 503."""
+    fake_config_dict["adaptive_concurrency"] = {"initial_limit": 8}
+    api_call = ApiCall(Configuration(fake_config_dict))
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get("http://nearest:8108/test", status_code=503)
+        request_mocker.get(
+            "http://node0:8108/test",
+            json={"key": "value"},
+            status_code=200,
+        )
+
+        response = api_call.get("/test", entity_type=typing.Dict[str, str])
+
+    assert response == {"key": "value"}
+    assert api_call.concurrency_limiter is not None
+    assert api_call.concurrency_limiter.limit == 4
+    assert api_call.concurrency_limiter.in_flight == 0
+
+
+def test_api_call_without_limiter(fake_api_call: ApiCall) -> None:
+    """Test that the limiter is disabled by default."""
+    assert fake_api_call.concurrency_limiter is None
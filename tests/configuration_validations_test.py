@@ -199,3 +199,27 @@ def test_validate_config_dict_with_wrong_nearest_node() -> None:
                 "api_key": "xyz",
             },
         )
+
+
+def test_validate_config_dict_with_invalid_deadline() -> None:
+    """Test validate_config_dict with a non-positive deadline."""
+    with pytest.raises(ConfigError, match="`deadline_seconds` must be a positive number."):
+        ConfigurationValidations.validate_config_dict(
+            {
+                "nodes": [DEFAULT_NODE],
+                "api_key": "xyz",
+                "deadline_seconds": 0,
+            },
+        )
+
+
+def test_validate_config_dict_with_invalid_handle_cache_size() -> None:
+    """Test validate_config_dict with a handle cache that cannot hold a handle."""
+    with pytest.raises(ConfigError, match="`handle_cache_size` must be at least 1."):
+        ConfigurationValidations.validate_config_dict(
+            {
+                "nodes": [DEFAULT_NODE],
+                "api_key": "xyz",
+                "handle_cache_size": 0,
+            },
+        )
@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 import requests_mock
 
-from tests.fixtures.document_fixtures import Companies
+from tests.fixtures.document_fixtures import Companies, Company
 from tests.utils.object_assertions import (
     assert_match_object,
     assert_object_lists_match,
@@ -62,6 +62,38 @@ def test_retrieve(fake_document: Document) -> None:
         assert response == json_response
 
 
+def test_retrieve_raw(fake_document: Document) -> None:
+    """Test that the Document object can retrieve an undecoded document."""
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            "http://nearest:8108/collections/companies/documents/0",
+            content=b'{"id": "0"}',
+            headers={"Content-Type": "application/json; charset=utf-8"},
+        )
+
+        response = fake_document.retrieve(raw=True)
+
+    assert response == {
+        "content": b'{"id": "0"}',
+        "content_type": "application/json; charset=utf-8",
+    }
+
+
+def test_retrieve_into_model(fake_api_call: ApiCall) -> None:
+    """Test that the Document object decodes the document into its model."""
+    document: Document = Document(fake_api_call, "companies", "0", Company)
+
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            "http://nearest:8108/collections/companies/documents/0",
+            json={"id": "0", "company_name": "Company", "num_employees": 10},
+        )
+
+        response = document.retrieve()
+
+    assert response == Company(id="0", company_name="Company", num_employees=10)
+
+
 def test_delete(fake_document: Document) -> None:
     """Test that the Document object can delete an document."""
     json_response: Companies = {
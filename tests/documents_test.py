@@ -3,6 +3,7 @@
 import json
 import logging
 import sys
+import urllib.parse
 
 if sys.version_info >= (3, 11):
     import typing
@@ -10,17 +11,24 @@ else:
     import typing_extensions as typing
 
 import pytest
+import requests_mock
 from pytest_mock import MockFixture
 
-from tests.fixtures.document_fixtures import Companies
+from tests.fixtures.document_fixtures import Companies, Company
 from tests.utils.object_assertions import (
     assert_match_object,
     assert_object_lists_match,
     assert_to_contain_keys,
 )
 from typesense.api_call import ApiCall
+from typesense.configuration import ConfigDict, Configuration
 from typesense.documents import Documents
-from typesense.exceptions import InvalidParameter, TypesenseClientError
+from typesense.exceptions import (
+    InvalidParameter,
+    ObjectNotFound,
+    TypesenseClientError,
+)
+from typesense.preprocess import PreparedSearch
 
 
 def test_init(fake_api_call: ApiCall) -> None:
@@ -67,6 +75,206 @@ def test_get_existing_document(fake_documents: Documents) -> None:
     assert document is fetched_document
 
 
+def test_search_raw(fake_documents: Documents) -> None:
+    """Test that the Documents object can return undecoded search results."""
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            "http://nearest:8108/collections/companies/documents/search",
+            content=b'{"hits": []}',
+            headers={"Content-Type": "application/json"},
+        )
+
+        response = fake_documents.search(
+            {"q": "com", "query_by": "company_name", "prefix": True},
+            raw=True,
+        )
+
+        assert mock.request_history[0].qs["prefix"] == ["true"]
+
+    assert response == {"content": b'{"hits": []}', "content_type": "application/json"}
+
+
+def test_search_typed(fake_documents: Documents) -> None:
+    """Test that the Documents object can return a typed view of search results."""
+    fake_documents.model = Companies
+
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            "http://nearest:8108/collections/companies/documents/search",
+            json={"found": 1, "hits": [{"document": {"id": "0"}}]},
+        )
+
+        response = fake_documents.search(
+            {"q": "com", "query_by": "company_name"},
+            typed=True,
+        )
+
+    assert response.found == 1
+    assert response.hits[0].document.id == "0"
+
+
+def test_search_into_model(fake_documents: Documents) -> None:
+    """Test that the documents of search hits are decoded into the model."""
+    fake_documents.model = Company
+    document = {"id": "0", "company_name": "Company", "num_employees": 10}
+
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            "http://nearest:8108/collections/companies/documents/search",
+            json={"found": 1, "hits": [{"document": document}]},
+        )
+
+        response = fake_documents.search({"q": "com", "query_by": "company_name"})
+        typed_response = fake_documents.search(
+            {"q": "com", "query_by": "company_name"},
+            typed=True,
+        )
+
+    assert response["hits"][0]["document"] == Company(**document)
+    assert typed_response.hits[0].document == Company(**document)
+
+
+def test_export_documents_into_model(fake_documents: Documents) -> None:
+    """Test that exported documents are decoded into the model."""
+    fake_documents.model = Company
+
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            "http://nearest:8108/collections/companies/documents/export",
+            text='{"id": "0", "company_name": "A", "num_employees": 1}\n'
+            + '{"id": "1", "company_name": "B", "num_employees": 2}',
+        )
+
+        companies = fake_documents.export_documents()
+
+    assert [company.company_name for company in companies] == ["A", "B"]
+    assert fake_documents["0"].model is Company
+
+
+def test_get_many(fake_documents: Documents) -> None:
+    """Test that documents are fetched by id in input order, with misses reported."""
+    with requests_mock.Mocker() as mock:
+        mock.post(
+            "http://nearest:8108/multi_search",
+            json={
+                "results": [
+                    {
+                        "hits": [
+                            {"document": {"id": "1", "company_name": "B"}},
+                            {"document": {"id": "0", "company_name": "A"}},
+                        ],
+                    },
+                ],
+            },
+        )
+
+        response = fake_documents.get_many(
+            ["0", "9", "1", "0"],
+            include_fields="company_name",
+        )
+
+        assert mock.last_request.json() == {
+            "searches": [
+                {
+                    "collection": "companies",
+                    "q": "*",
+                    "filter_by": "id:[`0`,`9`,`1`]",
+                    "per_page": 3,
+                    "include_fields": "id,company_name",
+                },
+            ],
+        }
+
+    assert response["documents"] == [
+        {"id": "0", "company_name": "A"},
+        None,
+        {"id": "1", "company_name": "B"},
+        {"id": "0", "company_name": "A"},
+    ]
+    assert response["missing"] == ["9"]
+
+
+def test_get_many_chunks_ids(fake_documents: Documents) -> None:
+    """Test that many ids are split into chunked searches and multi-searches."""
+    document_ids = [str(document_index) for document_index in range(12_600)]
+
+    with requests_mock.Mocker() as mock:
+        mock.post("http://nearest:8108/multi_search", json={"results": []})
+
+        response = fake_documents.get_many(document_ids)
+
+        searches_per_request = [
+            len(request.json()["searches"]) for request in mock.request_history
+        ]
+
+    assert sorted(searches_per_request) == [1, 50]
+    assert response["missing"] == document_ids
+
+
+def test_get_many_rejects_backticks(fake_documents: Documents) -> None:
+    """Test that ids with a backtick, which filters cannot quote, are rejected."""
+    with requests_mock.Mocker() as mock:
+        with pytest.raises(InvalidParameter, match="backtick"):
+            fake_documents.get_many(["0", "a`b"])
+
+        assert not mock.called
+
+
+def test_get_many_search_error(fake_documents: Documents) -> None:
+    """Test that a failed search of get_many raises its error."""
+    with requests_mock.Mocker() as mock:
+        mock.post(
+            "http://nearest:8108/multi_search",
+            json={"results": [{"code": 404, "error": "Not found."}]},
+        )
+
+        with pytest.raises(ObjectNotFound, match="Not found."):
+            fake_documents.get_many(["0"])
+
+
+def test_search_prepared(fake_documents: Documents) -> None:
+    """Test that the Documents object can search with a prepared search."""
+    prepared = PreparedSearch({"query_by": ["company_name", "id"], "prefix": False})
+
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            "http://nearest:8108/collections/companies/documents/search",
+            json={"hits": []},
+        )
+
+        fake_documents.search(prepared.bind(q="com"))
+
+        assert mock.request_history[0].qs == {
+            "query_by": ["company_name,id"],
+            "prefix": ["false"],
+            "q": ["com"],
+        }
+
+
+def test_search_canonicalized(fake_config_dict: ConfigDict) -> None:
+    """Test that searches are canonicalized when enabled."""
+    fake_config_dict["canonicalize_searches"] = True
+    api_call = ApiCall(Configuration(fake_config_dict))
+    documents: Documents = Documents(api_call, "companies")
+
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            "http://nearest:8108/collections/companies/documents/search",
+            json={"hits": []},
+        )
+
+        documents.search({"q": "com", "page": 1, "include_fields": ["b", "a"]})
+        documents.search({"include_fields": "a,b", "q": "com"})
+
+        assert [request.query for request in mock.request_history] == [
+            "include_fields=a%2cb&q=com",
+            "include_fields=a%2cb&q=com",
+        ]
+
+    assert api_call.search_canonicalizer is not None
+    assert api_call.search_canonicalizer.metrics()["distinct_canonical_keys"] == 1
+
+
 def test_create(
     actual_documents: Documents[Companies],
     actual_api_call: ApiCall,
@@ -218,6 +426,215 @@ def test_delete_ignore_missing(
     assert response == {"num_deleted": 0}
 
 
+def test_delete_many(fake_documents: Documents) -> None:
+    """Test that ids are deleted with chunked filters and the counts are summed."""
+    document_ids = [f"document-{document_index:05}" for document_index in range(1000)]
+
+    with requests_mock.Mocker() as mock:
+        mock.delete(
+            "http://nearest:8108/collections/companies/documents/",
+            json={"num_deleted": 7},
+        )
+
+        response = fake_documents.delete_many(document_ids + ["document-00000"])
+
+        id_filters = [
+            urllib.parse.parse_qs(urllib.parse.urlsplit(request.url).query)[
+                "filter_by"
+            ][0]
+            for request in mock.request_history
+        ]
+
+    assert response == {"num_deleted": 7 * len(id_filters)}
+    assert len(id_filters) == 12
+    assert all(
+        len(urllib.parse.quote_plus(id_filter)) <= 2000 for id_filter in id_filters
+    )
+    deleted_ids = [
+        document_id.strip("`")
+        for id_filter in id_filters
+        for document_id in id_filter[len("id:[") : -1].split(",")
+    ]
+    assert sorted(deleted_ids) == document_ids
+
+
+def test_delete_many_no_ids(fake_documents: Documents) -> None:
+    """Test that deleting no ids sends no requests."""
+    with requests_mock.Mocker() as mock:
+        assert fake_documents.delete_many([]) == {"num_deleted": 0}
+        assert not mock.called
+
+
+def _echo_vector_queries(
+    request: typing.Any,
+    context: typing.Any,
+) -> typing.Dict[str, typing.Any]:
+    """Answer every search of a multi-search with a hit identified by its query."""
+    return {
+        "results": [
+            {
+                "hits": [
+                    {
+                        "document": {"id": search["vector_query"]},
+                        "vector_distance": 0.25,
+                    },
+                ],
+            }
+            for search in request.json()["searches"]
+        ],
+    }
+
+
+def test_search_columnar(fake_documents: Documents) -> None:
+    """Test that the hits of a search can be returned as columns."""
+    pytest.importorskip("numpy")
+
+    with requests_mock.Mocker() as mock:
+        mock.get(
+            "http://nearest:8108/collections/companies/documents/search",
+            json={
+                "hits": [
+                    {
+                        "document": {"id": "0", "company_name": "A"},
+                        "text_match": 10,
+                    },
+                ],
+            },
+        )
+
+        columns = fake_documents.search(
+            {"q": "com", "query_by": "company_name"},
+            columnar="numpy",
+            column_fields=["company_name"],
+        )
+
+    assert columns["id"].tolist() == ["0"]
+    assert columns["text_match"].tolist() == [10]
+    assert columns["company_name"].tolist() == ["A"]
+
+
+def test_import_table(fake_documents: Documents) -> None:
+    """Test that the rows of a table are imported in batches, in order."""
+    pandas = pytest.importorskip("pandas")
+    frame = pandas.DataFrame(
+        {
+            "id": ["0", "1", "2"],
+            "company_name": ["A", "B", "C"],
+            "num_employees": [10, 20, 30],
+        },
+    )
+
+    with requests_mock.Mocker() as mock:
+        mock.post(
+            "http://nearest:8108/collections/companies/documents/import",
+            [
+                {"text": '{"success": true}\n{"success": true}'},
+                {"text": '{"success": true}'},
+            ],
+        )
+
+        response = fake_documents.import_table(
+            frame,
+            {"action": "upsert"},
+            batch_rows=2,
+        )
+
+        assert mock.call_count == 2
+        assert mock.request_history[0].qs == {"action": ["upsert"]}
+        assert [
+            json.loads(line)
+            for request in mock.request_history
+            for line in request.text.splitlines()
+        ] == frame.to_dict("records")
+
+    assert response == [{"success": True}] * 3
+
+
+def test_vector_search_many(fake_documents: Documents) -> None:
+    """Test that many vector queries are chunked, sent and aligned to their rows."""
+    embeddings = [[float(row_index), 0.5] for row_index in range(120)]
+
+    with requests_mock.Mocker() as mock:
+        mock.post("http://nearest:8108/multi_search", json=_echo_vector_queries)
+
+        responses = fake_documents.vector_search_many(
+            embeddings,
+            "embedding",
+            k=5,
+            common_params={"filter_by": "num_employees:>10"},
+        )
+
+        first_searches = [
+            request.json()["searches"][0] for request in mock.request_history
+        ]
+        assert mock.call_count == 3
+        assert mock.request_history[0].qs == {"filter_by": ["num_employees:>10"]}
+        assert {
+            "collection": "companies",
+            "q": "*",
+            "vector_query": "embedding:([0.0,0.5], k:5)",
+            "per_page": 5,
+        } in first_searches
+
+    assert [response["hits"][0]["document"]["id"] for response in responses] == [
+        f"embedding:([{row_index}.0,0.5], k:5)" for row_index in range(120)
+    ]
+
+
+def test_vector_search_many_rejects_large_k(fake_documents: Documents) -> None:
+    """Test that k is rejected when it exceeds the largest page of hits."""
+    with pytest.raises(InvalidParameter):
+        fake_documents.vector_search_many([[0.5, 0.5]], "embedding", k=251)
+
+
+def test_vector_search_many_search_error(fake_documents: Documents) -> None:
+    """Test that a failed search of a multi-search raises its error."""
+    with requests_mock.Mocker() as mock:
+        mock.post(
+            "http://nearest:8108/multi_search",
+            json={"results": [{"error": "Field `embedding` not found.", "code": 404}]},
+        )
+
+        with pytest.raises(ObjectNotFound):
+            fake_documents.vector_search_many([[0.5, 0.5]], "embedding")
+
+
+def test_vector_search_many_as_numpy(fake_documents: Documents) -> None:
+    """Test that the ids and distances of the hits are returned as NumPy arrays."""
+    numpy = pytest.importorskip("numpy")
+
+    with requests_mock.Mocker() as mock:
+        mock.post(
+            "http://nearest:8108/multi_search",
+            json={
+                "results": [
+                    {
+                        "hits": [
+                            {"document": {"id": "0"}, "vector_distance": 0.1},
+                            {"document": {"id": "1"}, "vector_distance": 0.2},
+                        ],
+                    },
+                    {"hits": []},
+                ],
+            },
+        )
+
+        arrays = fake_documents.vector_search_many(
+            numpy.array([[0.123, 0.5], [1, 2]]),
+            "embedding",
+            k=2,
+            as_numpy=True,
+        )
+
+        assert [
+            search["vector_query"] for search in mock.last_request.json()["searches"]
+        ] == ["embedding:([0.123,0.5], k:2)", "embedding:([1.0,2.0], k:2)"]
+
+    assert arrays["ids"].tolist() == [["0", "1"], [None, None]]
+    assert arrays["distances"][0].tolist() == [0.1, 0.2]
+    assert numpy.isnan(arrays["distances"][1]).all()
+
+
 def test_import_fail(
     generate_companies: typing.List[Companies],
     actual_documents: Documents[Companies],
@@ -1,5 +1,6 @@
 """Fixtures for creating documents in the Typesense server."""
 
+import dataclasses
 import sys
 
 import pytest
@@ -61,6 +62,16 @@ class Companies(typing.TypedDict):
     num_employees: int
 
 
+@dataclasses.dataclass
+class Company:
+    """Company data class."""
+
+    id: str  # noqa: WPS125
+    company_name: str
+    num_employees: int
+    rating: typing.Optional[float] = None
+
+
 @pytest.fixture(scope="function", name="generate_companies")
 def generate_companies_fixture() -> typing.List[Companies]:
     """Generate a list of companies using fake data."""
@@ -0,0 +1,91 @@
+"""Tests for the HandleCache class."""
+
+from typesense.api_call import ApiCall
+from typesense.collections import Collections
+from typesense.configuration import ConfigDict, Configuration
+from typesense.documents import Documents
+from typesense.handle_cache import HandleCache
+from typesense.schema_validator import SchemaValidator
+
+
+def test_evicts_least_recently_used() -> None:
+    """Test that the least recently used handle is evicted once full."""
+    cache: HandleCache[str, int] = HandleCache(max_size=2)
+    cache["a"] = 1
+    cache["b"] = 2
+
+    assert cache["a"] == 1
+    cache["c"] = 3
+
+    assert list(cache) == ["a", "c"]
+
+
+def test_get_or_create_creates_each_handle_once() -> None:
+    """Test that a handle is only created for keys missing from the cache."""
+    cache: HandleCache[str, object] = HandleCache(max_size=2)
+    created = []
+
+    def create_handle() -> object:
+        created.append(object())
+        return created[-1]
+
+    handle = cache.get_or_create("a", create_handle)
+
+    assert cache.get_or_create("a", create_handle) is handle
+    assert created == [handle]
+
+
+def test_get_or_create_returns_evicted_handle() -> None:
+    """Test that a handle evicted as soon as it is stored is still returned."""
+    cache: HandleCache[str, int] = HandleCache(max_size=0)
+
+    assert cache.get_or_create("a", lambda: 1) == 1
+    assert "a" not in cache
+
+
+def test_pinned_handles_are_not_evicted() -> None:
+    """Test that pinned handles are kept while unpinned ones are evicted."""
+    cache: HandleCache[str, int] = HandleCache(
+        max_size=2,
+        is_pinned=lambda handle: handle < 0,
+    )
+    cache["pinned"] = -1
+    for handle in range(5):
+        cache[str(handle)] = handle
+
+    assert sorted(cache) == ["4", "pinned"]
+
+
+def test_collections_with_a_validator_are_not_evicted(
+    fake_config_dict: ConfigDict,
+) -> None:
+    """Test that a collection holding a validator survives eviction."""
+    fake_config_dict["handle_cache_size"] = 2
+    collections: Collections = Collections(ApiCall(Configuration(fake_config_dict)))
+    validated = collections["companies"]
+    validated.documents.validator = SchemaValidator(
+        {"name": "companies", "fields": []},
+    )
+
+    for collection_index in range(10):
+        collections[f"collection_{collection_index}"]
+
+    assert collections["companies"] is validated
+    assert len(collections.collections) == 2
+
+
+def test_documents_cache_stays_bounded(fake_config_dict: ConfigDict) -> None:
+    """Test that accessing many ids keeps the number of cached handles bounded."""
+    fake_config_dict["handle_cache_size"] = 10
+    documents: Documents = Documents(
+        ApiCall(Configuration(fake_config_dict)),
+        "companies",
+    )
+
+    hot_document = documents["hot"]
+    for document_id in range(100):
+        documents[str(document_id)]
+        assert documents["hot"] is hot_document
+
+    assert len(documents.documents) == 10
+    assert "0" not in documents.documents
@@ -0,0 +1,99 @@
+"""Tests for the gathering of search hits into columnar arrays."""
+
+import pytest
+
+from typesense.exceptions import RequestMalformed
+from typesense.hit_columns import hit_columns
+
+_SEARCH_RESULTS = [
+    {
+        "hits": [
+            {
+                "document": {"id": "0", "company_name": "A", "num_employees": 5},
+                "text_match": 578730123365187705,
+                "vector_distance": 0.25,
+            },
+            {
+                "document": {"id": "1", "company_name": "B"},
+                "text_match": 100,
+            },
+        ],
+    },
+    {
+        "grouped_hits": [
+            {
+                "group_key": ["C"],
+                "hits": [
+                    {
+                        "document": {"id": "2", "num_employees": 7},
+                        "vector_distance": 0.5,
+                    },
+                ],
+            },
+        ],
+    },
+]
+
+
+def test_hit_columns_search_error() -> None:
+    """Test that a failed search raises its error before any column is built."""
+    with pytest.raises(RequestMalformed):
+        hit_columns([{"hits": []}, {"error": "Bad query.", "code": 400}])
+
+
+def test_hit_columns_numpy() -> None:
+    """Test that the hits of searches are gathered into NumPy arrays."""
+    numpy = pytest.importorskip("numpy")
+
+    columns = hit_columns(
+        _SEARCH_RESULTS,
+        ["company_name", "num_employees", "id"],
+        search_index=True,
+    )
+
+    assert list(columns) == [
+        "id",
+        "search_index",
+        "text_match",
+        "vector_distance",
+        "company_name",
+        "num_employees",
+    ]
+    assert columns["id"].tolist() == ["0", "1", "2"]
+    assert columns["search_index"].tolist() == [0, 0, 1]
+    assert columns["text_match"].tolist() == [578730123365187705, 100, 0]
+    assert columns["vector_distance"][[0, 2]].tolist() == [0.25, 0.5]
+    assert numpy.isnan(columns["vector_distance"][1])
+    assert columns["company_name"].tolist() == ["A", "B", None]
+    assert columns["num_employees"].tolist() == [5, None, 7]
+
+
+def test_hit_columns_field_name_clash() -> None:
+    """Test that fields named like the hit columns do not replace them."""
+    numpy = pytest.importorskip("numpy")
+
+    columns = hit_columns(_SEARCH_RESULTS[:1], ["text_match"], search_index=False)
+
+    assert list(columns) == ["id", "text_match", "vector_distance"]
+    assert columns["text_match"].dtype == numpy.uint64
+
+
+def test_hit_columns_arrow() -> None:
+    """Test that the hits of searches are gathered into an Arrow table."""
+    pyarrow = pytest.importorskip("pyarrow")
+
+    table = hit_columns(_SEARCH_RESULTS, ["company_name"], column_format="arrow")
+
+    assert table.column_names == [
+        "id",
+        "text_match",
+        "vector_distance",
+        "company_name",
+    ]
+    assert table.schema.field("text_match").type == pyarrow.uint64()
+    assert table.to_pydict() == {
+        "id": ["0", "1", "2"],
+        "text_match": [578730123365187705, 100, None],
+        "vector_distance": [0.25, None, 0.5],
+        "company_name": ["A", "B", None],
+    }
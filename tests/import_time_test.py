@@ -0,0 +1,67 @@
+"""Benchmarks for the import time and construction cost of the typesense package."""
+
+import os
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+
+from typesense.client import Client
+from typesense.configuration import ConfigDict
+
+_SRC_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+_IMPORT_TIME_BUDGET_US = 500_000
+
+
+def _run_python(code: str) -> subprocess.CompletedProcess[str]:
+    """Run a snippet in a fresh interpreter with `-X importtime` enabled."""
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": _SRC_PATH},
+        text=True,
+    )
+
+
+def test_import_does_not_load_resources() -> None:
+    """Test that importing typesense does not pull in requests or resource modules."""
+    completed = _run_python(
+        "import sys, typesense; "
+        + "print(sorted(m for m in ('requests', 'typesense.api_call', "
+        + "'typesense.collections', 'typesense.documents') if m in sys.modules))",
+    )
+
+    assert completed.stdout.strip() == "[]"
+
+
+@pytest.mark.benchmark
+def test_import_time_budget() -> None:
+    """Track the cumulative import time of the typesense package."""
+    completed = _run_python("import typesense")
+
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in completed.stderr.splitlines()
+        if line.split("|")[-1].strip() == "typesense"
+    )
+    sys.stdout.write(f"typesense import time: {cumulative_us} us\n")
+
+    assert cumulative_us < _IMPORT_TIME_BUDGET_US
+
+
+@pytest.mark.parametrize(
+    "attribute",
+    ["collections", "multi_search", "keys", "aliases", "operations", "debug"],
+)
+def test_resources_are_constructed_lazily(
+    fake_config_dict: ConfigDict,
+    attribute: str,
+) -> None:
+    """Test that resources are only constructed on first access and then reused."""
+    client = Client(fake_config_dict)
+
+    assert attribute not in vars(client)
+    resource = getattr(client, attribute)
+    assert getattr(client, attribute) is resource
+    assert resource.api_call is client.api_call
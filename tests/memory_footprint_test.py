@@ -0,0 +1,79 @@
+"""Benchmarks for the memory footprint of nodes and resource handles."""
+
+import sys
+import tracemalloc
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+import pytest
+
+from typesense.api_call import ApiCall
+from typesense.collection import Collection
+from typesense.configuration import Configuration, Node
+from typesense.document import Document
+from typesense.override import Override
+from typesense.synonym import Synonym
+
+_HANDLE_COUNT = 10_000
+_HANDLE_BYTES_BUDGET = 100
+
+
+def _allocated_bytes_per_object(factory: typing.Callable[[int], object]) -> float:
+    """Measure the memory allocated per object created by the factory."""
+    tracemalloc.start()
+    snapshot_start = tracemalloc.take_snapshot()
+    created_objects = [factory(object_index) for object_index in range(_HANDLE_COUNT)]
+    snapshot_end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated_bytes = sum(
+        stat.size_diff for stat in snapshot_end.compare_to(snapshot_start, "filename")
+    )
+    assert len(created_objects) == _HANDLE_COUNT
+    return allocated_bytes / _HANDLE_COUNT
+
+
+@pytest.mark.parametrize(
+    "handle",
+    [
+        Node(host="localhost", port=8108, path="", protocol="http"),
+        Document(typing.cast(ApiCall, None), "companies", "0"),
+        Override(typing.cast(ApiCall, None), "companies", "0"),
+        Synonym(typing.cast(ApiCall, None), "companies", "0"),
+    ],
+)
+def test_handles_have_no_instance_dict(handle: object) -> None:
+    """Test that nodes and resource handles use compact slotted representations."""
+    assert not hasattr(handle, "__dict__")
+
+
+def test_configuration_has_no_instance_dict(fake_config: Configuration) -> None:
+    """Test that the configuration uses a compact slotted representation."""
+    assert not hasattr(fake_config, "__dict__")
+
+
+def test_collection_has_no_instance_dict(fake_api_call: ApiCall) -> None:
+    """Test that collection handles use a compact slotted representation."""
+    assert not hasattr(Collection(fake_api_call, "companies"), "__dict__")
+
+
+@pytest.mark.benchmark
+def test_document_handle_memory(fake_api_call: ApiCall) -> None:
+    """Track the memory allocated per Document handle."""
+    document_ids = [str(document_index) for document_index in range(_HANDLE_COUNT)]
+    bytes_per_handle = _allocated_bytes_per_object(
+        lambda index: Document(fake_api_call, "companies", document_ids[index]),
+    )
+    sys.stdout.write(f"Document handle: {bytes_per_handle:.1f} bytes\n")
+
+    assert bytes_per_handle < _HANDLE_BYTES_BUDGET
+
+
+def test_node_url_is_precomputed() -> None:
+    """Test that the node URL is built once instead of on every call."""
+    node = Node(host="localhost", port=8108, path="/path", protocol="http")
+
+    assert node.url() is node.url()
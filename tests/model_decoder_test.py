@@ -0,0 +1,95 @@
+"""Tests for the ModelDecoder class."""
+
+import pytest
+
+from tests.fixtures.document_fixtures import Companies, Company
+from typesense.exceptions import DocumentDecodeError
+from typesense.model_decoder import ModelDecoder, model_decoder
+
+
+class SlottedCompany:
+    """Slotted company class."""
+
+    __slots__ = ("id", "company_name")
+
+    def __init__(self, id: str, company_name: str) -> None:  # noqa: WPS125
+        """Initialize the company."""
+        self.id = id
+        self.company_name = company_name
+
+
+def test_decode_dataclass() -> None:
+    """Test that documents are decoded into dataclasses, dropping unknown fields."""
+    decoder = ModelDecoder(Company)
+
+    company = decoder.decode(
+        {"id": "0", "company_name": "Company", "num_employees": 10, "extra": True},
+    )
+
+    assert company == Company(id="0", company_name="Company", num_employees=10)
+
+
+def test_decode_slotted_class() -> None:
+    """Test that documents are decoded into slotted classes."""
+    company = ModelDecoder(SlottedCompany).decode({"id": "0", "company_name": "A"})
+
+    assert isinstance(company, SlottedCompany)
+    assert company.company_name == "A"
+
+
+def test_decode_typed_dict_passthrough() -> None:
+    """Test that documents of TypedDict models are returned unchanged."""
+    document = {"id": "0", "company_name": "Company", "num_employees": 10}
+    decoder = ModelDecoder(Companies)
+
+    assert decoder.passthrough
+    assert decoder.decode(document) is document
+
+
+def test_decode_dict_passthrough() -> None:
+    """Test that documents are returned unchanged when there is no model class."""
+    document = {"id": "0"}
+
+    assert ModelDecoder(dict).decode(document) is document
+
+
+def test_decode_missing_required_field() -> None:
+    """Test that documents missing required fields are rejected."""
+    with pytest.raises(DocumentDecodeError, match="missing required fields"):
+        ModelDecoder(Company).decode({"id": "0", "company_name": "Company"})
+
+
+@pytest.mark.parametrize(
+    ("field_name", "field_value"),
+    [("num_employees", "10"), ("num_employees", True), ("rating", "high")],
+)
+def test_decode_invalid_field(field_name: str, field_value: object) -> None:
+    """Test that fields of the wrong type are rejected."""
+    document = {"id": "0", "company_name": "Company", "num_employees": 10}
+    document[field_name] = field_value
+
+    with pytest.raises(DocumentDecodeError, match=f"`{field_name}`"):
+        ModelDecoder(Company).decode(document)
+
+
+def test_decode_int_as_float() -> None:
+    """Test that integers are accepted for float fields."""
+    company = ModelDecoder(Company).decode(
+        {"id": "0", "company_name": "Company", "num_employees": 10, "rating": 4},
+    )
+
+    assert company.rating == 4
+
+
+def test_decode_jsonl() -> None:
+    """Test that JSONL exports are decoded into model instances."""
+    companies = ModelDecoder(SlottedCompany).decode_jsonl(
+        '{"id": "0", "company_name": "A"}\n{"id": "1", "company_name": "B"}\n',
+    )
+
+    assert [company.id for company in companies] == ["0", "1"]
+
+
+def test_model_decoder_is_cached() -> None:
+    """Test that each model gets a single decoder."""
+    assert model_decoder(Company) is model_decoder(Company)
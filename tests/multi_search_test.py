@@ -1,6 +1,7 @@
 """Tests for the MultiSearch class."""
 
 import pytest
+import requests_mock
 
 from tests.fixtures.document_fixtures import Companies
 from tests.utils.object_assertions import (
@@ -29,6 +30,59 @@ def test_init(fake_api_call: ApiCall) -> None:
     )
 
 
+def test_multi_search_raw(fake_api_call: ApiCall) -> None:
+    """Test that the MultiSearch object can return undecoded search results."""
+    multi_search = MultiSearch(fake_api_call)
+
+    with requests_mock.Mocker() as mock:
+        mock.post(
+            "http://nearest:8108/multi_search",
+            content=b'{"results": []}',
+            headers={"Content-Type": "application/json"},
+        )
+
+        response = multi_search.perform(
+            {"searches": [{"q": "com", "collection": "companies"}]},
+            raw=True,
+        )
+
+    assert response == {
+        "content": b'{"results": []}',
+        "content_type": "application/json",
+    }
+
+
+def test_multi_search_columnar(fake_api_call: ApiCall) -> None:
+    """Test that the MultiSearch object can return the hits as columns."""
+    pytest.importorskip("numpy")
+    multi_search = MultiSearch(fake_api_call)
+
+    with requests_mock.Mocker() as mock:
+        mock.post(
+            "http://nearest:8108/multi_search",
+            json={
+                "results": [
+                    {"hits": [{"document": {"id": "0"}, "text_match": 10}]},
+                    {"hits": [{"document": {"id": "1"}, "text_match": 20}]},
+                ],
+            },
+        )
+
+        columns = multi_search.perform(
+            {
+                "searches": [
+                    {"q": "com", "collection": "companies"},
+                    {"q": "inc", "collection": "companies"},
+                ],
+            },
+            columnar="numpy",
+        )
+
+    assert columns["id"].tolist() == ["0", "1"]
+    assert columns["search_index"].tolist() == [0, 1]
+    assert columns["text_match"].tolist() == [10, 20]
+
+
 def test_multi_search_single_search(
     actual_multi_search: MultiSearch,
     actual_api_call: ApiCall,
@@ -63,3 +63,15 @@ def test_node_url() -> None:
     """Test the URL method of the Node class."""
     node = Node(host="localhost", port=8108, path="/path", protocol="http")
     assert node.url() == "http://localhost:8108/path"
+
+
+def test_node_url_follows_address_changes() -> None:
+    """Test that the URL of a node is recomputed when its address changes."""
+    node = Node(host="localhost", port=8108, path="/path", protocol="http")
+
+    node.host = "node0"
+    node.port = 443
+    node.protocol = "https"
+    node.path = ""
+
+    assert node.url() == "https://node0:443"
@@ -1,10 +1,15 @@
 """Tests for the preprocess module."""
 
+import sys
+import timeit
+
 import pytest
 
 from typesense import exceptions
 from typesense.preprocess import (
     ParamSchema,
+    PreparedSearch,
+    SearchCanonicalizer,
     process_param_list,
     stringify,
     stringify_search_params,
@@ -81,3 +86,155 @@ def test_concat_params() -> None:
         "six": "true,false",
         "seven": "one,2,true",
     }
+
+
+def test_prepared_search_bind() -> None:
+    """Test that a prepared search binds variable parameters to its template."""
+    prepared = PreparedSearch({"query_by": ["name", "brand"], "per_page": 20})
+
+    bound_params = prepared.bind(q="shoe", page=2, per_page=50)
+
+    assert bound_params == {
+        "query_by": "name,brand",
+        "per_page": "50",
+        "q": "shoe",
+        "page": "2",
+    }
+    assert prepared.params == {"query_by": "name,brand", "per_page": "20"}
+
+
+def test_prepared_search_validates_template() -> None:
+    """Test that the template of a prepared search is validated once, up front."""
+    with pytest.raises(exceptions.InvalidParameter):
+        PreparedSearch({"query_by": 3.15})  # type: ignore[dict-item]
+
+
+def test_stringified_params_are_passed_through() -> None:
+    """Test that already stringified parameters skip the stringification pass."""
+    bound_params = PreparedSearch({"query_by": "name"}).bind(q="shoe")
+
+    assert bound_params.is_stringified
+    assert stringify_search_params(bound_params) is bound_params
+
+
+@pytest.mark.benchmark
+def test_prepared_search_overhead() -> None:
+    """Track the cost of binding a prepared search against a full stringify pass."""
+    template: ParamSchema = {
+        "query_by": ["name", "brand", "description"],
+        "query_by_weights": [3, 2, 1],
+        "facet_by": ["brand", "category", "color"],
+        "include_fields": ["id", "name", "brand", "price"],
+        "prefix": [True, False, False],
+        "per_page": 20,
+        "num_typos": 2,
+    }
+    prepared = PreparedSearch(template)
+    iterations = 10_000
+
+    stringify_seconds = timeit.timeit(
+        lambda: stringify_search_params({**template, "q": "shoe", "page": 2}),
+        number=iterations,
+    )
+    bind_seconds = timeit.timeit(
+        lambda: stringify_search_params(prepared.bind(q="shoe", page=2)),
+        number=iterations,
+    )
+    sys.stdout.write(
+        f"stringify: {stringify_seconds / iterations * 1_000_000:.2f} us, "
+        + f"prepared: {bind_seconds / iterations * 1_000_000:.2f} us\n",
+    )
+
+    assert bind_seconds < stringify_seconds
+
+
+def test_canonicalize_orders_params_and_unordered_lists() -> None:
+    """Test that parameters and unordered list items are sorted, facets are not."""
+    canonical_params = SearchCanonicalizer().canonicalize(
+        {
+            "q": "shoe",
+            "query_by": "name, brand",
+            "facet_by": "price(cheap:[0, 100], high:[100, 500]), color , brand",
+            "include_fields": "name,id",
+        },
+    )
+
+    assert list(canonical_params.items()) == [
+        ("facet_by", "price(cheap:[0, 100], high:[100, 500]),color,brand"),
+        ("include_fields", "id,name"),
+        ("q", "shoe"),
+        ("query_by", "name,brand"),
+    ]
+
+
+def test_canonicalize_filter_spacing() -> None:
+    """Test that the spacing of filters is collapsed outside of backtick quotes."""
+    canonical_params = SearchCanonicalizer().canonicalize(
+        {"filter_by": " brand:=`Nike  Air`&&  price:[10 , 20]||(rating:>4  )"},
+    )
+
+    assert canonical_params == {
+        "filter_by": "brand:=`Nike  Air` && price:[10,20] || (rating:>4)",
+    }
+
+
+def test_canonicalize_drops_defaults() -> None:
+    """Test that parameters set to their default are dropped unless inherited."""
+    canonicalizer = SearchCanonicalizer()
+
+    assert canonicalizer.canonicalize({"q": "a", "page": "1", "prefix": "true"}) == {
+        "q": "a",
+    }
+    assert canonicalizer.canonicalize(
+        {"q": "a", "per_page": "10"},
+        inherited_params={"per_page"},
+    ) == {"q": "a", "per_page": "10"}
+
+
+def test_canonicalize_keeps_defaults_overriding_a_preset() -> None:
+    """Test that defaults are kept when they may override the values of a preset."""
+    canonicalizer = SearchCanonicalizer()
+
+    assert canonicalizer.canonicalize(
+        {"q": "a", "page": "1", "preset": "listing"},
+    ) == {"page": "1", "preset": "listing", "q": "a"}
+    assert canonicalizer.canonicalize(
+        {"q": "a", "per_page": "10"},
+        inherited_params={"preset"},
+    ) == {"per_page": "10", "q": "a"}
+
+
+def test_canonicalizer_metrics() -> None:
+    """Test that the cardinality of raw and canonical cache keys is reported."""
+    canonicalizer = SearchCanonicalizer()
+
+    canonicalizer.canonicalize({"q": "a", "include_fields": "x,y"}, scope="books")
+    canonicalizer.canonicalize({"include_fields": "y, x", "q": "a"}, scope="books")
+    canonicalizer.canonicalize(
+        {"q": "a", "include_fields": "x,y", "page": "1"},
+        scope="books",
+    )
+    canonicalizer.canonicalize({"q": "a", "include_fields": "x,y"}, scope="authors")
+
+    assert canonicalizer.metrics() == {
+        "searches": 4,
+        "distinct_keys": 4,
+        "distinct_canonical_keys": 2,
+    }
+
+    canonicalizer.reset()
+    assert canonicalizer.metrics()["searches"] == 0
+
+
+def test_canonicalizer_tracks_a_bounded_number_of_keys() -> None:
+    """Test that only the most recently seen cache keys are tracked."""
+    canonicalizer = SearchCanonicalizer(max_tracked_keys=3)
+
+    for query in ("a", "b", "c", "d", "a"):
+        canonicalizer.canonicalize({"q": query})
+
+    assert canonicalizer.metrics() == {
+        "searches": 5,
+        "distinct_keys": 3,
+        "distinct_canonical_keys": 3,
+    }
@@ -0,0 +1,145 @@
+"""Tests for the request lanes."""
+
+import sys
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+import pytest
+import requests_mock
+
+from typesense import api_call as api_call_module
+from typesense.api_call import ApiCall
+from typesense.configuration import ConfigDict, Configuration
+from typesense.exceptions import ConfigError, ServiceUnavailable, Timeout
+from typesense.request_lanes import RequestLane, classify_request
+
+
+@pytest.mark.parametrize(
+    ("method", "endpoint", "expected"),
+    [
+        ("POST", "/collections/companies/documents/import", "bulk"),
+        ("GET", "/collections/companies/documents/export", "bulk"),
+        ("DELETE", "/collections/companies/documents/", "bulk"),
+        ("PATCH", "/collections/companies/documents/", "bulk"),
+        ("POST", "/collections/companies/documents/", "interactive"),
+        ("GET", "/collections/companies/documents/search", "interactive"),
+        ("GET", "/collections/companies/documents/0", "interactive"),
+        ("POST", "/multi_search", "interactive"),
+        ("GET", "/collections", "admin"),
+        ("POST", "/keys", "admin"),
+    ],
+)
+def test_classify_request(method: str, endpoint: str, expected: str) -> None:
+    """Test that requests are classified by method and endpoint."""
+    assert classify_request(method, endpoint) == expected
+
+
+def test_lane_from_config() -> None:
+    """Test that a lane is created from its configuration entry."""
+    lane = RequestLane.from_config({"max_concurrent_requests": 2}, 3.0)
+
+    assert lane.connection_timeout_seconds == 3.0
+    assert lane.max_concurrent_requests == 2
+
+
+def test_lane_slot_caps_in_flight_requests() -> None:
+    """Test that a lane only allows the configured number of in-flight requests."""
+    lane = RequestLane(connection_timeout_seconds=1, max_concurrent_requests=1)
+
+    with lane.slot():
+        assert not lane._semaphore.acquire(blocking=False)  # noqa: WPS437
+
+    assert lane._semaphore.acquire(blocking=False)  # noqa: WPS437
+
+
+def test_api_call_uses_lane(fake_config_dict: ConfigDict) -> None:
+    """Test that requests go through the lane of their class."""
+    fake_config_dict["request_classes"] = {
+        "bulk": {"connection_timeout_seconds": 30, "pool_maxsize": 2},
+        "interactive": {"connection_timeout_seconds": 0.5},
+    }
+    api_call = ApiCall(Configuration(fake_config_dict))
+
+    assert api_call._session("bulk") is api_call.request_lanes["bulk"].session
+    assert api_call._session("admin") is api_call_module.session
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.post(
+            "http://nearest:8108/collections/companies/documents/import",
+            text="{}",
+        )
+        request_mocker.get(
+            "http://nearest:8108/collections/companies/documents/search",
+            json={"hits": []},
+        )
+
+        api_call.post(
+            "/collections/companies/documents/import",
+            entity_type=str,
+            as_json=False,
+            body="{}",
+        )
+        api_call.get(
+            "/collections/companies/documents/search",
+            entity_type=typing.Dict[str, str],
+        )
+
+        assert request_mocker.request_history[0].timeout == 30
+        assert request_mocker.request_history[1].timeout == 0.5
+
+
+def test_deadline_bounds_lane_queue(fake_config_dict: ConfigDict) -> None:
+    """Test that a request of a saturated lane fails once its deadline expires."""
+    fake_config_dict["request_classes"] = {
+        "interactive": {"max_concurrent_requests": 1},
+    }
+    api_call = ApiCall(Configuration(fake_config_dict))
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.get(requests_mock.ANY, json={"hits": []})
+
+        with api_call.request_lanes["interactive"].slot():
+            with pytest.raises(Timeout, match="Request deadline exceeded"):
+                api_call.get(
+                    "/collections/companies/documents/search",
+                    entity_type=typing.Dict[str, str],
+                    deadline_seconds=0.05,
+                )
+
+        assert request_mocker.call_count == 0
+
+
+def test_lanes_have_their_own_concurrency_limiters(
+    fake_config_dict: ConfigDict,
+) -> None:
+    """Test that overload in one lane does not shrink the limit of another."""
+    fake_config_dict["request_classes"] = {"bulk": {}, "interactive": {}}
+    fake_config_dict["adaptive_concurrency"] = {"initial_limit": 8}
+    api_call = ApiCall(Configuration(fake_config_dict))
+
+    with requests_mock.mock() as request_mocker:
+        request_mocker.post(requests_mock.ANY, status_code=503)
+
+        with pytest.raises(ServiceUnavailable):
+            api_call.post(
+                "/collections/companies/documents/import",
+                entity_type=str,
+                as_json=False,
+                body="{}",
+            )
+
+    assert api_call.lane_concurrency_limiters["bulk"].limit == 1
+    assert api_call.lane_concurrency_limiters["interactive"].limit == 8
+    assert api_call.concurrency_limiter is not None
+    assert api_call.concurrency_limiter.limit == 8
+
+
+def test_unknown_request_class(fake_config_dict: ConfigDict) -> None:
+    """Test that unknown request classes are rejected."""
+    fake_config_dict["request_classes"] = {"background": {}}
+
+    with pytest.raises(ConfigError, match="Unknown request classes: background."):
+        Configuration(fake_config_dict)
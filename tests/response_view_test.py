@@ -0,0 +1,114 @@
+"""Tests for the typed response views."""
+
+import sys
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+from tests.fixtures.document_fixtures import Companies
+from typesense.response_view import ResponseView, ViewList, as_view, view_type
+from typesense.types.document import SearchResponse
+from typesense.types.multi_search import MultiSearchResponse
+
+_SEARCH_RESPONSE = {
+    "found": 1,
+    "out_of": 1,
+    "page": 1,
+    "search_time_ms": 0,
+    "facet_counts": [
+        {
+            "field_name": "num_employees",
+            "counts": [{"count": 1, "value": "10", "highlighted": "10"}],
+            "stats": {"min": 10, "max": 10},
+        },
+    ],
+    "hits": [
+        {
+            "document": {"id": "0", "company_name": "Company", "num_employees": 10},
+            "highlight": {"company_name": {"snippet": "<mark>Com</mark>pany"}},
+            "highlights": [{"field": "company_name", "snippet": "<mark>Com</mark>pany"}],
+            "text_match": 578730123365187705,
+        },
+    ],
+}
+
+
+class _RecordingList(typing.List[typing.Any]):
+    """A list recording which indexes were read."""
+
+    def __init__(self, items: typing.Iterable[typing.Any]) -> None:
+        super().__init__(items)
+        self.read_indexes: typing.List[int] = []
+
+    def __getitem__(self, index: typing.Any) -> typing.Any:
+        self.read_indexes.append(index)
+        return super().__getitem__(index)
+
+
+def test_fields_are_attributes() -> None:
+    """Test that the fields of the TypedDict are exposed as attributes."""
+    response = as_view(SearchResponse, _SEARCH_RESPONSE)
+
+    assert response.found == 1
+    assert response.hits[0].text_match == 578730123365187705
+    assert response.hits[0].highlight["company_name"].snippet == "<mark>Com</mark>pany"
+    assert response.hits[0].highlights[0].field == "company_name"
+    assert response.facet_counts[0].counts[0].value == "10"
+    assert response.facet_counts[0].stats.max == 10
+
+
+def test_missing_fields_are_none() -> None:
+    """Test that missing optional fields read as None."""
+    response = as_view(SearchResponse, _SEARCH_RESPONSE)
+
+    assert response.grouped_hits is None
+    assert response.hits[0].text_match_info is None
+
+
+def test_documents_without_model_are_dicts() -> None:
+    """Test that documents are left as dictionaries without a model."""
+    response = as_view(SearchResponse, _SEARCH_RESPONSE)
+
+    assert response.hits[0].document == _SEARCH_RESPONSE["hits"][0]["document"]
+    assert isinstance(response.hits[0].document, dict)
+
+
+def test_documents_with_model_are_views() -> None:
+    """Test that documents are wrapped in views of the document model."""
+    response = as_view(SearchResponse, _SEARCH_RESPONSE, Companies)
+    document = response.hits[0].document
+
+    assert isinstance(document, ResponseView)
+    assert document.company_name == "Company"
+    assert document["num_employees"] == 10
+    assert document.to_dict() is _SEARCH_RESPONSE["hits"][0]["document"]
+
+
+def test_hits_are_wrapped_lazily() -> None:
+    """Test that only the hits that are read get wrapped."""
+    hits = _RecordingList([{"document": {"id": str(index)}} for index in range(100)])
+    response = as_view(SearchResponse, {"found": 100, "hits": hits})
+
+    assert isinstance(response.hits, ViewList)
+    assert len(response.hits) == 100
+    assert response.hits[42].document["id"] == "42"
+    assert hits.read_indexes == [42]
+
+
+def test_view_types_are_cached_and_slotted() -> None:
+    """Test that view classes are generated once and carry no instance dict."""
+    response = as_view(SearchResponse, _SEARCH_RESPONSE)
+
+    assert view_type(SearchResponse) is type(response)
+    assert not hasattr(response, "__dict__")
+    assert not hasattr(response.hits[0], "__dict__")
+
+
+def test_multi_search_view() -> None:
+    """Test that multi-search results are wrapped in search response views."""
+    response = as_view(MultiSearchResponse, {"results": [_SEARCH_RESPONSE]})
+
+    assert response.results[0].hits[0].document["id"] == "0"
+    assert response == {"results": [_SEARCH_RESPONSE]}
@@ -0,0 +1,206 @@
+"""Tests for the SchemaValidator class."""
+
+import json
+import sys
+import time
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+import pytest
+
+from typesense.schema_validator import SchemaValidator
+from typesense.types.collection import CollectionCreateSchema
+
+_SCHEMA: CollectionCreateSchema = {
+    "name": "companies",
+    "fields": [
+        {"name": "company_name", "type": "string"},
+        {"name": "num_employees", "type": "int32"},
+        {"name": "rating", "type": "float", "optional": True},
+        {"name": "tags", "type": "string[]", "optional": True},
+        {"name": "location", "type": "geopoint", "optional": True},
+        {"name": "embedding", "type": "float[]", "num_dim": 3, "optional": True},
+        {"name": ".*_facet", "type": "auto"},
+        {"name": "address.city", "type": "string"},
+    ],
+}
+
+_VALID_DOCUMENT: typing.Dict[str, typing.Any] = {
+    "id": "0",
+    "company_name": "Typesense",
+    "num_employees": 10,
+    "rating": 4,
+    "tags": ["search"],
+    "location": [48.85, 2.35],
+    "embedding": [0.1, 0.2, 0.3],
+    "unknown": object(),
+}
+
+
+def test_accepts_valid_documents() -> None:
+    """Test that valid documents are returned unchanged."""
+    validator = SchemaValidator(_SCHEMA)
+
+    valid_document, error = validator.validate(_VALID_DOCUMENT)
+
+    assert valid_document is _VALID_DOCUMENT
+    assert error is None
+
+
+@pytest.mark.parametrize(
+    ("field_changes", "expected_error"),
+    [
+        (
+            {"num_employees": None},
+            "Field `num_employees` has been declared in the schema, "
+            + "but is not found in the document.",
+        ),
+        ({"num_employees": "10"}, "Field `num_employees` must be an int32."),
+        ({"num_employees": 2**31}, "Field `num_employees` must be an int32."),
+        ({"num_employees": True}, "Field `num_employees` must be an int32."),
+        ({"tags": "search"}, "Field `tags` must be an array of strings."),
+        ({"location": [48.85]}, "Field `location` must be a geopoint."),
+        (
+            {"embedding": [0.1, 0.2]},
+            "Field `embedding` must be an array of 3 floats.",
+        ),
+        ({"id": 0}, "Field `id` must be a string."),
+    ],
+)
+def test_rejects_invalid_documents(
+    field_changes: typing.Dict[str, typing.Any],
+    expected_error: str,
+) -> None:
+    """Test that invalid documents are rejected with the reason."""
+    validator = SchemaValidator(_SCHEMA, dirty_values="reject")
+
+    valid_document, error = validator.validate({**_VALID_DOCUMENT, **field_changes})
+
+    assert valid_document is None
+    assert error == expected_error
+
+
+def test_coerces_by_default() -> None:
+    """Test that values are coerced or rejected by default, like on the server."""
+    validator = SchemaValidator(_SCHEMA)
+
+    assert validator.validate({**_VALID_DOCUMENT, "num_employees": "10"})[0] == {
+        **_VALID_DOCUMENT,
+        "num_employees": 10,
+    }
+    assert validator.validate(
+        {**_VALID_DOCUMENT, "num_employees": "10"},
+        dirty_values="reject",
+    ) == (None, "Field `num_employees` must be an int32.")
+
+
+def test_partial_documents_are_checked_for_their_fields() -> None:
+    """Test that partial documents are only checked for the fields they hold."""
+    validator = SchemaValidator(_SCHEMA)
+
+    assert validator.validate({"id": "0", "rating": 5}, partial=True) == (
+        {"id": "0", "rating": 5},
+        None,
+    )
+    assert validator.validate({"id": "0", "rating": "high"}, partial=True) == (
+        None,
+        "Field `rating` must be a float.",
+    )
+    assert validator.validate({"id": "0", "rating": 5})[0] is None
+
+
+def test_accepts_numpy_values() -> None:
+    """Test that NumPy arrays and scalars are checked by their dtype and shape."""
+    numpy = pytest.importorskip("numpy")
+    validator = SchemaValidator(_SCHEMA, dirty_values="reject")
+    document = {
+        **_VALID_DOCUMENT,
+        "num_employees": numpy.int64(10),
+        "rating": numpy.float32(4.5),
+        "embedding": numpy.array([0.1, 0.2, 0.3], dtype=numpy.float32),
+    }
+
+    assert validator.validate(document) == (document, None)
+    for invalid_changes in (
+        {"num_employees": numpy.int64(2**31)},
+        {"num_employees": numpy.float64(10)},
+        {"embedding": numpy.zeros(2)},
+        {"embedding": numpy.zeros((3, 1))},
+        {"embedding": numpy.array(["a", "b", "c"])},
+    ):
+        assert validator.validate({**document, **invalid_changes})[0] is None
+
+
+def test_coerce_or_drop() -> None:
+    """Test that invalid values are coerced, or dropped from optional fields."""
+    validator = SchemaValidator(_SCHEMA, dirty_values="coerce_or_drop")
+    document = {**_VALID_DOCUMENT, "num_employees": "10", "rating": "high"}
+
+    valid_document, error = validator.validate(document)
+
+    assert error is None
+    assert valid_document is not None
+    assert valid_document["num_employees"] == 10
+    assert "rating" not in valid_document
+    assert document["num_employees"] == "10"
+
+
+def test_coerce_or_reject() -> None:
+    """Test that values that cannot be coerced reject the document."""
+    validator = SchemaValidator(_SCHEMA, dirty_values="coerce_or_reject")
+
+    assert validator.validate({**_VALID_DOCUMENT, "tags": [1, True]})[0] == {
+        **_VALID_DOCUMENT,
+        "tags": ["1", "true"],
+    }
+    assert validator.validate({**_VALID_DOCUMENT, "rating": "high"})[0] is None
+
+
+def test_drop_keeps_required_fields() -> None:
+    """Test that invalid values of required fields reject the document when dropping."""
+    validator = SchemaValidator(_SCHEMA, dirty_values="drop")
+
+    assert validator.validate({**_VALID_DOCUMENT, "rating": "4"})[0] == {
+        key: field_value
+        for key, field_value in _VALID_DOCUMENT.items()
+        if key != "rating"
+    }
+    assert validator.validate({**_VALID_DOCUMENT, "num_employees": "10"})[0] is None
+
+
+def test_partition() -> None:
+    """Test that documents are split into valid ones and positioned failures."""
+    validator = SchemaValidator(_SCHEMA)
+    invalid_document = {"id": "1", "company_name": ["A"], "num_employees": 1}
+
+    valid_documents, failures = validator.partition(
+        [_VALID_DOCUMENT, invalid_document, _VALID_DOCUMENT],
+    )
+
+    assert valid_documents == [_VALID_DOCUMENT, _VALID_DOCUMENT]
+    assert failures == {
+        1: {
+            "success": False,
+            "error": "Field `company_name` must be a string.",
+            "code": 400,
+            "document": json.dumps(invalid_document),
+        },
+    }
+
+
+@pytest.mark.benchmark
+def test_validation_benchmark() -> None:
+    """Track the time spent validating a document."""
+    validator = SchemaValidator(_SCHEMA)
+    documents = [_VALID_DOCUMENT] * 10_000
+
+    start = time.perf_counter()
+    valid_documents, _ = validator.partition(documents)
+    per_document_us = (time.perf_counter() - start) / len(documents) * 1_000_000
+    sys.stdout.write(f"Validation: {per_document_us:.2f} us per document\n")
+
+    assert len(valid_documents) == len(documents)
+    assert per_document_us < 50
@@ -0,0 +1,221 @@
+"""Tests for the serialization of documents and request bodies."""
+
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+
+if sys.version_info >= (3, 11):
+    import typing
+else:
+    import typing_extensions as typing
+
+import pytest
+import requests_mock
+
+from typesense.documents import Documents
+from typesense.serialization import dumps, dumps_table, vector_queries, vector_query
+
+_SRC_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+
+def test_dumps_without_numpy() -> None:
+    """Test that bodies without NumPy values are serialized like the stdlib does."""
+    document = {"id": "0", "embedding": [0.1, 0.2], "nested": {"rating": 4.5}}
+
+    assert dumps(document) == json.dumps(document)
+    assert dumps([document]) == json.dumps([document])
+
+
+def test_dumps_rejects_unknown_values() -> None:
+    """Test that values the JSON encoder does not know still raise a TypeError."""
+    with pytest.raises(TypeError):
+        dumps({"id": "0", "tags": {"search"}})
+
+
+def test_serialization_does_not_import_numpy() -> None:
+    """Test that serializing without NumPy values never imports NumPy."""
+    completed = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import sys; from typesense.serialization import dumps; "
+            + "dumps({'id': '0'}); print('numpy' in sys.modules)",
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": _SRC_PATH},
+        text=True,
+    )
+
+    assert completed.stdout.strip() == "False"
+
+
+def test_vector_query() -> None:
+    """Test that vector queries are built from sequences and options."""
+    assert (
+        vector_query("embedding", [0.25, 1], k=10, flat_search_cutoff=20)
+        == "embedding:([0.25,1.0], k:10, flat_search_cutoff:20)"
+    )
+
+
+def test_dumps_numpy_arrays() -> None:
+    """Test that NumPy arrays and scalars are serialized with vectorized formatting."""
+    numpy = pytest.importorskip("numpy")
+    document = {
+        "id": "0",
+        "embedding": numpy.array([0.1, 0.25, 1 / 3], dtype=numpy.float32),
+        "counts": numpy.arange(3),
+        "matrix": numpy.eye(2),
+        "rating": numpy.float32(4.5),
+        "num_employees": numpy.int64(10),
+    }
+
+    assert json.loads(dumps(document)) == {
+        "id": "0",
+        "embedding": [0.1, 0.25, 0.33333334],
+        "counts": [0, 1, 2],
+        "matrix": [[1.0, 0.0], [0.0, 1.0]],
+        "rating": 4.5,
+        "num_employees": 10,
+    }
+    assert json.loads(dumps(document, float_precision=2))["embedding"] == [
+        0.1,
+        0.25,
+        0.33,
+    ]
+    assert dumps({"embedding": numpy.array([0.5])}) == '{"embedding":[0.5]}'
+
+
+def test_vector_query_numpy() -> None:
+    """Test that vector queries are built from NumPy arrays."""
+    numpy = pytest.importorskip("numpy")
+
+    assert (
+        vector_query("embedding", numpy.array([0.123, 0.5]), float_precision=2, k=5)
+        == "embedding:([0.12,0.5], k:5)"
+    )
+
+
+def test_import_numpy_documents(fake_documents: Documents) -> None:
+    """Test that documents holding NumPy arrays can be imported."""
+    numpy = pytest.importorskip("numpy")
+
+    with requests_mock.Mocker() as mock:
+        mock.post(
+            "http://nearest:8108/collections/companies/documents/import",
+            text='{"success": true}',
+        )
+
+        fake_documents.import_([{"id": "0", "embedding": numpy.array([0.5, 1.5])}])
+
+        assert json.loads(mock.last_request.text) == {
+            "id": "0",
+            "embedding": [0.5, 1.5],
+        }
+
+
+def test_vector_queries() -> None:
+    """Test that the vector queries of many vectors are built in order."""
+    assert vector_queries("embedding", [[0.25, 1], [2, 0.5]], k=3) == [
+        "embedding:([0.25,1.0], k:3)",
+        "embedding:([2.0,0.5], k:3)",
+    ]
+    assert vector_queries("embedding", []) == []
+
+
+def test_vector_queries_numpy() -> None:
+    """Test that the vector queries of a NumPy matrix are built in one pass."""
+    numpy = pytest.importorskip("numpy")
+
+    assert vector_queries(
+        "embedding",
+        numpy.array([[0.123, 0.5], [1, 2]]),
+        float_precision=2,
+    ) == ["embedding:([0.12,0.5])", "embedding:([1.0,2.0])"]
+
+
+def test_vector_queries_rejects_one_dimensional_arrays() -> None:
+    """Test that a single NumPy vector is not split into one query per value."""
+    numpy = pytest.importorskip("numpy")
+
+    with pytest.raises(ValueError, match="two-dimensional"):
+        vector_queries("embedding", numpy.array([0.1, 0.2]))
+
+
+def test_numpy_non_finite_floats_are_rejected() -> None:
+    """Test that NaN and infinite floats of NumPy arrays are rejected, like json."""
+    numpy = pytest.importorskip("numpy")
+
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        dumps({"embedding": numpy.array([0.5, numpy.nan])})
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        vector_query("embedding", numpy.array([numpy.inf, 0.5]))
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        vector_queries("embedding", numpy.array([[0.5, 1], [-numpy.inf, 2]]))
+
+
+def test_dumps_table_pandas() -> None:
+    """Test that the rows of a DataFrame are serialized to JSONL by batch."""
+    numpy = pytest.importorskip("numpy")
+    pandas = pytest.importorskip("pandas")
+    frame = pandas.DataFrame(
+        {
+            "id": ["0", "1", "2"],
+            "num_employees": pandas.array([10, None, 30], dtype="Int64"),
+            "rating": [4.5, numpy.nan, 1 / 3],
+            "embedding": [numpy.array([0.5, 1.5]), None, numpy.array([2.0, 0.25])],
+            "tags": [["search"], ["db"], []],
+        },
+    )
+
+    assert list(dumps_table(frame, batch_rows=2, float_precision=2)) == [
+        '{"id":"0","num_employees":10,"rating":4.5,"embedding":[0.5,1.5],'
+        + '"tags":["search"]}\n{"id":"1","tags":["db"]}',
+        '{"id":"2","num_employees":30,"rating":0.33,"embedding":[2.0,0.25],'
+        + '"tags":[]}',
+    ]
+
+
+def test_dumps_table_arrow() -> None:
+    """Test that the rows of an Arrow table are serialized to JSONL by batch."""
+    pyarrow = pytest.importorskip("pyarrow")
+    table = pyarrow.table(
+        {
+            "id": ["0", "1", "2"],
+            "num_employees": pyarrow.array([10, None, 30]),
+            "is_public": [True, False, None],
+            "embedding": pyarrow.array(
+                [[0.5, 1.5], None, [2, 0.25]],
+                type=pyarrow.list_(pyarrow.float32()),
+            ),
+        },
+    )
+
+    assert list(dumps_table(table.slice(1), batch_rows=2)) == [
+        '{"id":"1","is_public":false}\n'
+        + '{"id":"2","num_employees":30,"embedding":[2.0,0.25]}',
+    ]
+    assert list(dumps_table(table.to_batches()[0], batch_rows=5))[0].startswith(
+        '{"id":"0","num_employees":10,"is_public":true,"embedding":[0.5,1.5]}\n',
+    )
+
+
+@pytest.mark.parametrize("element", [float("nan"), float("inf"), None])
+def test_dumps_table_arrow_rejects_invalid_list_elements(
+    element: typing.Union[float, None],
+) -> None:
+    """Test that NaN, infinite or null elements of an embedding list are rejected."""
+    pyarrow = pytest.importorskip("pyarrow")
+    table = pyarrow.table(
+        {
+            "id": ["a"],
+            "embedding": pyarrow.array(
+                [[1.0, element]],
+                type=pyarrow.list_(pyarrow.float32()),
+            ),
+        },
+    )
+
+    with pytest.raises(ValueError):
+        list(dumps_table(table))
@@ -20,7 +20,8 @@ def obj_to_dict(
     """
     Convert an object to a dictionary.
 
-    If the object is already a dictionary, return it as is.
+    If the object is already a dictionary, return it as is. Objects using
+    `__slots__` are converted from their public slots.
 
     Args:
         input_obj: The object to convert.
@@ -28,7 +29,16 @@ def obj_to_dict(
     Returns:
         The object as a dictionary.
     """
-    return input_obj if isinstance(input_obj, typing.Dict) else input_obj.__dict__
+    if isinstance(input_obj, typing.Dict):
+        return input_obj
+    if hasattr(input_obj, "__dict__"):
+        return input_obj.__dict__
+    return {
+        slot_name: getattr(input_obj, slot_name)
+        for obj_class in type(input_obj).__mro__
+        for slot_name in getattr(obj_class, "__slots__", ())
+        if not slot_name.startswith("_") and hasattr(input_obj, slot_name)
+    }
 
 
 def assert_match_object(